@@ -0,0 +1,19 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
+
+
+class ReactTemplatetagsConfig(AppConfig):
+    name = "django_react_templatetags"
+
+    def ready(self):
+        from django_react_templatetags import checks  # noqa: F401
+        from django_react_templatetags import representations
+
+        post_save.connect(
+            representations.invalidate_on_save,
+            dispatch_uid="react_representation_save",
+        )
+        post_delete.connect(
+            representations.invalidate_on_delete,
+            dispatch_uid="react_representation_delete",
+        )
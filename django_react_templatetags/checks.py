@@ -0,0 +1,40 @@
+"""
+This module contains the system checks for settings that only fail once
+the site runs with more than one process.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import Warning, register
+
+PER_PROCESS_CACHES = (DummyCache, LocMemCache)
+
+
+@register()
+def check_props_cache(app_configs, **kwargs):
+    """
+    Props served from a url are fetched in a separate request, which may
+    reach another worker than the one that rendered the page.
+    """
+
+    if not getattr(settings, "REACT_PROPS_URL_MIN_SIZE", None):
+        return []
+
+    alias = getattr(settings, "REACT_PROPS_CACHE_ALIAS", "default")
+    if not isinstance(caches[alias], PER_PROCESS_CACHES):
+        return []
+
+    return [
+        Warning(
+            "REACT_PROPS_URL_MIN_SIZE is set but the '{}' cache is not shared "
+            "between processes.".format(alias),
+            hint=(
+                "Props requests served by another worker get a 404 and the "
+                "component is not rendered. Set REACT_PROPS_CACHE_ALIAS to a "
+                "shared cache such as Redis or Memcached."
+            ),
+            id="django_react_templatetags.W001",
+        )
+    ]
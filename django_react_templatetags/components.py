@@ -0,0 +1,95 @@
+"""
+This module contains the component record that react_render passes on to
+the SSR services and react_print.
+"""
+
+import json
+
+from django.utils.safestring import mark_safe
+
+from django_react_templatetags.encoders import iter_json
+
+# Same escaping as django's json_script filter
+JSON_SCRIPT_ESCAPES = {
+    ord(">"): "\\u003E",
+    ord("<"): "\\u003C",
+    ord("&"): "\\u0026",
+}
+
+# Size of the chunks streamed props are written in
+CHUNK_SIZE = 64 * 1024
+
+
+class ReactComponent(dict):
+    """
+    Props are serialized once into "json", "json_obj" (parsed props) and
+    "json_script" (props escaped for a script tag) are derived from it on
+    first access.
+
+    Components rendered with stream_props keep the props unserialized,
+    consumers that can work in chunks use iter_json instead of reading
+    "json".
+    """
+
+    streaming = False
+
+    def stream_props(self, props, context):
+        self.streaming = True
+        self.props = props
+        self.context = context
+        self.ssr_keys = {}
+
+    def __missing__(self, key):
+        if key == "json" and self.streaming:
+            value = "".join(self.iter_json())
+        elif key == "json" and "json_obj" in self:
+            value = json.dumps(self["json_obj"])
+        elif key == "json_obj":
+            value = json.loads(self["json"])
+        elif key == "json_script":
+            value = mark_safe(self["json"].translate(JSON_SCRIPT_ESCAPES))
+        else:
+            raise KeyError(key)
+
+        self[key] = value
+        return value
+
+    def iter_json(self):
+        """
+        Yields the serialized props, in chunks of about CHUNK_SIZE if the
+        props are streamed.
+        """
+
+        if not self.streaming or "json" in self:
+            yield self["json"]
+            return
+
+        buffer, size = [], 0
+        for chunk in iter_json(self.props, self.context):
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= CHUNK_SIZE:
+                yield "".join(buffer)
+                buffer, size = [], 0
+
+        if buffer:
+            yield "".join(buffer)
+
+
+def as_component(component):
+    """
+    Wraps components added as plain dicts, by a custom tag manager or by
+    appending to REACT_COMPONENTS, so the derived keys are available.
+    """
+
+    if isinstance(component, ReactComponent):
+        return component
+
+    return ReactComponent(component)
+
+
+def iter_component_json(component):
+    if getattr(component, "streaming", False):
+        return component.iter_json()
+
+    return iter([component["json"]])
@@ -1,9 +1,35 @@
+import json
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.query import QuerySet
+from django.utils.module_loading import import_string
 
 from django_react_templatetags.mixins import RepresentationMixin
+from django_react_templatetags.representations import (
+    get_representation,
+    get_representations,
+    resolve_bulk_representations,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+JSON_BACKENDS = {
+    "json": "django_react_templatetags.encoders.json_dumps",
+    "orjson": "django_react_templatetags.encoders.orjson_dumps",
+}
 
 
 def json_encoder_cls_factory(context):
+    """
+    Returns an encoder class bound to context, kept for backwards
+    compatibility. Pass context to ReactRepresentationJSONEncoder instead.
+    """
+
     class ReqReactRepresentationJSONEncoder(ReactRepresentationJSONEncoder):
         context = None
 
@@ -13,14 +39,85 @@ def json_encoder_cls_factory(context):
 
 class ReactRepresentationJSONEncoder(DjangoJSONEncoder):
     """
-    Custom json encoder that adds support for RepresentationMixin
+    Custom json encoder that adds support for RepresentationMixin, the
+    template context is passed on to to_react_representation.
+
+    Example:
+        json.dumps(data, cls=ReactRepresentationJSONEncoder, context=context)
     """
 
+    context = None
+
+    def __init__(self, *args, context=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if context is not None:
+            self.context = context
+
     def default(self, o):
         if isinstance(o, RepresentationMixin):
-            args = [self.context if hasattr(self, "context") else None]
-            args = [x for x in args if x is not None]
+            return get_representation(o, self.context)
+
+        if isinstance(o, QuerySet):
+            if issubclass(o.model, RepresentationMixin):
+                return get_representations(list(o), self.context)
 
-            return o.to_react_representation(*args)
+            return list(o)
 
         return super(ReactRepresentationJSONEncoder, self).default(o)
+
+
+def get_json_backend():
+    """
+    Returns the function used to serialize props, REACT_JSON_BACKEND is
+    either the name of a builtin backend or the path to a function that
+    takes the props and template context and returns a json string.
+    """
+
+    backend = getattr(settings, "REACT_JSON_BACKEND", "json")
+    return import_string(JSON_BACKENDS.get(backend, backend))
+
+
+def json_dumps(data, context=None):
+    data = resolve_bulk_representations(data, context)
+    return json.dumps(data, cls=ReactRepresentationJSONEncoder, context=context)
+
+
+def iter_json(data, context=None):
+    """
+    Yields the json for data in chunks, backends other than json are not
+    incremental and yield it in one piece.
+    """
+
+    backend = get_json_backend()
+    if backend is not json_dumps:
+        yield backend(data, context)
+        return
+
+    data = resolve_bulk_representations(data, context)
+    yield from ReactRepresentationJSONEncoder(context=context).iterencode(data)
+
+
+def orjson_dumps(data, context=None):
+    """
+    Serializes with orjson, everything orjson does not handle natively
+    (RepresentationMixin, lazy strings, Decimal and dates) is passed to
+    ReactRepresentationJSONEncoder so the values match the json backend.
+    Props orjson refuses, such as integers beyond 64 bits, are serialized
+    with the json backend instead.
+    """
+
+    if orjson is None:
+        raise ImproperlyConfigured(
+            "REACT_JSON_BACKEND 'orjson' requires the orjson package"
+        )
+
+    data = resolve_bulk_representations(data, context)
+    encoder = ReactRepresentationJSONEncoder(context=context)
+    try:
+        return orjson.dumps(
+            data,
+            default=encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        ).decode("utf-8")
+    except TypeError:
+        return json.dumps(data, cls=ReactRepresentationJSONEncoder, context=context)
@@ -0,0 +1,169 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+
+from django_react_templatetags.components import ReactComponent
+from django_react_templatetags.encoders import get_json_backend
+from django_react_templatetags.ssr import cache as ssr_cache
+from django_react_templatetags.templatetags.react import load_from_ssr
+
+
+class Command(BaseCommand):
+    help = (
+        "Fills the SSR cache by rendering the components in a manifest, or "
+        "by requesting pages through the django test client."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--manifest",
+            help=(
+                'Path to a json file with "components", a list of '
+                '{"component", "props", "ssr_context", "ssr_cache"} objects, '
+                'and/or "urls", a list of paths.'
+            ),
+        )
+        parser.add_argument(
+            "--url",
+            action="append",
+            default=[],
+            dest="urls",
+            help="Path of a page to request, can be repeated.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Max number of components or pages rendered at once.",
+        )
+        parser.add_argument(
+            "--host",
+            help="Host header used for pages, defaults to the first ALLOWED_HOSTS.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options["verbosity"]
+
+        if not getattr(settings, "REACT_RENDER_HOST", None):
+            raise CommandError("REACT_RENDER_HOST is not set")
+
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be at least 1")
+
+        if not getattr(settings, "REACT_SSR_CACHE_TIMEOUT", None):
+            self.stderr.write(
+                "REACT_SSR_CACHE_TIMEOUT is not set, only components rendered "
+                "with the ssr_cache argument are cached."
+            )
+        if ssr_cache.get_cache() is None:
+            self.stderr.write(
+                "REACT_SSR_CACHE_ALIAS is None, the local cache of this "
+                "process is the only one filled."
+            )
+
+        manifest = self.load_manifest(options["manifest"])
+        jobs = [
+            (self.get_label(entry), self.get_component_job(entry))
+            for entry in manifest.get("components", [])
+        ]
+
+        host = options["host"] or get_default_host()
+        jobs += [
+            (url, self.get_url_job(url, host))
+            for url in manifest.get("urls", []) + options["urls"]
+        ]
+
+        if not jobs:
+            raise CommandError("Nothing to warm up, pass --manifest or --url")
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            results = list(executor.map(self.run_job, jobs))
+
+        failed = len([ok for ok in results if not ok])
+        self.stdout.write(
+            "Warmed up {} of {} in {:.2f}s".format(
+                len(results) - failed, len(results), time.monotonic() - start
+            )
+        )
+
+    def run_job(self, job):
+        label, fn = job
+
+        start = time.monotonic()
+        try:
+            ok = fn()
+        except Exception as e:
+            ok = False
+            self.stderr.write("{} failed: {}".format(label, e))
+
+        if self.verbosity >= 1:
+            self.stdout.write(
+                "{} {} ({:.0f}ms)".format(
+                    "OK" if ok else "FAILED",
+                    label,
+                    (time.monotonic() - start) * 1000,
+                )
+            )
+
+        return ok
+
+    @staticmethod
+    def load_manifest(path):
+        if not path:
+            return {}
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            raise CommandError("Could not read manifest '{}': {}".format(path, e))
+
+    @staticmethod
+    def get_label(entry):
+        return "component {}".format(entry["component"])
+
+    @staticmethod
+    def get_component_job(entry):
+        """
+        Builds the component the same way react_render does, so the cache
+        key matches the one used on requests.
+        """
+
+        name = "{}{}".format(
+            getattr(settings, "REACT_COMPONENT_PREFIX", ""), entry["component"]
+        )
+        component = ReactComponent(
+            identifier=name,
+            data_identifier="{}_data".format(name),
+            name=name,
+            json=get_json_backend()(entry.get("props") or {}, None),
+        )
+        if entry.get("ssr_cache") is not None:
+            component["ssr_cache"] = int(entry["ssr_cache"])
+
+        def render():
+            ssr_resp = load_from_ssr(component, ssr_context=entry.get("ssr_context"))
+            return bool(ssr_resp["html"])
+
+        return render
+
+    @staticmethod
+    def get_url_job(url, host):
+        def request():
+            response = Client(HTTP_HOST=host).get(url)
+            return response.status_code < 400
+
+        return request
+
+
+def get_default_host():
+    for host in settings.ALLOWED_HOSTS:
+        if host != "*":
+            return host.lstrip(".")
+
+    return "localhost"
@@ -0,0 +1,107 @@
+"""
+This module renders the manifest output of react_print, where all
+components on the page are described in one json script and hydrated by
+a single bootstrap script.
+"""
+
+import json
+import uuid
+
+from django.utils.safestring import mark_safe
+
+from django_react_templatetags.components import JSON_SCRIPT_ESCAPES, as_component
+
+BOOTSTRAP_SCRIPT = """(function () {
+    var components = %(components)s;
+    var manifest = JSON.parse(document.getElementById("%(manifest_id)s").textContent);
+    manifest.components.forEach(function (component) {
+        var target = component.hypernova_id
+            ? document.querySelector('div[data-hypernova-id="' + component.hypernova_id + '"]')
+            : document.getElementById(component.id);
+        var render = function (props) {
+            ReactDOM[component.hydrate ? "hydrate" : "render"](
+                React.createElement(components[component.name], props),
+                target
+            );
+        };
+        if (component.url) {
+            fetch(component.url).then(function (response) {
+                if (!response.ok) {
+                    throw new Error("Could not load the props of " + component.name + ": " + response.status);
+                }
+                return response.json();
+            }).then(render).catch(function (error) {
+                console.error(error);
+            });
+        } else {
+            render(manifest.data[component.data]);
+        }
+    });
+})();"""
+
+
+def render_manifest(components, ssr_available=False):
+    """
+    Builds the manifest and bootstrap script directly, without a template.
+    Identical props are stored once in the data list.
+    """
+
+    if not components:
+        return ""
+
+    manifest_id = "react_manifest_{}".format(uuid.uuid4().hex)
+
+    data, data_indexes, entries, names = [], {}, [], {}
+    for component in map(as_component, components):
+        entry = {
+            "id": component["identifier"],
+            "name": component["name"],
+            "hydrate": bool(ssr_available and not component.get("ssr_skipped")),
+        }
+
+        hypernova_id = (component.get("ssr_params") or {}).get("hypernova_id")
+        if ssr_available and hypernova_id:
+            entry["hypernova_id"] = hypernova_id
+
+        entry_json = json.dumps(entry)[:-1]
+        props_url = component.get("props_url")
+        if props_url:
+            entry_json += ', "url": {}}}'.format(json.dumps(props_url))
+        else:
+            index = get_data_index(component, data, data_indexes)
+            entry_json += ', "data": {}}}'.format(index)
+
+        entries.append(entry_json.translate(JSON_SCRIPT_ESCAPES))
+        names[component["name"]] = component["name"]
+
+    manifest = '{{"data": [{}], "components": [{}]}}'.format(
+        ", ".join(data), ", ".join(entries)
+    )
+    component_map = "{{{}}}".format(
+        ", ".join(
+            "{}: {}".format(json.dumps(key), value) for key, value in names.items()
+        )
+    )
+
+    return mark_safe(
+        '<script id="{}" type="application/json">{}</script>\n'
+        "<script>\n{}\n</script>".format(
+            manifest_id,
+            manifest,
+            BOOTSTRAP_SCRIPT
+            % {"components": component_map, "manifest_id": manifest_id},
+        )
+    )
+
+
+def get_data_index(component, data, data_indexes):
+    if getattr(component, "streaming", False):
+        data.append(component["json_script"])
+        return len(data) - 1
+
+    index = data_indexes.get(component["json"])
+    if index is None:
+        data.append(component["json_script"])
+        index = data_indexes[component["json"]] = len(data) - 1
+
+    return index
@@ -0,0 +1,94 @@
+import asyncio
+
+from asgiref.sync import async_to_sync
+
+from django_react_templatetags.ssr.deferred import (
+    attach_deferred_queue,
+    get_deferred_queue,
+)
+
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:  # asgiref < 3.6
+    iscoroutinefunction = asyncio.iscoroutinefunction
+
+    def markcoroutinefunction(func):
+        func._is_coroutine = asyncio.coroutines._is_coroutine
+        return func
+
+
+class ReactSSRMiddleware:
+    """
+    Defers SSR of every react_render tag in a TemplateResponse and renders
+    them in a single batch as soon as the template has been rendered. Under
+    ASGI the batch is rendered with the service's aload_many when available.
+
+    Only TemplateResponse output is deferred, since it is the only content
+    known to pass through the middleware unchanged. Templates rendered in the
+    view, for example for a JsonResponse or an email, render SSR right away.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+
+        attach_deferred_queue(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        attach_deferred_queue(request)
+        return await self.get_response(request)
+
+    def process_template_response(self, request, response):
+        queue = get_deferred_queue(request, active_only=False)
+        if queue is None or response.is_rendered:
+            return response
+
+        queue.active = True
+
+        # The markers are replaced before any other post render callback
+        # runs, so callbacks that store the response, such as the one added
+        # by cache_page, see the final content.
+        response._post_render_callbacks.insert(
+            0, lambda response: self.resolve(queue, response)
+        )
+        return response
+
+    def resolve(self, queue, response):
+        queue.deactivate()
+        if not self.should_resolve(queue, response):
+            return
+
+        if self.is_async:
+            # Rendering runs in a worker thread under ASGI, async_to_sync
+            # awaits the batch on the request's event loop.
+            async_to_sync(queue.aresolve)()
+        else:
+            queue.resolve()
+
+        self.apply_queue(queue, response)
+
+    @staticmethod
+    def should_resolve(queue, response):
+        if not queue.pending or getattr(response, "streaming", False):
+            return False
+
+        return b"<!--react-" in response.content
+
+    @staticmethod
+    def apply_queue(queue, response):
+        charset = response.charset
+        content = queue.apply(response.content.decode(charset))
+        response.content = content.encode(charset)
+
+        if response.has_header("Content-Length"):
+            response["Content-Length"] = str(len(response.content))
@@ -1,3 +1,48 @@
+import weakref
+
+# Classes that use the mixin
+representation_classes = weakref.WeakSet()
+
+# Classes that override to_react_representations
+bulk_representation_classes = weakref.WeakSet()
+
+
 class RepresentationMixin(object):
+    # Set to True if the representation only depends on the object and the
+    # request, it is then computed once per request.
+    react_representation_cacheable = False
+
+    # Seconds to keep the representation of a saved model instance in the
+    # django cache, it is invalidated when the instance is saved or deleted.
+    react_representation_cache_timeout = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        representation_classes.add(cls)
+
+        bulk = cls.to_react_representations.__func__
+        if bulk is not RepresentationMixin.to_react_representations.__func__:
+            bulk_representation_classes.add(cls)
+
     def to_react_representation(self, context=None):
         raise NotImplementedError("Missing property to_react_representation in class")
+
+    @classmethod
+    def to_react_representations(cls, objs, context=None):
+        """
+        Returns the representations of objs in the same order, override to
+        build them in bulk (for example to prefetch related objects once).
+        """
+
+        if context is None:
+            return [obj.to_react_representation() for obj in objs]
+
+        return [obj.to_react_representation(context) for obj in objs]
+
+    def get_react_representation_cache_vary(self, context=None):
+        """
+        Returns the values from context the representation depends on, they
+        are added to the cache key.
+        """
+
+        return None
@@ -0,0 +1,62 @@
+"""
+This module stores large component props in the cache so they can be
+served from the props view, instead of being inlined in the page by
+react_print.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.urls import reverse
+
+KEY_PREFIX = "react_props"
+DEFAULT_TIMEOUT = 60 * 60 * 24
+
+
+def get_cache():
+    return caches[getattr(settings, "REACT_PROPS_CACHE_ALIAS", "default")]
+
+
+def get_timeout():
+    return getattr(settings, "REACT_PROPS_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+
+
+def get_key(digest):
+    return "{}:{}".format(KEY_PREFIX, digest)
+
+
+def should_serve_from_url(json_str, enabled=None):
+    """
+    Props are served from a url if the props_url tag argument is set, or if
+    they are at least REACT_PROPS_URL_MIN_SIZE characters.
+    """
+
+    if enabled is not None:
+        return bool(enabled)
+
+    min_size = getattr(settings, "REACT_PROPS_URL_MIN_SIZE", None)
+    return bool(min_size) and len(json_str) >= min_size
+
+
+def store(json_str):
+    """
+    Stores the props keyed on their hash and returns it, props that are
+    already stored only have their timeout renewed.
+    """
+
+    digest = hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+
+    cache, key, timeout = get_cache(), get_key(digest), get_timeout()
+    if not cache.touch(key, timeout):
+        cache.set(key, json_str, timeout)
+
+    return digest
+
+
+def load(digest):
+    return get_cache().get(get_key(digest))
+
+
+def get_props_url(json_str):
+    return reverse("react:props", kwargs={"digest": store(json_str)})
@@ -0,0 +1,398 @@
+"""
+This module caches RepresentationMixin.to_react_representation, objects
+that declare react_representation_cacheable are only represented once per
+request even if they are passed to several react_render tags. Model
+instances with react_representation_cache_timeout are also kept in the
+django cache between requests.
+"""
+
+import hashlib
+import json
+import uuid
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+
+from django_react_templatetags.mixins import (
+    RepresentationMixin,
+    bulk_representation_classes,
+    representation_classes,
+)
+from django_react_templatetags.ssr.cache import CacheStats
+
+MEMO_ATTR = "_react_representations"
+KEY_PREFIX = "react_representation"
+
+stats = CacheStats("hits", "misses")
+cache_stats = CacheStats("hits", "misses")
+
+MISSING = object()
+
+# Values the bulk scan does not need to look into
+LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+class RepresentationMemo:
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, obj):
+        entry = self.entries.get(get_key(obj))
+        if entry is None:
+            stats.incr("misses")
+            return MISSING
+
+        stats.incr("hits")
+        return entry[1]
+
+    def set(self, obj, representation):
+        # The object is kept alive so id() based keys cannot be reused
+        self.entries[get_key(obj)] = (obj, representation)
+
+    def get_or_set(self, obj, represent):
+        representation = self.get(obj)
+        if representation is MISSING:
+            representation = represent()
+            self.set(obj, representation)
+
+        return representation
+
+
+def get_key(obj):
+    """
+    Model instances are keyed on label and pk, so different instances of
+    the same row share a representation, other objects on identity.
+    """
+
+    meta = getattr(obj, "_meta", None)
+    pk = getattr(obj, "pk", None)
+    if meta is not None and pk is not None:
+        return (meta.label, pk)
+
+    return (None, id(obj))
+
+
+def get_memo(context):
+    """
+    Returns the memo for the request being rendered, or for the context
+    when there is no request.
+    """
+
+    if context is None:
+        return None
+
+    holder = context.get("request", None) or context
+    memo = getattr(holder, MEMO_ATTR, None)
+    if memo is None:
+        memo = RepresentationMemo()
+        try:
+            setattr(holder, MEMO_ATTR, memo)
+        except AttributeError:
+            return None
+
+    return memo
+
+
+def get_representation(obj, context=None):
+    def represent():
+        return get_cached_representation(obj, context)
+
+    if context is None or not obj.react_representation_cacheable:
+        return represent()
+
+    memo = get_memo(context)
+    if memo is None:
+        return represent()
+
+    return memo.get_or_set(obj, represent)
+
+
+def get_representations(objs, context=None):
+    """
+    Represents a list of objects of the same class, the objects not found
+    in the memo or cache are passed to to_react_representations at once.
+    """
+
+    if not objs:
+        return []
+
+    cls = type(objs[0])
+    results = [MISSING] * len(objs)
+
+    memo = None
+    if context is not None and cls.react_representation_cacheable:
+        memo = get_memo(context)
+
+    if memo is not None:
+        results = [memo.get(obj) for obj in objs]
+
+    missing = [index for index, resp in enumerate(results) if resp is MISSING]
+    not_memoized = missing
+
+    cache, cache_keys = None, {}
+    saved = []
+    if is_cached(cls) and getattr(cls, "_meta", None) is not None:
+        saved = [index for index in missing if objs[index].pk is not None]
+
+    if saved:
+        cache = get_cache()
+        keys = get_cache_keys(cache, [objs[index] for index in saved], context)
+        cache_keys = dict(zip(saved, keys))
+        found = cache.get_many(keys)
+
+        for index, key in cache_keys.items():
+            if key in found:
+                cache_stats.incr("hits")
+                results[index] = found[key]
+            else:
+                cache_stats.incr("misses")
+
+        missing = [index for index in missing if results[index] is MISSING]
+
+    if missing:
+        representations = cls.to_react_representations(
+            [objs[index] for index in missing], context
+        )
+        for index, representation in zip(missing, representations):
+            results[index] = representation
+
+        if cache is not None:
+            cache.set_many(
+                {
+                    cache_keys[index]: results[index]
+                    for index in missing
+                    if index in cache_keys
+                },
+                cls.react_representation_cache_timeout,
+            )
+
+    if memo is not None:
+        for index in not_memoized:
+            memo.set(objs[index], results[index])
+
+    return results
+
+
+def resolve_bulk_representations(data, context=None):
+    """
+    Replaces lists of objects that share a class with a bulk
+    to_react_representations hook, or a react_representation_cache_timeout,
+    with their representations. Nothing is done unless such a class exists.
+    """
+
+    if not bulk_representation_classes and not has_cached_classes():
+        return data
+
+    return _resolve_bulk(data, context)
+
+
+def _resolve_bulk(data, context):
+    """
+    Containers are only copied if something inside them was replaced.
+    """
+
+    if isinstance(data, dict):
+        resolved = None
+        for key, value in data.items():
+            if type(value) in LEAF_TYPES:
+                continue
+
+            new_value = _resolve_bulk(value, context)
+            if new_value is not value:
+                if resolved is None:
+                    resolved = dict(data)
+                resolved[key] = new_value
+
+        return data if resolved is None else resolved
+
+    if isinstance(data, (list, tuple)):
+        if is_bulk_list(data):
+            return [
+                _resolve_bulk(value, context)
+                for value in get_representations(list(data), context)
+            ]
+
+        resolved = None
+        for index, value in enumerate(data):
+            if type(value) in LEAF_TYPES:
+                continue
+
+            new_value = _resolve_bulk(value, context)
+            if new_value is not value:
+                if resolved is None:
+                    resolved = list(data)
+                resolved[index] = new_value
+
+        return data if resolved is None else resolved
+
+    return data
+
+
+def is_bulk_list(data):
+    """
+    Lists of cached objects are represented together as well, so their
+    cache entries are read with get_many instead of one by one.
+    """
+
+    if not data:
+        return False
+
+    cls = type(data[0])
+    if cls not in bulk_representation_classes and not is_cached(cls):
+        return False
+
+    return all(type(obj) is cls for obj in data)
+
+
+def has_cached_classes():
+    return any(is_cached(cls) for cls in representation_classes)
+
+
+def get_cached_representation(obj, context=None):
+    """
+    Looks up the representation in the django cache, only saved model
+    instances are cached since invalidation relies on model signals.
+    """
+
+    timeout = obj.react_representation_cache_timeout
+    if not timeout or getattr(obj, "_meta", None) is None or obj.pk is None:
+        return call_to_react_representation(obj, context)
+
+    cache = get_cache()
+    key = get_cache_key(cache, obj, context)
+    representation = cache.get(key)
+    if representation is not None:
+        cache_stats.incr("hits")
+        return representation
+
+    cache_stats.incr("misses")
+    representation = call_to_react_representation(obj, context)
+    cache.set(key, representation, timeout)
+    return representation
+
+
+def call_to_react_representation(obj, context=None):
+    if context is None:
+        return obj.to_react_representation()
+
+    return obj.to_react_representation(context)
+
+
+def get_cache():
+    return caches[getattr(settings, "REACT_REPRESENTATION_CACHE_ALIAS", "default")]
+
+
+def get_cache_key(cache, obj, context=None):
+    """
+    Keys contain a version token for the instance, which is replaced when
+    the instance changes. That invalidates every cached variant at once.
+    """
+
+    return build_cache_key(obj, get_version(cache, obj), context)
+
+
+def get_cache_keys(cache, objs, context=None):
+    versions = get_versions(cache, objs)
+    return [
+        build_cache_key(obj, version, context) for obj, version in zip(objs, versions)
+    ]
+
+
+def build_cache_key(obj, version, context=None):
+    vary = json.dumps(
+        obj.get_react_representation_cache_vary(context),
+        sort_keys=True,
+        cls=DjangoJSONEncoder,
+    )
+    return "{}:{}:{}:{}:{}".format(
+        KEY_PREFIX,
+        obj._meta.label,
+        obj.pk,
+        version,
+        hashlib.sha256(vary.encode("utf-8")).hexdigest(),
+    )
+
+
+def get_version_key(obj):
+    """
+    Proxy models share the version of their concrete model, so saving
+    through either one invalidates both.
+    """
+
+    return build_version_key(obj._meta.concrete_model, obj.pk)
+
+
+def build_version_key(model, pk):
+    return "{}_version:{}:{}".format(KEY_PREFIX, model._meta.label, pk)
+
+
+def get_saved_version_keys(instance):
+    """
+    Returns the version keys of every row written when saving instance,
+    that is its concrete model and, with multi-table inheritance, the
+    parent models.
+    """
+
+    return [
+        build_version_key(model, getattr(instance, model._meta.pk.attname))
+        for model in get_saved_models(type(instance))
+    ]
+
+
+def get_saved_models(model):
+    concrete = model._meta.concrete_model
+    return [concrete] + concrete._meta.get_parent_list()
+
+
+def get_version(cache, obj):
+    key = get_version_key(obj)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+
+    return version
+
+
+def get_versions(cache, objs):
+    keys = [get_version_key(obj) for obj in objs]
+    found = cache.get_many(keys)
+    return [
+        found[key] if key in found else get_version(cache, obj)
+        for key, obj in zip(keys, objs)
+    ]
+
+
+def invalidate(obj):
+    keys = get_saved_version_keys(obj)
+    get_cache().set_many({key: uuid.uuid4().hex for key in keys}, None)
+
+
+def invalidate_on_save(sender, instance, **kwargs):
+    if has_cached_rows(sender):
+        invalidate(instance)
+
+
+def invalidate_on_delete(sender, instance, **kwargs):
+    if has_cached_rows(sender):
+        get_cache().delete_many(get_saved_version_keys(instance))
+
+
+def has_cached_rows(model):
+    return any(is_cached(x) for x in [model] + get_saved_models(model))
+
+
+def is_cached(model):
+    return (
+        issubclass(model, RepresentationMixin)
+        and model.react_representation_cache_timeout
+    )
+
+
+def get_stats():
+    return stats.as_dict()
+
+
+def get_cache_stats():
+    return cache_stats.as_dict()
@@ -0,0 +1,134 @@
+"""
+This module manages SSR rendering for ASGI deployments, requests are sent
+through a pooled httpx.AsyncClient so the components on a page can be
+rendered concurrently.
+"""
+
+import asyncio
+import logging
+import weakref
+
+import httpx
+from django.conf import settings
+
+from django_react_templatetags.ssr import breaker
+from django_react_templatetags.ssr import cache as ssr_cache
+from django_react_templatetags.ssr.default import SSRService, get_request_timeout
+
+logger = logging.getLogger(__name__)
+
+_clients = weakref.WeakKeyDictionary()
+
+
+def get_client():
+    """
+    Returns the client for the running event loop, connections are kept
+    alive and reused between SSR requests.
+    """
+
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = create_client()
+
+    return client
+
+
+def create_client():
+    pool_maxsize = getattr(settings, "REACT_SSR_POOL_MAXSIZE", 10)
+    transport = httpx.AsyncHTTPTransport(
+        retries=getattr(settings, "REACT_SSR_MAX_RETRIES", 0),
+        limits=httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_maxsize,
+        ),
+    )
+    return httpx.AsyncClient(transport=transport)
+
+
+async def close_client():
+    """
+    Closes the client for the running event loop, call this on shutdown
+    (for example from an ASGI lifespan handler).
+    """
+
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def iter_async(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+class AsyncSSRService(SSRService):
+    """
+    Hastur compatible service with async variants of load_or_empty and
+    load_many, which ReactSSRMiddleware uses when running under ASGI.
+    """
+
+    async def aload_or_empty(self, component, headers={}, ssr_context=None):
+        cached = await ssr_cache.alookup(
+            component,
+            ssr_context,
+            refresh=lambda: self.render(component, headers, ssr_context),
+        )
+        if cached is not None:
+            return cached
+
+        response = await self.arender(component, headers, ssr_context)
+        await ssr_cache.astore(component, ssr_context, response)
+        return response
+
+    async def aload_many(self, components, headers={}, ssr_contexts=None):
+        ssr_contexts = ssr_contexts or [None] * len(components)
+
+        return await asyncio.gather(
+            *[
+                self.aload_or_empty(
+                    component,
+                    headers=headers,
+                    ssr_context=ssr_context,
+                )
+                for component, ssr_context in zip(components, ssr_contexts)
+            ]
+        )
+
+    async def arender(self, component, headers, ssr_context=None):
+        if not breaker.allow_request():
+            return {"html": "", "params": {}, "skipped": True}
+
+        if getattr(component, "streaming", False):
+            request_json = iter_async(self.get_request_body(component, ssr_context))
+        else:
+            request_json = self.get_request_json(component, ssr_context)
+
+        try:
+            inner_html = await self.aload(request_json, headers)
+        except httpx.HTTPError as e:
+            inner_html = ""
+            breaker.record_failure()
+
+            msg = "SSR request to '{}' failed: {}".format(
+                settings.REACT_RENDER_HOST, e.__class__.__name__
+            )
+            logger.exception(msg)
+        else:
+            breaker.record_success()
+
+        return {
+            "html": inner_html,
+            "params": {},
+        }
+
+    async def aload(self, request_json, headers):
+        req = await get_client().post(
+            settings.REACT_RENDER_HOST,
+            timeout=get_request_timeout(),
+            content=request_json,
+            headers=headers,
+        )
+
+        req.raise_for_status()
+        return req.text
@@ -0,0 +1,135 @@
+"""
+This module contains the circuit breaker shared by the SSR services, it
+skips SSR while the render host is failing.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+BREAKER_SETTINGS = (
+    "REACT_SSR_BREAKER_THRESHOLD",
+    "REACT_SSR_BREAKER_COOLDOWN",
+)
+
+
+class CircuitBreaker:
+    """
+    Opens after failure_threshold consecutive failures. Once cooldown
+    seconds have passed one trial request is let through (half-open), the
+    breaker closes if it succeeds and opens again if it fails.
+    """
+
+    def __init__(self, failure_threshold, cooldown):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+
+    @property
+    def state(self):
+        with self.lock:
+            return self._state()
+
+    def allow_request(self):
+        with self.lock:
+            state = self._state()
+            if state == CLOSED:
+                return True
+
+            if state == HALF_OPEN and not self.trial_running:
+                self.trial_running = True
+                return True
+
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self.trial_running = False
+
+    def _state(self):
+        if self.opened_at is None:
+            return CLOSED
+
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return OPEN
+
+        return HALF_OPEN
+
+
+_breaker = None
+_breaker_lock = threading.Lock()
+
+
+def get_breaker():
+    """
+    Returns the process wide breaker, or None if REACT_SSR_BREAKER_THRESHOLD
+    is not set.
+    """
+
+    global _breaker
+
+    if not getattr(settings, "REACT_SSR_BREAKER_THRESHOLD", None):
+        return None
+
+    if _breaker is None:
+        with _breaker_lock:
+            if _breaker is None:
+                _breaker = CircuitBreaker(
+                    settings.REACT_SSR_BREAKER_THRESHOLD,
+                    getattr(settings, "REACT_SSR_BREAKER_COOLDOWN", 30),
+                )
+
+    return _breaker
+
+
+def get_state():
+    breaker = get_breaker()
+    return breaker.state if breaker else CLOSED
+
+
+def is_open():
+    return get_state() == OPEN
+
+
+def allow_request():
+    breaker = get_breaker()
+    return breaker.allow_request() if breaker else True
+
+
+def record_success():
+    breaker = get_breaker()
+    if breaker:
+        breaker.record_success()
+
+
+def record_failure():
+    breaker = get_breaker()
+    if breaker:
+        breaker.record_failure()
+
+
+@receiver(setting_changed)
+def _reset_on_setting_changed(setting, **kwargs):
+    global _breaker
+
+    if setting in BREAKER_SETTINGS:
+        _breaker = None
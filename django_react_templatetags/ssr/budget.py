@@ -0,0 +1,60 @@
+"""
+This module tracks the time spent on SSR for a page, so components can
+skip SSR once REACT_SSR_PAGE_BUDGET_MS is used up.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+
+BUDGET_ATTR = "_react_ssr_budget"
+
+
+class PageBudget:
+    def __init__(self, budget_ms):
+        self.remaining = budget_ms / 1000
+        self.lock = threading.Lock()
+
+    @property
+    def exhausted(self):
+        return self.remaining <= 0
+
+    def spend(self, seconds):
+        with self.lock:
+            self.remaining -= seconds
+
+    def track(self):
+        return BudgetTimer(self)
+
+
+class BudgetTimer:
+    def __init__(self, budget):
+        self.budget = budget
+
+    def __enter__(self):
+        self.start = time.monotonic()
+        return self
+
+    def __exit__(self, *args):
+        self.budget.spend(time.monotonic() - self.start)
+
+
+def get_page_budget(context):
+    """
+    Returns the budget for the page being rendered, it is stored on the
+    request so it is shared by included templates, or on the context when
+    there is no request.
+    """
+
+    budget_ms = getattr(settings, "REACT_SSR_PAGE_BUDGET_MS", None)
+    if not budget_ms:
+        return None
+
+    holder = context.get("request", None) or context
+    budget = getattr(holder, BUDGET_ATTR, None)
+    if budget is None:
+        budget = PageBudget(budget_ms)
+        setattr(holder, BUDGET_ATTR, budget)
+
+    return budget
@@ -0,0 +1,459 @@
+"""
+This module manages caching of SSR responses, entries are keyed by a hash
+of the component name, props and ssr context. Responses are kept in a
+local LRU in front of the django cache, and can be served stale while
+they are refreshed in the background.
+"""
+
+import hashlib
+import json
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "react_ssr"
+REFRESH_LOCK_TIMEOUT = 60
+REFRESH_MAX_WORKERS = 4
+LOCAL_CACHE_SETTINGS = (
+    "REACT_SSR_LOCAL_CACHE_MAX_BYTES",
+    "REACT_SSR_LOCAL_CACHE_TIMEOUT",
+)
+
+
+class CacheStats:
+    def __init__(self, *names):
+        self.names = names
+        self.lock = threading.Lock()
+        self.reset()
+
+    def incr(self, name, delta=1):
+        with self.lock:
+            self.counters[name] += delta
+
+    def reset(self):
+        with self.lock:
+            self.counters = {name: 0 for name in self.names}
+
+    def as_dict(self):
+        with self.lock:
+            return dict(self.counters)
+
+
+class LocalCache:
+    """
+    Thread safe LRU cache bounded by the total size of the cached html,
+    the least recently used entries are evicted when the budget is full.
+    """
+
+    def __init__(self, max_bytes, timeout=None):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.stats = CacheStats("hits", "misses", "evictions")
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.stats.incr("misses")
+                return None
+
+            self.entries.move_to_end(key)
+            self.stats.incr("hits")
+            return entry[1]
+
+    def set(self, key, response, timeout):
+        if self.timeout:
+            timeout = min(timeout, self.timeout)
+
+        size = sys.getsizeof(response["html"])
+        if size > self.max_bytes:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+
+            while self.entries and self.bytes + size > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+                self.stats.incr("evictions")
+
+            self.entries[key] = (time.monotonic() + timeout, response, size)
+            self.bytes += size
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def get_stats(self):
+        with self.lock:
+            stats = self.stats.as_dict()
+            stats["entries"] = len(self.entries)
+            stats["bytes"] = self.bytes
+            return stats
+
+    def _remove(self, key):
+        _, _, size = self.entries.pop(key)
+        self.bytes -= size
+
+
+stats = CacheStats("hits", "misses", "stale")
+
+_local_cache = None
+_local_cache_lock = threading.Lock()
+
+_refresh_executor = None
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def get_stats():
+    return stats.as_dict()
+
+
+def get_local_stats():
+    local_cache = get_local_cache()
+    return local_cache.get_stats() if local_cache else None
+
+
+def get_cache():
+    alias = getattr(settings, "REACT_SSR_CACHE_ALIAS", "default")
+    return caches[alias] if alias else None
+
+
+def get_local_cache():
+    """
+    Returns the process wide LRU, or None if REACT_SSR_LOCAL_CACHE_MAX_BYTES
+    is not set.
+    """
+
+    global _local_cache
+
+    max_bytes = getattr(settings, "REACT_SSR_LOCAL_CACHE_MAX_BYTES", 0)
+    if not max_bytes:
+        return None
+
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                _local_cache = LocalCache(
+                    max_bytes,
+                    timeout=getattr(settings, "REACT_SSR_LOCAL_CACHE_TIMEOUT", None),
+                )
+
+    return _local_cache
+
+
+@receiver(setting_changed)
+def _reset_on_setting_changed(setting, **kwargs):
+    global _local_cache
+
+    if setting in LOCAL_CACHE_SETTINGS:
+        _local_cache = None
+
+
+def get_timeout(component):
+    """
+    Returns the cache timeout for a component, the ssr_cache tag argument
+    takes precedence over REACT_SSR_CACHE_TIMEOUT. A falsy value disables
+    caching.
+    """
+
+    timeout = component.get("ssr_cache")
+    if timeout is None:
+        timeout = getattr(settings, "REACT_SSR_CACHE_TIMEOUT", None)
+
+    return int(timeout) if timeout else None
+
+
+def get_key(component, ssr_context=None):
+    context_json = json.dumps(ssr_context or {}, sort_keys=True, cls=DjangoJSONEncoder)
+
+    if not getattr(component, "streaming", False):
+        if component.get("json") is not None:
+            props = [component["json"]]
+        else:
+            props = [
+                json.dumps(component["json_obj"], sort_keys=True, cls=DjangoJSONEncoder)
+            ]
+
+        return build_key(component["name"], props, context_json)
+
+    # Hashing streamed props serializes them again, so the key is kept on
+    # the component for the other lookups made while it is rendered.
+    if context_json not in component.ssr_keys:
+        component.ssr_keys[context_json] = build_key(
+            component["name"], component.iter_json(), context_json
+        )
+
+    return component.ssr_keys[context_json]
+
+
+def build_key(name, props, context_json):
+    digest = hashlib.sha256()
+    digest.update(name.encode("utf-8") + b"\n")
+    for chunk in props:
+        digest.update(chunk.encode("utf-8"))
+
+    digest.update(b"\n" + context_json.encode("utf-8"))
+    return "{}:{}".format(KEY_PREFIX, digest.hexdigest())
+
+
+def should_coalesce(component):
+    """
+    Streamed props are expensive to hash, identical requests for them are
+    only coalesced when the component is cached and needs the key anyway.
+    """
+
+    return bool(get_timeout(component)) or not getattr(component, "streaming", False)
+
+
+def lookup(component, ssr_context=None, refresh=None):
+    """
+    Returns a cached SSR response or None, components without a cache
+    timeout are never looked up.
+
+    Expired responses are returned while in the REACT_SSR_CACHE_STALE_TIMEOUT
+    grace window, and refresh is called in the background to replace them.
+    """
+
+    timeout = get_timeout(component)
+    if not timeout:
+        return None
+
+    key = get_key(component, ssr_context)
+    response = _get(key)
+    if response is None:
+        return None
+
+    if is_stale(response):
+        stats.incr("stale")
+        if refresh is not None:
+            schedule_refresh(key, component, ssr_context, refresh)
+
+    return copy_response(response)
+
+
+async def alookup(component, ssr_context=None, refresh=None):
+    """
+    Async variant of lookup, the django cache is read with aget so the event
+    loop is not blocked while waiting on it.
+    """
+
+    timeout = get_timeout(component)
+    if not timeout:
+        return None
+
+    key = get_key(component, ssr_context)
+    response = await _aget(key)
+    if response is None:
+        return None
+
+    if is_stale(response):
+        stats.incr("stale")
+        if refresh is not None:
+            await sync_to_async(schedule_refresh)(key, component, ssr_context, refresh)
+
+    return copy_response(response)
+
+
+def is_stale(response):
+    return response.get("expires", float("inf")) <= time.time()
+
+
+def store(component, ssr_context, response):
+    """
+    Caches a SSR response, empty responses from failed renders are skipped.
+    """
+
+    entry = _prepare_entry(component, ssr_context, response)
+    if entry is None:
+        return
+
+    cache = get_cache()
+    if cache:
+        cache.set(*entry)
+
+
+async def astore(component, ssr_context, response):
+    entry = _prepare_entry(component, ssr_context, response)
+    if entry is None:
+        return
+
+    cache = get_cache()
+    if cache:
+        await cache.aset(*entry)
+
+
+def _prepare_entry(component, ssr_context, response):
+    """
+    Stores the response in the local cache and returns the key, value and
+    timeout to store in the django cache.
+    """
+
+    timeout = get_timeout(component)
+    if not timeout or not response["html"]:
+        return None
+
+    key = get_key(component, ssr_context)
+    response = copy_response(response)
+    response["expires"] = time.time() + timeout
+    timeout += get_stale_timeout()
+
+    local_cache = get_local_cache()
+    if local_cache:
+        local_cache.set(key, response, timeout)
+
+    return key, response, timeout
+
+
+def _get(key):
+    response = _get_local(key)
+    if response is not None:
+        return response
+
+    cache = get_cache()
+    if cache is None:
+        return None
+
+    return _remember(key, cache.get(key))
+
+
+async def _aget(key):
+    response = _get_local(key)
+    if response is not None:
+        return response
+
+    cache = get_cache()
+    if cache is None:
+        return None
+
+    return _remember(key, await cache.aget(key))
+
+
+def _get_local(key):
+    local_cache = get_local_cache()
+    if local_cache:
+        return local_cache.get(key)
+
+    return None
+
+
+def _remember(key, response):
+    """
+    Counts a read from the django cache, hits are kept in the local cache
+    for the rest of their lifetime.
+    """
+
+    if response is None:
+        stats.incr("misses")
+        return None
+
+    stats.incr("hits")
+    local_cache = get_local_cache()
+    if local_cache:
+        remaining = response.get("expires", 0) + get_stale_timeout() - time.time()
+        if remaining > 0:
+            local_cache.set(key, response, remaining)
+
+    return response
+
+
+def get_stale_timeout():
+    return getattr(settings, "REACT_SSR_CACHE_STALE_TIMEOUT", 0) or 0
+
+
+def schedule_refresh(key, component, ssr_context, refresh):
+    """
+    Runs refresh in a background thread unless the key is already being
+    refreshed, by this process or by another worker sharing the cache.
+    """
+
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    lock_key = "{}:refresh".format(key)
+    cache = get_cache()
+    if cache and not cache.add(lock_key, 1, REFRESH_LOCK_TIMEOUT):
+        with _refreshing_lock:
+            _refreshing.discard(key)
+        return
+
+    def run():
+        try:
+            store(component, ssr_context, refresh())
+        except Exception:
+            logger.exception("SSR cache refresh failed")
+        finally:
+            if cache:
+                cache.delete(lock_key)
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    get_refresh_executor().submit(run)
+
+
+def get_refresh_executor():
+    global _refresh_executor
+
+    if _refresh_executor is None:
+        with _refreshing_lock:
+            if _refresh_executor is None:
+                _refresh_executor = ThreadPoolExecutor(
+                    max_workers=REFRESH_MAX_WORKERS,
+                    thread_name_prefix="react-ssr-refresh",
+                )
+
+    return _refresh_executor
+
+
+def copy_response(response):
+    copied = {
+        "html": response["html"],
+        "params": dict(response["params"]),
+    }
+    if response.get("skipped"):
+        copied["skipped"] = True
+
+    return copied
+
+
+def renew_hypernova_id(response):
+    """
+    Cached html is reused across pages, so it gets a new hypernova id to
+    stay unique if the same component is rendered more than once.
+    """
+
+    hypernova_id = response["params"].get("hypernova_id")
+    if not hypernova_id:
+        return response
+
+    new_id = str(uuid.uuid4())
+    response["html"] = response["html"].replace(
+        'data-hypernova-id="{}"'.format(hypernova_id),
+        'data-hypernova-id="{}"'.format(new_id),
+    )
+    response["params"]["hypernova_id"] = new_id
+    return response
@@ -4,43 +4,133 @@ This modules manages SSR rendering logic
 
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from django_react_templatetags.ssr import breaker
+from django_react_templatetags.ssr import cache as ssr_cache
+from django_react_templatetags.ssr.session import get_session
+from django_react_templatetags.ssr.singleflight import flights
 
 logger = logging.getLogger(__name__)
 
+_executor = None
+_executor_lock = threading.Lock()
+
 
 class SSRService:
     def load_or_empty(self, component, headers={}, ssr_context=None):
-        request_json = (
-            '{{"componentName": "{0}", "props": {1}, "context": {2}}}'.format(
-                component["name"],
-                component["json"],
-                json.dumps(ssr_context) if ssr_context else {},
-            )
+        cached = ssr_cache.lookup(
+            component,
+            ssr_context,
+            refresh=lambda: self.render(component, headers, ssr_context),
         )
+        if cached is not None:
+            return cached
+
+        def render():
+            response = self.render(component, headers, ssr_context)
+            ssr_cache.store(component, ssr_context, response)
+            return response
+
+        if not ssr_cache.should_coalesce(component):
+            return render()
+
+        response, shared = flights.do(ssr_cache.get_key(component, ssr_context), render)
+        return ssr_cache.copy_response(response) if shared else response
+
+    def render(self, component, headers, ssr_context=None):
+        if not breaker.allow_request():
+            return {"html": "", "params": {}, "skipped": True}
+
+        if getattr(component, "streaming", False):
+            request_json = self.get_request_body(component, ssr_context)
+        else:
+            request_json = self.get_request_json(component, ssr_context)
 
         try:
             inner_html = self.load(request_json, headers)
         except requests.exceptions.RequestException as e:
             inner_html = ""
+            breaker.record_failure()
 
             msg = "SSR request to '{}' failed: {}".format(
                 settings.REACT_RENDER_HOST, e.__class__.__name__
             )
             logger.exception(msg)
+        else:
+            breaker.record_success()
 
         return {
             "html": inner_html,
             "params": {},
         }
 
+    @staticmethod
+    def get_request_json(component, ssr_context=None):
+        return '{{"componentName": "{0}", "props": {1}, "context": {2}}}'.format(
+            component["name"],
+            component["json"],
+            json.dumps(ssr_context) if ssr_context else {},
+        )
+
+    @staticmethod
+    def get_request_body(component, ssr_context=None):
+        """
+        Yields the request json as utf-8 encoded chunks, used for components
+        that stream their props.
+        """
+
+        yield '{{"componentName": "{0}", "props": '.format(component["name"]).encode(
+            "utf-8"
+        )
+
+        for chunk in component.iter_json():
+            yield chunk.encode("utf-8")
+
+        yield ', "context": {0}}}'.format(
+            json.dumps(ssr_context) if ssr_context else {}
+        ).encode("utf-8")
+
+    def load_many(self, components, headers={}, ssr_contexts=None):
+        """
+        Renders the components concurrently on the process wide executor,
+        so at most REACT_SSR_MAX_WORKERS requests are in flight across all
+        pages. The responses are returned in the same order as the
+        components.
+        """
+
+        ssr_contexts = ssr_contexts or [None] * len(components)
+
+        def load_component(args):
+            component, ssr_context = args
+            return self.load_or_empty(
+                component,
+                headers=headers,
+                ssr_context=ssr_context,
+            )
+
+        jobs = list(zip(components, ssr_contexts))
+        if get_max_workers() <= 1 or len(jobs) <= 1:
+            return [load_component(job) for job in jobs]
+
+        return list(get_executor().map(load_component, jobs))
+
     def load(self, request_json, headers):
-        req = requests.post(
+        req = get_session().post(
             settings.REACT_RENDER_HOST,
             timeout=get_request_timeout(),
-            data=request_json,
+            data=(
+                request_json.encode("utf-8")
+                if isinstance(request_json, str)
+                else request_json
+            ),
             headers=headers,
         )
 
@@ -53,3 +143,56 @@ def get_request_timeout():
         return 20
 
     return settings.REACT_RENDER_TIMEOUT
+
+
+def get_max_workers():
+    if not hasattr(settings, "REACT_SSR_MAX_WORKERS"):
+        return 1
+
+    return settings.REACT_SSR_MAX_WORKERS
+
+
+def get_executor():
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=get_max_workers(),
+                    thread_name_prefix="react-ssr",
+                )
+
+    return _executor
+
+
+def shutdown_executor():
+    global _executor
+
+    with _executor_lock:
+        executor, _executor = _executor, None
+
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def _reset_after_fork():
+    """
+    Threads do not survive a fork, so the child starts with a fresh lock
+    and builds its own executor on first use.
+    """
+
+    global _executor, _executor_lock
+
+    _executor_lock = threading.Lock()
+    _executor = None
+
+
+@receiver(setting_changed)
+def _reset_on_setting_changed(setting, **kwargs):
+    if setting == "REACT_SSR_MAX_WORKERS":
+        shutdown_executor()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,125 @@
+"""
+This module manages deferred SSR, where components are queued during
+template rendering and rendered in one batch when the response is ready.
+"""
+
+import re
+import uuid
+from contextlib import contextmanager
+
+from django.utils.safestring import mark_safe
+
+REQUEST_ATTR = "_react_ssr_queue"
+MARKER_RE = re.compile(r"<!--react-(?:ssr|print):([0-9a-f]{32})-->")
+
+
+def get_deferred_queue(request, active_only=True):
+    """
+    Returns the queue attached to the request by ReactSSRMiddleware, or None
+    if deferred rendering is not active for this request. Tags are only
+    deferred while the queue is active, that is while rendering output that
+    is known to have its markers replaced.
+    """
+
+    if request is None:
+        return None
+
+    queue = getattr(request, REQUEST_ATTR, None)
+    if queue is None or (active_only and not queue.active):
+        return None
+
+    return queue
+
+
+def attach_deferred_queue(request):
+    queue = DeferredSSRQueue(request)
+    setattr(request, REQUEST_ATTR, queue)
+    return queue
+
+
+class DeferredSSRQueue:
+    """
+    Collects SSR jobs and react_print calls for a request, each one is
+    represented by a unique marker in the output until resolved.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.jobs = []
+        self.prints = []
+        self.replacements = {}
+        self.active = False
+
+    def deactivate(self):
+        self.active = False
+
+    @contextmanager
+    def deferring(self):
+        active, self.active = self.active, True
+        try:
+            yield self
+        finally:
+            self.active = active
+
+    @property
+    def pending(self):
+        return bool(self.jobs or self.prints)
+
+    def add(self, component, ssr_context=None):
+        token = uuid.uuid4().hex
+        self.jobs.append((token, component, ssr_context))
+        return "<!--react-ssr:{}-->".format(token)
+
+    def add_print(self, components, context):
+        token = uuid.uuid4().hex
+        self.prints.append((token, components, context.__copy__()))
+        return mark_safe("<!--react-print:{}-->".format(token))
+
+    def resolve(self):
+        from django_react_templatetags.templatetags.react import load_many_from_ssr
+
+        jobs, prints = self.take()
+        if jobs:
+            self.apply_responses(jobs, load_many_from_ssr(*self.get_load_args(jobs)))
+
+        self.render_prints(prints)
+
+    async def aresolve(self):
+        from django_react_templatetags.templatetags.react import aload_many_from_ssr
+
+        jobs, prints = self.take()
+        if jobs:
+            responses = await aload_many_from_ssr(*self.get_load_args(jobs))
+            self.apply_responses(jobs, responses)
+
+        self.render_prints(prints)
+
+    def take(self):
+        jobs, self.jobs = self.jobs, []
+        prints, self.prints = self.prints, []
+        return jobs, prints
+
+    @staticmethod
+    def get_load_args(jobs):
+        return (
+            [component for _, component, _ in jobs],
+            [ssr_context for _, _, ssr_context in jobs],
+        )
+
+    def apply_responses(self, jobs, responses):
+        from django_react_templatetags.templatetags.react import apply_ssr_response
+
+        for (token, component, _), ssr_resp in zip(jobs, responses):
+            self.replacements[token] = apply_ssr_response(component, ssr_resp)
+
+    def render_prints(self, prints):
+        from django_react_templatetags.templatetags.react import render_react_print
+
+        for token, components, context in prints:
+            self.replacements[token] = render_react_print(context, components)
+
+    def apply(self, content):
+        return MARKER_RE.sub(
+            lambda match: self.replacements.get(match.group(1), match.group(0)),
+            content,
+        )
@@ -1,9 +1,13 @@
 import logging
 import re
 
-import hypernova
 from django.conf import settings
 
+from django_react_templatetags.ssr import breaker
+from django_react_templatetags.ssr import cache as ssr_cache
+from django_react_templatetags.ssr.session import get_session
+from django_react_templatetags.ssr.singleflight import flights
+
 logger = logging.getLogger(__name__)
 hypernova_id_re = re.compile(r"data-hypernova-id=\"([\w\-]*)\"")
 hypernova_key_re = re.compile(r"data-hypernova-key=\"([\w\-]*)\"")
@@ -11,44 +15,140 @@ hypernova_key_re = re.compile(r"data-hypernova-key=\"([\w\-]*)\"")
 
 class HypernovaService:
     def load_or_empty(self, component, headers={}, ssr_context=None):
-        # from hypernova.plugins.dev_mode import DevModePlugin
-
-        renderer = hypernova.Renderer(
-            settings.REACT_RENDER_HOST,
-            # [DevModePlugin(logger)] if settings.DEBUG else [],
-            [],
-            timeout=get_request_timeout(),
+        return self.load_many(
+            [component],
             headers=headers,
-        )
+            ssr_contexts=[ssr_context],
+        )[0]
 
-        inner_html = ""
-        try:
-            props = component["json_obj"]
+    def load_many(self, components, headers={}, ssr_contexts=None):
+        """
+        Renders all components that are not cached in a single request to
+        the batch endpoint.
+        """
+
+        ssr_contexts = ssr_contexts or [None] * len(components)
+
+        responses = []
+        for component, ssr_context in zip(components, ssr_contexts):
+            cached = ssr_cache.lookup(
+                component,
+                ssr_context,
+                refresh=self.get_refresh(component, headers, ssr_context),
+            )
+            responses.append(ssr_cache.renew_hypernova_id(cached) if cached else None)
+
+        missing = [index for index, resp in enumerate(responses) if resp is None]
+        if not missing:
+            return responses
+
+        def render():
+            rendered = self.render_batch(
+                [components[index] for index in missing],
+                headers=headers,
+                ssr_contexts=[ssr_contexts[index] for index in missing],
+            )
+
+            for index, resp in zip(missing, rendered):
+                ssr_cache.store(components[index], ssr_contexts[index], resp)
+
+            return rendered
+
+        if all(ssr_cache.should_coalesce(components[index]) for index in missing):
+            flight_key = "|".join(
+                ssr_cache.get_key(components[index], ssr_contexts[index])
+                for index in missing
+            )
+            rendered, shared = flights.do(flight_key, render)
+        else:
+            rendered, shared = render(), False
+
+        for index, resp in zip(missing, rendered):
+            responses[index] = ssr_cache.copy_response(resp) if shared else resp
+
+        return responses
+
+    def get_refresh(self, component, headers, ssr_context):
+        return lambda: self.render_batch([component], headers, [ssr_context])[0]
+
+    def render_batch(self, components, headers, ssr_contexts):
+        if not breaker.allow_request():
+            return [dict(parse_html(""), skipped=True) for _ in components]
+
+        keys = get_job_keys(components)
+
+        jobs = {}
+        for key, component, ssr_context in zip(keys, components, ssr_contexts):
+            props = dict(component["json_obj"])
             if ssr_context:
                 props["context"] = ssr_context
-            inner_html = renderer.render({component["name"]: props})
+
+            jobs[key] = {
+                "name": component["name"],
+                "data": props,
+            }
+
+        results = {}
+        try:
+            req = get_session().post(
+                settings.REACT_RENDER_HOST,
+                json=jobs,
+                headers=headers,
+                timeout=get_request_timeout(),
+            )
+            req.raise_for_status()
+            results = req.json().get("results") or {}
         except Exception as e:
-            msg = "SSR request to '{}' failed: {}".format(
+            breaker.record_failure()
+            msg = "SSR batch request to '{}' failed: {}".format(
                 settings.REACT_RENDER_HOST, e.__class__.__name__
             )
             logger.exception(msg)
+        else:
+            breaker.record_success()
+
+        responses = []
+        for key in keys:
+            result = results.get(key) or {}
+            inner_html = "" if result.get("error") else result.get("html", "")
+            responses.append(parse_html(inner_html))
+
+        return responses
+
+
+def get_job_keys(components):
+    """
+    Jobs are keyed by component name, repeated components get their
+    position appended to keep the keys unique within the batch.
+    """
+
+    keys = []
+    for index, component in enumerate(components):
+        key = component["name"]
+        if key in keys:
+            key = "{}_{}".format(key, index)
+        keys.append(key)
+
+    return keys
+
 
-        if not inner_html:
-            return {"html": "", "params": {}}
+def parse_html(inner_html):
+    if not inner_html:
+        return {"html": "", "params": {}}
 
-        match = re.search(hypernova_id_re, inner_html)
-        hypernova_id = match.group(1) if match else None
+    match = re.search(hypernova_id_re, inner_html)
+    hypernova_id = match.group(1) if match else None
 
-        match = re.search(hypernova_key_re, inner_html)
-        hypernova_key = match.group(1) if match else None
+    match = re.search(hypernova_key_re, inner_html)
+    hypernova_key = match.group(1) if match else None
 
-        return {
-            "html": inner_html,
-            "params": {
-                "hypernova_id": hypernova_id,
-                "hypernova_key": hypernova_key,
-            },
-        }
+    return {
+        "html": inner_html,
+        "params": {
+            "hypernova_id": hypernova_id,
+            "hypernova_key": hypernova_key,
+        },
+    }
 
 
 def get_request_timeout():
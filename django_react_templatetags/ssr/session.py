@@ -0,0 +1,91 @@
+"""
+This module manages the pooled HTTP session shared by the SSR services
+"""
+
+import atexit
+import os
+import threading
+
+import requests
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+POOL_SETTINGS = (
+    "REACT_SSR_POOL_CONNECTIONS",
+    "REACT_SSR_POOL_MAXSIZE",
+    "REACT_SSR_MAX_RETRIES",
+)
+
+_session = None
+_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Returns the process wide session, connections are kept alive and
+    reused between SSR requests.
+    """
+
+    global _session
+
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = create_session()
+
+    return _session
+
+
+def create_session():
+    adapter = HTTPAdapter(
+        pool_connections=getattr(settings, "REACT_SSR_POOL_CONNECTIONS", 10),
+        pool_maxsize=getattr(settings, "REACT_SSR_POOL_MAXSIZE", 10),
+        max_retries=Retry(
+            total=getattr(settings, "REACT_SSR_MAX_RETRIES", 0),
+            backoff_factor=0.1,
+            allowed_methods=None,
+            raise_on_status=False,
+        ),
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def close_session():
+    global _session
+
+    with _lock:
+        session, _session = _session, None
+
+    if session is not None:
+        session.close()
+
+
+def _reset_after_fork():
+    """
+    Sockets must not be shared between forked workers, so the child starts
+    with a fresh lock and builds its own session on first use.
+    """
+
+    global _lock, _session
+
+    _lock = threading.Lock()
+    _session = None
+
+
+@receiver(setting_changed)
+def _reset_on_setting_changed(setting, **kwargs):
+    if setting in POOL_SETTINGS:
+        close_session()
+
+
+atexit.register(close_session)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
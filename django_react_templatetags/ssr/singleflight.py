@@ -0,0 +1,57 @@
+"""
+This module coalesces identical SSR requests made at the same time, so only
+one of them reaches the render host.
+"""
+
+import threading
+
+
+class Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs one call per key at a time, concurrent callers with the same key
+    wait for and share the result of the call in flight.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+
+    def do(self, key, fn):
+        """
+        Returns a tuple of the result and whether it was shared with
+        another caller.
+        """
+
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.event.set()
+
+        return call.result, False
+
+
+flights = SingleFlight()
@@ -0,0 +1,91 @@
+"""
+This module keeps the SSR output of static react_render tags, tags where
+every argument is a literal, in process memory. They are rendered once per
+REACT_SSR_VERSION and then served without calling the SSR service.
+"""
+
+import threading
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template import loader
+
+from django_react_templatetags.ssr.cache import (
+    copy_response,
+    get_key,
+    renew_hypernova_id,
+)
+
+STATIC_SETTINGS = (
+    "REACT_SSR_STATIC",
+    "REACT_SSR_VERSION",
+)
+
+_responses = {}
+_lock = threading.Lock()
+
+
+def is_enabled():
+    return getattr(settings, "REACT_SSR_STATIC", False)
+
+
+def get_static_key(component):
+    return "{}:{}".format(
+        getattr(settings, "REACT_SSR_VERSION", ""), get_key(component)
+    )
+
+
+def get(component):
+    with _lock:
+        response = _responses.get(get_static_key(component))
+
+    if response is None:
+        return None
+
+    return renew_hypernova_id(copy_response(response))
+
+
+def store(component, response):
+    """
+    Stores a copy of the response, failed renders are not stored so they
+    are retried on the next request.
+    """
+
+    if not response["html"]:
+        return
+
+    with _lock:
+        _responses[get_static_key(component)] = copy_response(response)
+
+
+def clear():
+    with _lock:
+        _responses.clear()
+
+
+def warm_up(template_names, using=None):
+    """
+    Renders the static tags in the templates, call it on startup (for
+    example in wsgi.py) so the first requests do not wait on SSR. Returns
+    the number of tags rendered.
+    """
+
+    from django_react_templatetags.templatetags.react import ReactTagManager
+
+    rendered = 0
+    for template_name in template_names:
+        template = loader.get_template(template_name, using=using)
+        nodes = template.template.nodelist.get_nodes_by_type(ReactTagManager)
+
+        for node in nodes:
+            if node.warm_up_ssr():
+                rendered += 1
+
+    return rendered
+
+
+@receiver(setting_changed)
+def _clear_on_setting_changed(setting, **kwargs):
+    if setting in STATIC_SETTINGS:
+        clear()
@@ -0,0 +1,308 @@
+"""
+This module contains a stub render host for benchmarks and load tests, it
+answers both the Hastur requests sent by SSRService and the batch requests
+sent by HypernovaService, with configurable latency, errors, timeouts and
+response sizes.
+
+    python -m django_react_templatetags.ssr.stub --port 8001 --latency 20
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+HASTUR = "hastur"
+HYPERNOVA = "hypernova"
+
+
+def constant(seconds):
+    return lambda rng: seconds
+
+
+def uniform(low, high):
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median, sigma):
+    """
+    Long tailed latency, half of the requests are faster than median and
+    a larger sigma gives slower outliers.
+    """
+
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+class StubStats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def incr(self, name, delta=1):
+        with self.lock:
+            self.counters[name] += delta
+
+    def reset(self):
+        with self.lock:
+            self.counters = {
+                "requests": 0,
+                "components": 0,
+                "errors": 0,
+                "timeouts": 0,
+            }
+
+    def as_dict(self):
+        with self.lock:
+            return dict(self.counters)
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    disable_nagle_algorithm = True
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.read_body())
+        request_format = get_format(payload)
+
+        server.stats.incr("requests")
+        server.stats.incr("components", 1 if request_format == HASTUR else len(payload))
+
+        if server.roll(server.timeout_rate):
+            server.stats.incr("timeouts")
+            server.stopped.wait(server.timeout)
+            self.close_connection = True
+            return
+
+        delay = server.get_latency()
+        if delay > 0:
+            server.stopped.wait(delay)
+
+        if request_format == HASTUR:
+            self.send_hastur(payload)
+        else:
+            self.send_hypernova(payload)
+
+    def read_body(self):
+        if self.headers.get("Transfer-Encoding", "").lower() != "chunked":
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        chunks = []
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            if size == 0:
+                break
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+        while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+            pass
+
+        return b"".join(chunks)
+
+    def send_hastur(self, payload):
+        if self.server.roll(self.server.error_rate):
+            self.server.stats.incr("errors")
+            self.send_body(500, "text/plain", b"Stub render error")
+            return
+
+        html = self.server.render_html(payload["componentName"])
+        self.send_body(200, "text/html; charset=utf-8", html.encode("utf-8"))
+
+    def send_hypernova(self, payload):
+        results = {}
+        for key, job in payload.items():
+            if self.server.roll(self.server.error_rate):
+                self.server.stats.incr("errors")
+                results[key] = {
+                    "name": job["name"],
+                    "html": None,
+                    "success": False,
+                    "error": {"name": "Error", "message": "Stub render error"},
+                }
+                continue
+
+            results[key] = {
+                "name": job["name"],
+                "html": self.server.render_hypernova_html(key),
+                "success": True,
+                "error": None,
+            }
+
+        body = json.dumps({"success": True, "error": None, "results": results})
+        self.send_body(200, "application/json", body.encode("utf-8"))
+
+    def send_body(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubRenderServer(ThreadingHTTPServer):
+    """
+    Threaded render host, latency is seconds or a function of a
+    random.Random (see constant, uniform and lognormal). error_rate and
+    timeout_rate are the fraction of renders that fail and of requests that
+    get no response for timeout seconds. response_size pads the html to at
+    least that many characters.
+
+    Settings can be changed with configure while the server is running.
+    """
+
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=0,
+        latency=0,
+        error_rate=0,
+        timeout_rate=0,
+        timeout=30,
+        response_size=0,
+        seed=None,
+    ):
+        super().__init__((host, port), StubRequestHandler)
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+        self.stats = StubStats()
+        self.stopped = threading.Event()
+        self.thread = None
+
+        self.configure(
+            latency=latency,
+            error_rate=error_rate,
+            timeout_rate=timeout_rate,
+            timeout=timeout,
+            response_size=response_size,
+        )
+
+    def configure(self, **options):
+        for name, value in options.items():
+            if name not in (
+                "latency",
+                "error_rate",
+                "timeout_rate",
+                "timeout",
+                "response_size",
+            ):
+                raise TypeError("Unknown stub option '{}'".format(name))
+
+            if name == "latency" and not callable(value):
+                value = constant(value)
+
+            setattr(self, name, value)
+
+    @property
+    def url(self):
+        return "http://{}:{}/".format(*self.server_address[:2])
+
+    def roll(self, rate):
+        if rate <= 0:
+            return False
+
+        with self.random_lock:
+            return self.random.random() < rate
+
+    def get_latency(self):
+        with self.random_lock:
+            return max(self.latency(self.random), 0)
+
+    def render_html(self, name):
+        html = '<div data-component="{}">'.format(name)
+        padding = self.response_size - len(html) - len("</div>")
+        return html + "x" * max(padding, 0) + "</div>"
+
+    def render_hypernova_html(self, key):
+        html = '<div data-hypernova-key="{}" data-hypernova-id="{}">'.format(
+            key, uuid.uuid4()
+        )
+        padding = self.response_size - len(html) - len("</div>")
+        return html + "x" * max(padding, 0) + "</div>"
+
+    def start(self):
+        self.stopped.clear()
+        self.thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def get_format(payload):
+    if isinstance(payload, dict) and "componentName" in payload:
+        return HASTUR
+
+    return HYPERNOVA
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stub SSR render host")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument(
+        "--latency", type=float, default=0, help="Median latency in milliseconds"
+    )
+    parser.add_argument(
+        "--latency-sigma",
+        type=float,
+        default=0,
+        help="Spread of a lognormal latency, 0 for a constant latency",
+    )
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--timeout-rate", type=float, default=0)
+    parser.add_argument(
+        "--timeout", type=float, default=30, help="Seconds before a timeout answers"
+    )
+    parser.add_argument("--response-size", type=int, default=0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    latency = args.latency / 1000
+    if args.latency_sigma and latency > 0:
+        latency = lognormal(latency, args.latency_sigma)
+
+    server = StubRenderServer(
+        host=args.host,
+        port=args.port,
+        latency=latency,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout=args.timeout,
+        response_size=args.response_size,
+        seed=args.seed,
+    )
+
+    print("Stub render host listening on {}".format(server.url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stopped.set()
+        server.server_close()
+        print(json.dumps(server.stats.as_dict()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+This module renders templates for StreamingHttpResponse, the props of
+components rendered with stream_props are serialized while the page is
+being sent instead of being held in memory as one string.
+"""
+
+import re
+import uuid
+from contextlib import nullcontext
+
+from django.template import loader
+from django.utils.safestring import mark_safe
+
+from django_react_templatetags.components import (
+    JSON_SCRIPT_ESCAPES,
+    iter_component_json,
+)
+from django_react_templatetags.ssr.deferred import get_deferred_queue
+
+REQUEST_ATTR = "_react_props_stream"
+MARKER_RE = re.compile(r"<!--react-props:([0-9a-f]{32})-->")
+
+
+def get_props_stream(request):
+    """
+    Returns the streamed components of the request, or None if the page is
+    not rendered with stream_template.
+    """
+
+    if request is None:
+        return None
+
+    return getattr(request, REQUEST_ATTR, None)
+
+
+def add_streamed_component(stream, component):
+    token = uuid.uuid4().hex
+    stream[token] = component
+    return mark_safe("<!--react-props:{}-->".format(token))
+
+
+def stream_template(template_name, context=None, request=None, using=None):
+    """
+    Renders the template and returns an iterator over the page, to be passed
+    to StreamingHttpResponse. Rendering happens before the iterator is
+    returned, so template errors are raised as usual.
+
+    Example:
+        return StreamingHttpResponse(
+            stream_template("catalog.html", {"tree": tree}, request)
+        )
+    """
+
+    stream = {}
+    if request is not None:
+        setattr(request, REQUEST_ATTR, stream)
+
+    queue = get_deferred_queue(request, active_only=False)
+    with queue.deferring() if queue is not None else nullcontext():
+        content = loader.render_to_string(template_name, context, request, using)
+
+    if queue is not None and queue.pending:
+        queue.resolve()
+        content = queue.apply(content)
+
+    return iter_content(content, stream)
+
+
+def iter_content(content, stream):
+    """
+    Yields the content with the props of each streamed component in place
+    of its marker. Unknown markers, for example in a fragment cached from
+    another request, are left unchanged since the headers are already sent.
+    """
+
+    position = 0
+    for match in MARKER_RE.finditer(content):
+        component = stream.get(match.group(1))
+        if component is None:
+            continue
+
+        yield content[position : match.start()]
+
+        for chunk in iter_component_json(component):
+            yield chunk.translate(JSON_SCRIPT_ESCAPES)
+
+        position = match.end()
+
+    yield content[position:]
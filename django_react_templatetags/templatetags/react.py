@@ -1,19 +1,29 @@
 """
 This module contains tags for including react components into templates.
 """
-import json
 import uuid
+from contextlib import nullcontext
 
+from asgiref.sync import sync_to_async
 from django import template
 from django.conf import settings
-from django.template import Node
+from django.template import Engine, Node
 from django.utils.module_loading import import_string
 
-from django_react_templatetags.encoders import json_encoder_cls_factory
+from django_react_templatetags.components import ReactComponent, as_component
+from django_react_templatetags.encoders import get_json_backend
+from django_react_templatetags.manifest import render_manifest
+from django_react_templatetags.props import get_props_url, should_serve_from_url
+from django_react_templatetags.ssr import breaker
+from django_react_templatetags.ssr import static as ssr_static
+from django_react_templatetags.ssr.budget import get_page_budget
+from django_react_templatetags.ssr.deferred import get_deferred_queue
+from django_react_templatetags.streaming import add_streamed_component, get_props_stream
 
 register = template.Library()
 
 CONTEXT_KEY = "REACT_COMPONENTS"
+PRINT_TEMPLATE = "react_print.html"
 
 DEFAULT_SSR_HEADERS = {
     "Content-type": "application/json",
@@ -47,6 +57,64 @@ def load_from_ssr(component, ssr_context=None):
     )
 
 
+def load_many_from_ssr(components, ssr_contexts=None):
+    """
+    Renders several components in one go, services that cannot batch are
+    called once per component.
+    """
+
+    ssr_contexts = ssr_contexts or [None] * len(components)
+    ssr_service = _get_ssr_service()()
+
+    if not hasattr(ssr_service, "load_many"):
+        return [
+            ssr_service.load_or_empty(
+                component,
+                headers=get_ssr_headers(),
+                ssr_context=ssr_context,
+            )
+            for component, ssr_context in zip(components, ssr_contexts)
+        ]
+
+    return ssr_service.load_many(
+        components,
+        headers=get_ssr_headers(),
+        ssr_contexts=ssr_contexts,
+    )
+
+
+async def aload_many_from_ssr(components, ssr_contexts=None):
+    """
+    Async variant of load_many_from_ssr, services without aload_many are
+    run in a thread.
+    """
+
+    ssr_service = _get_ssr_service()()
+
+    if not hasattr(ssr_service, "aload_many"):
+        return await sync_to_async(load_many_from_ssr)(components, ssr_contexts)
+
+    return await ssr_service.aload_many(
+        components,
+        headers=get_ssr_headers(),
+        ssr_contexts=ssr_contexts or [None] * len(components),
+    )
+
+
+def apply_ssr_response(component, ssr_resp):
+    """
+    Stores the SSR params on the component and returns the html, components
+    the service did not send to the render host (for example while the
+    circuit breaker is open) are marked with ssr_skipped.
+    """
+
+    component["ssr_params"] = ssr_resp["params"]
+    if ssr_resp.get("skipped"):
+        component["ssr_skipped"] = True
+
+    return ssr_resp["html"]
+
+
 def _get_ssr_service():
     """
     Loads a custom React Tag Manager if provided in Django Settings.
@@ -61,6 +129,26 @@ def _get_ssr_service():
     return import_string(class_path)
 
 
+# Returned by get_literal for arguments that are resolved on render
+DYNAMIC = object()
+
+
+def get_literal(value):
+    """
+    Returns the value of a literal tag argument such as "Menu" or 1, or
+    DYNAMIC if it is a variable. Translated literals such as _("Yes")
+    depend on the active language and are DYNAMIC as well.
+    """
+
+    if not isinstance(value, template.Variable):
+        return value
+
+    if value.literal is None or value.translate:
+        return DYNAMIC
+
+    return value.literal
+
+
 class ReactTagManager(Node):
     """
     Handles the printing of react placeholders and queueing, is invoked by
@@ -76,6 +164,9 @@ class ReactTagManager(Node):
         props=None,
         ssr_context=None,
         no_placeholder=None,
+        ssr_cache=None,
+        stream_props=None,
+        props_url=None,
     ):
         component_prefix = ""
         if hasattr(settings, "REACT_COMPONENT_PREFIX"):
@@ -89,35 +180,163 @@ class ReactTagManager(Node):
         self.props = props
         self.ssr_context = ssr_context
         self.no_placeholder = no_placeholder
+        self.ssr_cache = ssr_cache
+        self.stream_props = stream_props
+        self.props_url = props_url
+
+        self.precompute()
+
+    def precompute(self):
+        """
+        Computes what only depends on literal arguments once when the
+        template is compiled. Parts handled by an overridden method are
+        always computed on render.
+        """
+
+        self.qualified_name = None
+        self.static_identifier = None
+        self.placeholder_start = None
+        self.constant_json = None
+        self.static_ssr = False
+
+        component = get_literal(self.component)
+        if component is not DYNAMIC and self.uses_default("get_qualified_name"):
+            self.qualified_name = "{}{}".format(self.component_prefix, component)
+
+        identifier = get_literal(self.identifier)
+        css_class = get_literal(self.css_class)
+        if identifier and identifier is not DYNAMIC:
+            if self.uses_default("get_identifier"):
+                self.static_identifier = identifier
+
+            if css_class is not DYNAMIC and self.uses_default("render_placeholder"):
+                attributes = [("id", identifier), ("class", css_class)]
+                self.placeholder_start = self.render_placeholder(
+                    [x for x in attributes if x[1] is not None]
+                )[: -len("</div>")]
+
+        props = {key: get_literal(value) for key, value in self.props.items()}
+        if (
+            self.data is None
+            and DYNAMIC not in props.values()
+            and self.uses_default("get_component_props")
+            and self.uses_default("props_to_json")
+        ):
+            self.constant_json = self.props_to_json(props, None)
+
+        # The SSR output of a tag without variables is the same on every
+        # render, it can be rendered once and kept in ssr.static.
+        self.static_ssr = (
+            self.qualified_name is not None
+            and self.constant_json is not None
+            and self.ssr_context is None
+            and not get_literal(self.stream_props)
+            and get_literal(self.ssr_cache) is not DYNAMIC
+        )
+
+    def has_static_ssr(self, component):
+        return (
+            self.static_ssr
+            and component.get("ssr_cache") != 0
+            and ssr_static.is_enabled()
+        )
+
+    def load_static_ssr(self, component):
+        ssr_resp = ssr_static.get(component)
+        if ssr_resp is None:
+            ssr_resp = load_from_ssr(component)
+            ssr_static.store(component, ssr_resp)
+
+        return ssr_resp
+
+    def warm_up_ssr(self):
+        """
+        Renders the SSR output of a static tag ahead of the first request,
+        returns False for tags that are not static.
+        """
+
+        if not has_ssr(None):
+            return False
+
+        identifier = self.static_identifier or self.qualified_name
+        component = ReactComponent(
+            identifier=identifier,
+            data_identifier="{}_data".format(identifier),
+            name=self.qualified_name,
+            json=self.constant_json,
+        )
+
+        ssr_cache = get_literal(self.ssr_cache)
+        if ssr_cache is not None:
+            component["ssr_cache"] = int(ssr_cache)
+
+        if not self.has_static_ssr(component):
+            return False
+
+        self.load_static_ssr(component)
+        return True
+
+    def uses_default(self, name):
+        return getattr(type(self), name) is getattr(ReactTagManager, name)
 
     def render(self, context):
-        qualified_component_name = self.get_qualified_name(context)
-        identifier = self.get_identifier(context, qualified_component_name)
-        component_props = self.get_component_props(context)
-        json_str = self.props_to_json(component_props, context)
-
-        component = {
-            "identifier": identifier,
-            "data_identifier": "{}_data".format(identifier),
-            "name": qualified_component_name,
-            "json": json_str,
-            "json_obj": json.loads(json_str),
-        }
+        qualified_component_name = self.qualified_name
+        if qualified_component_name is None:
+            qualified_component_name = self.get_qualified_name(context)
 
-        placeholder_attr = (
-            ("id", identifier),
-            ("class", self.resolve_template_variable(self.css_class, context)),
+        identifier = self.static_identifier
+        if identifier is None:
+            identifier = self.get_identifier(context, qualified_component_name)
+
+        request = context.get("request", None)
+
+        component = ReactComponent(
+            identifier=identifier,
+            data_identifier="{}_data".format(identifier),
+            name=qualified_component_name,
         )
-        placeholder_attr = [x for x in placeholder_attr if x[1] is not None]
+
+        if self.resolve_template_variable(self.stream_props, context):
+            component.stream_props(self.get_component_props(context), context)
+
+            stream = get_props_stream(request)
+            if stream is not None:
+                component["json_script"] = add_streamed_component(stream, component)
+        else:
+            if self.constant_json is not None:
+                component["json"] = self.constant_json
+            else:
+                component_props = self.get_component_props(context)
+                component["json"] = self.props_to_json(component_props, context)
+
+            props_url = self.resolve_template_variable(self.props_url, context)
+            if should_serve_from_url(component["json"], props_url):
+                component["props_url"] = get_props_url(component["json"])
+
+        ssr_cache = self.resolve_template_variable(self.ssr_cache, context)
+        if ssr_cache is not None:
+            component["ssr_cache"] = int(ssr_cache)
 
         component_html = ""
-        if has_ssr(context.get("request", None)):
-            ssr_resp = load_from_ssr(
-                component,
-                ssr_context=self.get_ssr_context(context),
-            )
-            component_html = ssr_resp["html"]
-            component["ssr_params"] = ssr_resp["params"]
+        if has_ssr(request):
+            queue = get_deferred_queue(request)
+            budget = get_page_budget(context)
+            if breaker.is_open() or (budget and budget.exhausted):
+                component["ssr_skipped"] = True
+            elif self.has_static_ssr(component):
+                with budget.track() if budget else nullcontext():
+                    ssr_resp = self.load_static_ssr(component)
+                component_html = apply_ssr_response(component, ssr_resp)
+            elif queue is not None:
+                component_html = queue.add(
+                    component,
+                    ssr_context=self.get_ssr_context(context),
+                )
+            else:
+                ssr_context = self.get_ssr_context(context)
+                with budget.track() if budget else nullcontext():
+                    ssr_resp = load_from_ssr(component, ssr_context=ssr_context)
+                component_html = apply_ssr_response(component, ssr_resp)
 
         components = context.get(CONTEXT_KEY, [])
         components.append(component)
@@ -126,6 +345,15 @@ class ReactTagManager(Node):
         if self.no_placeholder:
             return component_html
 
+        if self.placeholder_start is not None:
+            return self.placeholder_start + component_html + "</div>"
+
+        placeholder_attr = (
+            ("id", identifier),
+            ("class", self.resolve_template_variable(self.css_class, context)),
+        )
+        placeholder_attr = [x for x in placeholder_attr if x[1] is not None]
+
         return self.render_placeholder(placeholder_attr, component_html)
 
     def get_qualified_name(self, context):
@@ -179,8 +407,7 @@ class ReactTagManager(Node):
 
     @staticmethod
     def props_to_json(resolved_data, context):
-        cls = json_encoder_cls_factory(context)
-        return json.dumps(resolved_data, cls=cls)
+        return get_json_backend()(resolved_data, context)
 
     @staticmethod
     def render_placeholder(attributes, component_html=""):
@@ -259,7 +486,7 @@ def _get_tag_manager():
     return import_string(class_path)
 
 
-@register.inclusion_tag("react_print.html", takes_context=True)
+@register.simple_tag(takes_context=True)
 def react_print(context):
     """
     Generates ReactDOM.hydate calls based on REACT_COMPONENT queue,
@@ -273,8 +500,53 @@ def react_print(context):
     components = context.get(CONTEXT_KEY, [])
     context[CONTEXT_KEY] = []
 
+    queue = get_deferred_queue(context.get("request", None))
+    if queue is not None and queue.jobs:
+        return queue.add_print(components, context)
+
+    return render_react_print(context, components)
+
+
+def render_react_print(context, components):
+    """
+    Renders react_print.html, SSR must be resolved for the components
+    before this is called.
+    """
+
+    components = [as_component(component) for component in components]
+    ssr_available = has_ssr(context.get("request", None))
+    if getattr(settings, "REACT_PRINT_MODE", "template") == "manifest":
+        return render_manifest(components, ssr_available)
+
+    engine = context.template.engine if context.template else Engine.get_default()
+    template = engine.get_template(PRINT_TEMPLATE)
+    share_data_scripts(components)
+
     new_context = context.__copy__()
-    new_context["ssr_available"] = has_ssr(context.get("request", None))
-    new_context["components"] = components
+    new_context.update(
+        {
+            "ssr_available": ssr_available,
+            "components": components,
+        }
+    )
+
+    return template.render(new_context)
+
 
-    return new_context
+def share_data_scripts(components):
+    """
+    Components with identical props read them from the data script of the
+    first one, so each distinct payload is only printed once. Components
+    that fetch their props from a url print no data script, so they are
+    never used as a source.
+    """
+
+    data_sources = {}
+    for component in components:
+        if getattr(component, "streaming", False) or component.get("props_url"):
+            component["data_source"] = component["data_identifier"]
+            continue
+
+        component["data_source"] = data_sources.setdefault(
+            component["json"], component["data_identifier"]
+        )
@@ -0,0 +1,301 @@
+"""
+Benchmark suite for the template tag and SSR hot paths, run it with:
+
+    python runtests.py --bench --bench-output results.json
+    python runtests.py --bench --bench-compare results.json
+
+Each benchmark is timed with timeit and the results are written as json,
+so runs from different releases can be compared.
+"""
+
+import json
+import logging
+import platform
+import statistics
+import sys
+import time
+import timeit
+
+import django
+from django.template import Context, Template
+from django.test import override_settings
+from django.test.client import RequestFactory
+
+import django_react_templatetags
+from django_react_templatetags import encoders
+from django_react_templatetags.components import ReactComponent
+from django_react_templatetags.ssr import session as ssr_session
+from django_react_templatetags.ssr.hypernova import HypernovaService
+from django_react_templatetags.ssr.stub import StubRenderServer
+from django_react_templatetags.templatetags.react import (
+    load_from_ssr,
+    load_many_from_ssr,
+)
+from django_react_templatetags.tests.demosite.models import Movie
+
+ROUNDS = 5
+MIN_TIME = 0.1
+REGRESSION_THRESHOLD = 1.1
+
+TAG_COUNTS = (1, 10, 100, 1000)
+PROPS_SIZES = (10, 100, 1000)
+PROPS_DEPTHS = (1, 10, 50)
+REPRESENTATION_COUNTS = (10, 100, 1000)
+PRINT_COUNTS = (10, 100)
+SSR_COMPONENT_COUNT = 10
+FAILURES = {
+    "errors": {"error_rate": 1},
+    "timeouts": {"timeout_rate": 1, "timeout": 1},
+}
+
+benchmarks = []
+
+
+def benchmark(name, params=(None,), settings=None, ssr=False, stub=None):
+    """
+    Registers a setup function, it is called once per param and returns
+    the callable that is timed. settings and stub return the settings and
+    stub render host options used for a param while it is timed,
+    REACT_RENDER_HOST is only set for ssr benchmarks.
+    """
+
+    def decorator(fn):
+        for param in params:
+            label = name if param is None else "{}[{}]".format(name, param)
+            overrides = settings(param) if settings else {}
+            options = stub(param) if stub else {}
+            benchmarks.append((label, fn, param, overrides, ssr, options))
+        return fn
+
+    return decorator
+
+
+def get_context(**kwargs):
+    return Context(
+        {"request": RequestFactory().get("/"), "REACT_COMPONENTS": [], **kwargs}
+    )
+
+
+def get_nested_props(depth):
+    props = {"id": 0, "name": "Leaf"}
+    for x in range(depth):
+        props = {"id": x, "name": "Level {}".format(x), "children": [props]}
+
+    return props
+
+
+@benchmark("render_tags", TAG_COUNTS)
+def bench_render_tags(count):
+    template = Template(
+        "{% load react %}"
+        "{% for item in items %}"
+        '{% react_render component="Item" props=item %}'
+        "{% endfor %}"
+    )
+    items = [{"id": x, "name": "Item {}".format(x)} for x in range(count)]
+
+    return lambda: template.render(get_context(items=items))
+
+
+@benchmark("props_size", PROPS_SIZES)
+def bench_props_size(size):
+    props = {
+        "items": [
+            {"id": x, "name": "Item {}".format(x), "tags": ["a", "b", "c"]}
+            for x in range(size)
+        ]
+    }
+    context = get_context()
+
+    return lambda: encoders.json_dumps(props, context)
+
+
+@benchmark("props_depth", PROPS_DEPTHS)
+def bench_props_depth(depth):
+    props = get_nested_props(depth)
+    context = get_context()
+
+    return lambda: encoders.json_dumps(props, context)
+
+
+@benchmark("representations", REPRESENTATION_COUNTS)
+def bench_representations(count):
+    props = {
+        "movies": [
+            Movie(pk=x, title="Night On Earth {}".format(x), year=1991)
+            for x in range(count)
+        ]
+    }
+
+    return lambda: encoders.json_dumps(props, get_context())
+
+
+@benchmark("react_print", PRINT_COUNTS)
+def bench_react_print(count):
+    template = Template(
+        "{% load react %}"
+        "{% for item in items %}"
+        '{% react_render component="Item" props=item %}'
+        "{% endfor %}"
+        "{% react_print %}"
+    )
+    items = [{"id": x, "name": "Item {}".format(x)} for x in range(count)]
+
+    return lambda: template.render(get_context(items=items))
+
+
+def get_ssr_components(count):
+    return [
+        ReactComponent(
+            identifier="Item_{}".format(x),
+            data_identifier="Item_{}_data".format(x),
+            name="Item",
+            json=json.dumps({"id": x}),
+        )
+        for x in range(count)
+    ]
+
+
+@benchmark("ssr_single", ssr=True)
+def bench_ssr_single(param):
+    component = get_ssr_components(1)[0]
+    return lambda: load_from_ssr(component)
+
+
+@benchmark(
+    "ssr_many_workers",
+    (1, SSR_COMPONENT_COUNT),
+    settings=lambda workers: {"REACT_SSR_MAX_WORKERS": workers},
+    ssr=True,
+)
+def bench_ssr_many(workers):
+    components = get_ssr_components(SSR_COMPONENT_COUNT)
+    return lambda: load_many_from_ssr(components)
+
+
+@benchmark("ssr_hypernova_batch", (SSR_COMPONENT_COUNT,), ssr=True)
+def bench_ssr_hypernova_batch(count):
+    components = get_ssr_components(count)
+    return lambda: HypernovaService().load_many(components)
+
+
+@benchmark(
+    "ssr_failing_host",
+    ("errors", "timeouts"),
+    settings=lambda param: {"REACT_RENDER_TIMEOUT": 0.05},
+    ssr=True,
+    stub=lambda param: FAILURES[param],
+)
+def bench_ssr_failing_host(param):
+    components = get_ssr_components(SSR_COMPONENT_COUNT)
+    return lambda: load_many_from_ssr(components)
+
+
+@benchmark(
+    "ssr_failing_host_breaker",
+    ("errors", "timeouts"),
+    settings=lambda param: {
+        "REACT_RENDER_TIMEOUT": 0.05,
+        "REACT_SSR_BREAKER_THRESHOLD": 1,
+    },
+    ssr=True,
+    stub=lambda param: FAILURES[param],
+)
+def bench_ssr_failing_host_breaker(param):
+    return bench_ssr_failing_host(param)
+
+
+def time_benchmark(fn):
+    timer = timeit.Timer(fn)
+    number = 1
+    while timer.timeit(number) < MIN_TIME:
+        number *= 2
+
+    times = [t / number for t in timer.repeat(repeat=ROUNDS, number=number)]
+    return {
+        "best_ms": min(times) * 1000,
+        "median_ms": statistics.median(times) * 1000,
+        "number": number,
+        "rounds": ROUNDS,
+    }
+
+
+def get_meta(latency):
+    return {
+        "version": django_react_templatetags.__version__,
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "platform": platform.platform(),
+        "ssr_latency_ms": latency * 1000,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def run(pattern=None, latency=0.005, out=sys.stdout):
+    """
+    Runs the benchmarks whose name contains pattern and returns the results,
+    SSR benchmarks render against a local stub server.
+    """
+
+    results = {}
+    logging.disable(logging.CRITICAL)
+
+    try:
+        with StubRenderServer(latency=latency) as server, override_settings(
+            REACT_SSR_CACHE_TIMEOUT=None,
+        ):
+            for name, setup, param, overrides, ssr, stub in benchmarks:
+                if pattern and pattern not in name:
+                    continue
+
+                server.configure(
+                    **{"latency": latency, "error_rate": 0, "timeout_rate": 0, **stub}
+                )
+                overrides = {
+                    "REACT_RENDER_HOST": server.url if ssr else None,
+                    **overrides,
+                }
+                with override_settings(**overrides):
+                    results[name] = time_benchmark(setup(param))
+
+                out.write("{:<36} {:>12.3f}ms\n".format(name, results[name]["best_ms"]))
+    finally:
+        ssr_session.close_session()
+        logging.disable(logging.NOTSET)
+
+    return {"meta": get_meta(latency), "results": results}
+
+
+def compare(results, baseline, out=sys.stdout):
+    """
+    Prints the change of each benchmark against a previous run, returns the
+    names of those that got slower than REGRESSION_THRESHOLD.
+    """
+
+    regressions = []
+    out.write(
+        "\ncompared to {} ({})\n".format(
+            baseline["meta"]["version"], baseline["meta"]["time"]
+        )
+    )
+
+    for name, result in results["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+
+        ratio = result["best_ms"] / previous["best_ms"]
+        if ratio > REGRESSION_THRESHOLD:
+            regressions.append(name)
+
+        out.write(
+            "{:<36} {:>12.3f}ms {:>12.3f}ms {:>7.2f}x{}\n".format(
+                name,
+                previous["best_ms"],
+                result["best_ms"],
+                ratio,
+                " slower" if ratio > REGRESSION_THRESHOLD else "",
+            )
+        )
+
+    return regressions
@@ -1,6 +1,7 @@
 from __future__ import unicode_literals
 
 from django.db import models
+from django.db.models import prefetch_related_objects
 
 from django_react_templatetags.mixins import RepresentationMixin
 
@@ -16,6 +17,15 @@ class Person(RepresentationMixin, models.Model):
         }
 
 
+class Director(Person):
+    class Meta:
+        proxy = True
+
+
+class Musician(Person):
+    instrument = models.CharField(max_length=255)
+
+
 class Movie(RepresentationMixin, models.Model):
     title = models.CharField(max_length=255)
     year = models.IntegerField()
@@ -27,6 +37,9 @@ class Movie(RepresentationMixin, models.Model):
             "current_path": context["request"].path,
         }
 
+    def get_react_representation_cache_vary(self, context=None):
+        return context["request"].path
+
 
 class MovieWithContext(RepresentationMixin, models.Model):
     title = models.CharField(max_length=255)
@@ -38,3 +51,19 @@ class MovieWithContext(RepresentationMixin, models.Model):
             "year": self.year,
             "search_term": context["search_term"],
         }
+
+
+class Album(RepresentationMixin, models.Model):
+    title = models.CharField(max_length=255)
+    artist = models.ForeignKey(Person, on_delete=models.CASCADE)
+
+    def to_react_representation(self, context={}):
+        return {
+            "title": self.title,
+            "artist": self.artist.to_react_representation(context),
+        }
+
+    @classmethod
+    def to_react_representations(cls, objs, context=None):
+        prefetch_related_objects(objs, "artist")
+        return [obj.to_react_representation(context) for obj in objs]
@@ -1,11 +1,34 @@
-from django.urls import path
+from django.urls import include, path
+from django.views.decorators.cache import cache_page
 
 from django_react_templatetags.tests.demosite import views
 
 urlpatterns = [
+    path("react/", include("django_react_templatetags.urls")),
     path(
         "static-react-view",
         views.StaticReactView.as_view(),
         name="static_react_view",
     ),
+    path(
+        "multiple-react-view",
+        views.MultipleReactView.as_view(),
+        name="multiple_react_view",
+    ),
+    path(
+        "cached-react-view",
+        cache_page(60)(views.MultipleReactView.as_view()),
+        name="cached_react_view",
+    ),
+    path(
+        "streaming-react-view",
+        views.streaming_react_view,
+        name="streaming_react_view",
+    ),
+    path("json-react-view", views.json_react_view, name="json_react_view"),
+    path(
+        "streaming-template-react-view",
+        views.streaming_template_react_view,
+        name="streaming_template_react_view",
+    ),
 ]
@@ -1,5 +1,9 @@
+from django.http import JsonResponse, StreamingHttpResponse
+from django.template.loader import render_to_string
 from django.views.generic import TemplateView
 
+from django_react_templatetags.streaming import stream_template
+
 
 class StaticReactView(TemplateView):
     template_name = "static-react.html"
@@ -11,3 +15,34 @@ class StaticReactView(TemplateView):
             "recent_album": "Bad as me",
         }
         return context
+
+
+class MultipleReactView(StaticReactView):
+    template_name = "multiple-react.html"
+
+
+def streaming_react_view(request):
+    catalog = {
+        "items": [{"id": x, "name": "<Item {}>".format(x)} for x in range(1000)],
+    }
+    return StreamingHttpResponse(
+        stream_template(
+            "streaming-react.html",
+            {"catalog": catalog, "props": {"artist": "Tom Waits"}},
+            request,
+        )
+    )
+
+
+def json_react_view(request):
+    html = render_to_string(
+        "multiple-react.html", {"props": {"artist": "Tom Waits"}}, request
+    )
+    return JsonResponse({"html": html})
+
+
+def streaming_template_react_view(request):
+    html = render_to_string(
+        "multiple-react.html", {"props": {"artist": "Tom Waits"}}, request
+    )
+    return StreamingHttpResponse([html])
@@ -0,0 +1,175 @@
+"""
+Benchmarks for the hot paths of the template tags, they are skipped unless
+the REACT_BENCHMARKS environment variable is set.
+
+    REACT_BENCHMARKS=1 python runtests.py django_react_templatetags.tests.test_benchmarks
+"""
+
+import json
+import os
+import timeit
+import unittest
+from io import StringIO
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+from django.test.client import RequestFactory
+
+from django_react_templatetags import encoders
+from django_react_templatetags.templatetags.react import ReactTagManager
+from django_react_templatetags.tests import benchmarks
+from django_react_templatetags.tests.demosite.models import Movie
+
+ROUNDS = 5
+
+
+def get_large_props(size=500):
+    return {
+        "movies": [
+            Movie(title="Night On Earth {}".format(x), year=1991) for x in range(size)
+        ],
+        "items": [
+            {"id": x, "name": "Item {}".format(x), "tags": ["a", "b", "c"]}
+            for x in range(size)
+        ],
+    }
+
+
+class RenderTimeTagManager(ReactTagManager):
+    "Resolves every argument on render, as before precomputation"
+
+    def precompute(self):
+        self.qualified_name = None
+        self.static_identifier = None
+        self.placeholder_start = None
+        self.constant_json = None
+
+
+def best_of(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=ROUNDS)) / number
+
+
+@unittest.skipUnless(os.environ.get("REACT_BENCHMARKS"), "REACT_BENCHMARKS not set")
+class PropsEncodingBenchmark(SimpleTestCase):
+    def test_large_props(self):
+        context = Context({"request": RequestFactory().get("/")})
+        props = get_large_props()
+
+        json_time = best_of(lambda: encoders.json_dumps(props, context), 20)
+        orjson_time = best_of(lambda: encoders.orjson_dumps(props, context), 20)
+
+        print(
+            "\nprops json: {:.3f}ms, orjson: {:.3f}ms ({:.1f}x)".format(
+                json_time * 1000, orjson_time * 1000, json_time / orjson_time
+            )
+        )
+        self.assertLess(orjson_time, json_time)
+
+    def test_many_small_components(self):
+        context = Context({"request": RequestFactory().get("/")})
+        props = {"title": "Night On Earth", "year": 1991}
+
+        def per_class():
+            cls = encoders.json_encoder_cls_factory(context)
+            return json.dumps(props, cls=cls)
+
+        factory_time = best_of(per_class, 2000)
+        instance_time = best_of(lambda: encoders.json_dumps(props, context), 2000)
+
+        print(
+            "\nencoder per component, class factory: {:.1f}us, "
+            "context argument: {:.1f}us".format(factory_time * 1e6, instance_time * 1e6)
+        )
+        self.assertLess(instance_time, factory_time)
+
+
+@unittest.skipUnless(os.environ.get("REACT_BENCHMARKS"), "REACT_BENCHMARKS not set")
+class ReactPrintBenchmark(SimpleTestCase):
+    def test_many_components(self):
+        template = Template(
+            "{% load react %}"
+            "{% for item in items %}"
+            '{% react_render component="Item" props=item %}'
+            "{% endfor %}"
+            "{% react_print %}"
+        )
+        items = [{"id": x, "name": "Item {}".format(x)} for x in range(40)]
+
+        def render():
+            return template.render(Context({"items": items, "REACT_COMPONENTS": []}))
+
+        template_time = best_of(render, 50)
+        with override_settings(REACT_PRINT_MODE="manifest"):
+            manifest_time = best_of(render, 50)
+
+        print(
+            "\n40 components, template: {:.2f}ms, manifest: {:.2f}ms".format(
+                template_time * 1000, manifest_time * 1000
+            )
+        )
+        self.assertLess(manifest_time, template_time)
+
+
+@unittest.skipUnless(os.environ.get("REACT_BENCHMARKS"), "REACT_BENCHMARKS not set")
+class ReactRenderBenchmark(SimpleTestCase):
+    TAG = (
+        "{% load react %}"
+        '{% react_render component="Menu" identifier="menu" class="nav" '
+        'prop_title="Rain Dogs" prop_year=1985 %}'
+    )
+
+    def time_tag(self):
+        template = Template(self.TAG)
+        return best_of(lambda: template.render(Context({"REACT_COMPONENTS": []})), 2000)
+
+    def test_literal_tag(self):
+        with override_settings(
+            REACT_RENDER_TAG_MANAGER=(
+                "django_react_templatetags.tests.test_benchmarks.RenderTimeTagManager"
+            )
+        ):
+            before = self.time_tag()
+
+        after = self.time_tag()
+
+        print(
+            "\nliteral react_render, resolved on render: {:.1f}us, "
+            "precomputed: {:.1f}us".format(before * 1e6, after * 1e6)
+        )
+        self.assertLess(after, before)
+
+
+class BenchmarkSuiteTest(SimpleTestCase):
+    def test_results_are_recorded(self):
+        with mock.patch.object(benchmarks, "MIN_TIME", 0):
+            results = benchmarks.run("props_depth[1]", out=StringIO())
+
+        self.assertEqual(list(results["results"]), ["props_depth[1]"])
+        self.assertEqual(
+            set(results["results"]["props_depth[1]"]),
+            {"best_ms", "median_ms", "number", "rounds"},
+        )
+        self.assertEqual(results["meta"]["ssr_latency_ms"], 5)
+        json.dumps(results)
+
+    def test_compare_reports_regressions(self):
+        baseline = {
+            "meta": {"version": "8.0.0", "time": ""},
+            "results": {"a": {"best_ms": 1.0}, "b": {"best_ms": 1.0}},
+        }
+        results = {
+            "results": {
+                "a": {"best_ms": 1.05},
+                "b": {"best_ms": 2.0},
+                "c": {"best_ms": 1.0},
+            }
+        }
+
+        out = StringIO()
+        self.assertEqual(benchmarks.compare(results, baseline, out=out), ["b"])
+        self.assertIn("2.00x slower", out.getvalue())
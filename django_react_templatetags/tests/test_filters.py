@@ -82,6 +82,41 @@ class ReactIncludeComponentTest(SimpleTestCase):
         self.assertTrue("React.createElement(Component" in out)
         self.assertEqual(len(self.mocked_context.get("REACT_COMPONENTS")), 0)
 
+    def test_print_tag_with_plain_dict_component(self):
+        "Components appended to REACT_COMPONENTS as dicts get a data script"
+
+        self.mocked_context["REACT_COMPONENTS"].append(
+            {
+                "identifier": "Plain_1",
+                "data_identifier": "Plain_1_data",
+                "name": "Plain",
+                "json": '{"x": 1}',
+                "json_obj": {"x": 1},
+            }
+        )
+
+        out = Template("{% load react %}{% react_print %}").render(self.mocked_context)
+
+        self.assertTrue(
+            '<script id="Plain_1_data" type="application/json">{"x": 1}</script>' in out
+        )
+
+    def test_print_tag_with_json_obj_only_component(self):
+        "Dict components from before json was added still print their props"
+
+        self.mocked_context["REACT_COMPONENTS"].append(
+            {
+                "identifier": "Plain_1",
+                "data_identifier": "Plain_1_data",
+                "name": "Plain",
+                "json_obj": {"x": 1},
+            }
+        )
+
+        out = Template("{% load react %}{% react_print %}").render(self.mocked_context)
+
+        self.assertTrue('type="application/json">{"x": 1}</script>' in out)
+
     @override_settings(REACT_COMPONENT_PREFIX="ReactNamespace.")
     def test_print_tag_prefix(self):
         "Makes sure react_print outputs ReactDOM.render with react prefix"
@@ -292,3 +327,55 @@ class ReactIncludeComponentTest(SimpleTestCase):
         self.assertFalse(
             out.startswith('<script id="my_id_data" type="application/json"')
         )
+
+    def test_data_script_is_escaped(self):
+        self.mocked_context["component_data"] = {"html": "</script><b>&</b>"}
+
+        out = Template(
+            "{% load react %}"
+            '{% react_render component="Component" identifier="my_id" data=component_data %}'
+            "{% react_print %}"
+        ).render(self.mocked_context)
+
+        self.assertIn(
+            '<script id="my_id_data" type="application/json">'
+            '{"html": "\\u003C/script\\u003E\\u003Cb\\u003E\\u0026\\u003C/b\\u003E"}'
+            "</script>",
+            out,
+        )
+
+    def test_props_are_only_parsed_when_read(self):
+        self.mocked_context["component_data"] = {"name": "Tom Waits"}
+
+        Template(
+            "{% load react %}"
+            '{% react_render component="Component" data=component_data %}'
+        ).render(self.mocked_context)
+
+        component = self.mocked_context["REACT_COMPONENTS"][0]
+        self.assertNotIn("json_obj", component)
+
+        out = Template("{{ component.json_obj.name }}").render(
+            Context({"component": component})
+        )
+        self.assertEqual(out, "Tom Waits")
+        self.assertEqual(component["json_obj"], {"name": "Tom Waits"})
+
+    def test_identical_props_share_data_script(self):
+        self.mocked_context["config"] = {"locale": "sv"}
+
+        out = Template(
+            "{% load react %}"
+            '{% react_render component="Header" identifier="header" props=config %}'
+            '{% react_render component="Footer" identifier="footer" props=config %}'
+            '{% react_render component="Menu" identifier="menu" prop_locale="en" %}'
+            "{% react_print %}"
+        ).render(self.mocked_context)
+
+        self.assertEqual(out.count('{"locale": "sv"}'), 1)
+        self.assertIn('<script id="header_data" type="application/json">', out)
+        self.assertNotIn('<script id="footer_data"', out)
+        self.assertIn('<script id="menu_data" type="application/json">', out)
+        self.assertEqual(out.count('document.getElementById("header_data")'), 2)
+        self.assertEqual(out.count('document.getElementById("menu_data")'), 1)
+        self.assertIn("document.getElementById('footer')", out)
@@ -0,0 +1,120 @@
+import datetime
+import decimal
+import json
+import uuid
+
+from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+from django.test.client import RequestFactory
+from django.utils.translation import gettext_lazy
+
+from django_react_templatetags import encoders
+from django_react_templatetags.tests.demosite.models import Movie, Person
+
+
+def get_props():
+    return {
+        "person": Person(first_name="Tom", last_name="Waits"),
+        "movies": [Movie(title="Night On Earth", year=1991)],
+        "label": gettext_lazy("Name"),
+        "price": decimal.Decimal("9.90"),
+        "created": datetime.datetime(2020, 1, 2, 3, 4, 5, 123456),
+        "day": datetime.date(2020, 1, 2),
+        "duration": datetime.timedelta(minutes=5),
+        "id": uuid.UUID("3e0f2b0c-7a3f-4d1e-9d6c-0a4b1c2d3e4f"),
+        "counts": {1: "one", 2: "two"},
+        "title": "ÅÄÖ",
+    }
+
+
+class ReactRepresentationJSONEncoderTest(SimpleTestCase):
+    def setUp(self):
+        self.context = Context({"request": RequestFactory().get("/random")})
+
+    def test_context_is_passed_as_argument(self):
+        out = json.dumps(
+            Movie(title="Night On Earth", year=1991),
+            cls=encoders.ReactRepresentationJSONEncoder,
+            context=self.context,
+        )
+
+        self.assertEqual(json.loads(out)["current_path"], "/random")
+
+    def test_representation_without_context(self):
+        out = json.dumps(
+            Person(first_name="Tom", last_name="Waits"),
+            cls=encoders.ReactRepresentationJSONEncoder,
+        )
+
+        self.assertEqual(json.loads(out), {"first_name": "Tom", "last_name": "Waits"})
+
+    def test_cls_factory_is_supported(self):
+        out = json.dumps(
+            Movie(title="Night On Earth", year=1991),
+            cls=encoders.json_encoder_cls_factory(self.context),
+        )
+
+        self.assertEqual(json.loads(out)["current_path"], "/random")
+
+
+class JSONBackendTest(SimpleTestCase):
+    def setUp(self):
+        self.context = Context({"request": RequestFactory().get("/random")})
+
+    def test_default_backend_is_json(self):
+        self.assertIs(encoders.get_json_backend(), encoders.json_dumps)
+
+    @override_settings(REACT_JSON_BACKEND="orjson")
+    def test_builtin_backend_by_name(self):
+        self.assertIs(encoders.get_json_backend(), encoders.orjson_dumps)
+
+    @override_settings(
+        REACT_JSON_BACKEND="django_react_templatetags.encoders.json_dumps"
+    )
+    def test_backend_by_path(self):
+        self.assertIs(encoders.get_json_backend(), encoders.json_dumps)
+
+    def test_orjson_matches_json(self):
+        expected = json.loads(encoders.json_dumps(get_props(), self.context))
+        out = json.loads(encoders.orjson_dumps(get_props(), self.context))
+
+        self.assertEqual(out, expected)
+        self.assertEqual(out["movies"][0]["current_path"], "/random")
+        self.assertEqual(out["created"], "2020-01-02T03:04:05.123")
+        self.assertEqual(out["price"], "9.90")
+        self.assertEqual(out["counts"], {"1": "one", "2": "two"})
+
+    def test_orjson_falls_back_to_json_for_big_integers(self):
+        props = {"big": 2**64, "person": Person(first_name="Tom", last_name="Waits")}
+
+        out = encoders.orjson_dumps(props, self.context)
+
+        self.assertEqual(out, encoders.json_dumps(props, self.context))
+        self.assertEqual(json.loads(out)["big"], 2**64)
+
+    def test_orjson_raises_on_unsupported_types(self):
+        with self.assertRaises(TypeError):
+            encoders.orjson_dumps({"obj": object()}, self.context)
+
+    def test_missing_orjson_raises_improperly_configured(self):
+        orjson = encoders.orjson
+        encoders.orjson = None
+
+        try:
+            with self.assertRaises(ImproperlyConfigured):
+                encoders.orjson_dumps({}, self.context)
+        finally:
+            encoders.orjson = orjson
+
+    @override_settings(REACT_JSON_BACKEND="orjson")
+    def test_template_tag_uses_backend(self):
+        self.context["component_data"] = {"name": "Tom Waits"}
+
+        out = Template(
+            "{% load react %}"
+            '{% react_render component="Component" data=component_data %}'
+            "{% react_print %}"
+        ).render(self.context)
+
+        self.assertIn('{"name":"Tom Waits"}', out)
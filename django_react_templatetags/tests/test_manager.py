@@ -1,5 +1,6 @@
 from django.template import Context, Template
 from django.test import SimpleTestCase, override_settings
+from django.utils import translation
 
 from django_react_templatetags.templatetags.react import (
     ReactTagManager,
@@ -32,3 +33,113 @@ class ReactIncludeComponentTest(SimpleTestCase):
         ).render(self.mocked_context)
 
         self.assertEqual("Test", out)
+
+    @override_settings(
+        REACT_RENDER_TAG_MANAGER="django_react_templatetags.tests.test_manager.PositionalArgsTagManager"
+    )
+    def test_tag_manager_passing_positional_args(self):
+        "Subclasses can pass the original arguments to super() positionally"
+
+        out = Template(
+            "{% load react %}"
+            '{% react_render component="Component" no_placeholder=1 %}'
+        ).render(self.mocked_context)
+
+        self.assertEqual("", out)
+        self.assertEqual(len(self.mocked_context["REACT_COMPONENTS"]), 1)
+
+
+class PositionalArgsTagManager(ReactTagManager):
+    def __init__(
+        self,
+        identifier,
+        component,
+        data=None,
+        css_class=None,
+        props=None,
+        ssr_context=None,
+        no_placeholder=None,
+        **kwargs
+    ):
+        super().__init__(
+            identifier, component, data, css_class, props, ssr_context, no_placeholder
+        )
+
+
+class PrefixedNameTagManager(ReactTagManager):
+    def get_qualified_name(self, context):
+        return "Prefixed{}".format(super().get_qualified_name(context))
+
+
+class PrecomputeTest(SimpleTestCase):
+    def get_node(self, tag):
+        return Template("{% load react %}" + tag).nodelist[-1]
+
+    def test_literal_arguments_are_precomputed(self):
+        node = self.get_node(
+            '{% react_render component="Menu" identifier="menu" class="nav" '
+            'prop_title="Rain Dogs" prop_year=1985 %}'
+        )
+
+        self.assertEqual(node.qualified_name, "Menu")
+        self.assertEqual(node.static_identifier, "menu")
+        self.assertEqual(node.placeholder_start, '<div id="menu" class="nav">')
+        self.assertEqual(node.constant_json, '{"title": "Rain Dogs", "year": 1985}')
+
+    def test_variable_arguments_are_resolved_on_render(self):
+        node = self.get_node(
+            "{% react_render component=name identifier=id props=data %}"
+        )
+
+        self.assertIsNone(node.qualified_name)
+        self.assertIsNone(node.static_identifier)
+        self.assertIsNone(node.placeholder_start)
+        self.assertIsNone(node.constant_json)
+
+    def test_translated_literals_are_resolved_on_render(self):
+        template = Template(
+            "{% load react %}"
+            '{% react_render component="Menu" prop_title=_("Yes") %}'
+            "{% react_print %}"
+        )
+
+        self.assertIsNone(template.nodelist[-2].constant_json)
+        self.assertFalse(template.nodelist[-2].static_ssr)
+        with translation.override("sv"):
+            out = template.render(Context({"REACT_COMPONENTS": []}))
+
+        self.assertIn('{"title": "Ja"}', out)
+
+    def test_precomputed_output_matches(self):
+        context = Context(
+            {"REACT_COMPONENTS": [], "name": "Menu", "id": "menu", "nav": "nav"}
+        )
+
+        literal = Template(
+            "{% load react %}"
+            '{% react_render component="Menu" identifier="menu" class="nav" '
+            "prop_year=1985 %}{% react_print %}"
+        ).render(context)
+        variable = Template(
+            "{% load react %}"
+            "{% react_render component=name identifier=id class=nav "
+            "prop_year=1985 %}{% react_print %}"
+        ).render(context)
+
+        self.assertEqual(literal, variable)
+
+    @override_settings(
+        REACT_RENDER_TAG_MANAGER="django_react_templatetags.tests.test_manager.PrefixedNameTagManager"
+    )
+    def test_overridden_methods_are_not_precomputed(self):
+        node = self.get_node('{% react_render component="Menu" identifier="menu" %}')
+
+        self.assertIsNone(node.qualified_name)
+        self.assertEqual(node.static_identifier, "menu")
+        self.assertIn(
+            "React.createElement(PrefixedMenu",
+            Template(
+                "{% load react %}"
+                '{% react_render component="Menu" %}{% react_print %}'
+            ).render(Context({"REACT_COMPONENTS": []})),
+        )
@@ -0,0 +1,127 @@
+import json
+import re
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+from django.test.client import RequestFactory
+
+from django_react_templatetags.tests.mock_response import MockResponse
+
+MANIFEST_RE = re.compile(
+    r'<script id="(react_manifest_[0-9a-f]{32})" type="application/json">(.*?)</script>'
+)
+
+
+def get_manifest(out):
+    match = MANIFEST_RE.search(out)
+    return match.group(1), json.loads(match.group(2))
+
+
+@override_settings(REACT_PRINT_MODE="manifest")
+class ManifestTest(SimpleTestCase):
+    def setUp(self):
+        self.context = Context(
+            {
+                "config": {"locale": "sv", "html": "</script>"},
+                "request": RequestFactory().get("/"),
+            }
+        )
+
+    def render(self, tags):
+        return Template("{% load react %}" + tags + "{% react_print %}").render(
+            self.context
+        )
+
+    def test_one_manifest_and_one_bootstrap_script(self):
+        out = self.render(
+            '{% react_render component="Header" identifier="header" props=config %}'
+            '{% react_render component="Menu" identifier="menu" prop_open=1 %}'
+        )
+
+        manifest_id, manifest = get_manifest(out)
+
+        self.assertEqual(out.count("<script"), 2)
+        self.assertIn('document.getElementById("{}")'.format(manifest_id), out)
+        self.assertEqual(
+            manifest["components"],
+            [
+                {"id": "header", "name": "Header", "hydrate": False, "data": 0},
+                {"id": "menu", "name": "Menu", "hydrate": False, "data": 1},
+            ],
+        )
+        self.assertEqual(
+            manifest["data"],
+            [{"locale": "sv", "html": "</script>"}, {"open": 1}],
+        )
+
+    def test_plain_dict_components_are_included(self):
+        self.context["REACT_COMPONENTS"] = [
+            {
+                "identifier": "plain",
+                "data_identifier": "plain_data",
+                "name": "Plain",
+                "json": '{"x": 1}',
+            }
+        ]
+
+        _, manifest = get_manifest(self.render(""))
+
+        self.assertEqual(manifest["data"], [{"x": 1}])
+
+    def test_props_are_escaped(self):
+        out = self.render('{% react_render component="Header" props=config %}')
+
+        self.assertIn('"html": "\\u003C/script\\u003E"', out)
+
+    def test_identical_props_are_stored_once(self):
+        out = self.render(
+            '{% react_render component="Header" props=config %}'
+            '{% react_render component="Footer" props=config %}'
+        )
+
+        _, manifest = get_manifest(out)
+
+        self.assertEqual(len(manifest["data"]), 1)
+        self.assertEqual([x["data"] for x in manifest["components"]], [0, 0])
+
+    def test_component_lookup_references_components(self):
+        out = self.render(
+            '{% react_render component="Header" %}'
+            '{% react_render component="Header" %}'
+            '{% react_render component="Cookie.Menu" %}'
+        )
+
+        self.assertIn(
+            'var components = {"Header": Header, "Cookie.Menu": Cookie.Menu};', out
+        )
+
+    def test_no_components_prints_nothing(self):
+        self.assertEqual(self.render(""), "")
+
+    @override_settings(REACT_PROPS_URL_MIN_SIZE=1)
+    def test_props_url_is_included(self):
+        cache.clear()
+        out = self.render('{% react_render component="Header" props=config %}')
+
+        _, manifest = get_manifest(out)
+
+        self.assertEqual(manifest["data"], [])
+        self.assertRegex(
+            manifest["components"][0]["url"], r"^/react/props/[0-9a-f]{64}\.json$"
+        )
+
+    @override_settings(REACT_RENDER_HOST="http://react-service.dev")
+    @mock.patch("requests.Session.post")
+    def test_ssr_components_are_hydrated(self, mocked):
+        mocked.return_value = MockResponse("<h1>Header</h1>", 200)
+
+        out = self.render('{% react_render component="Header" %}')
+
+        _, manifest = get_manifest(out)
+        self.assertTrue(manifest["components"][0]["hydrate"])
@@ -0,0 +1,138 @@
+import json
+import re
+
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from django_react_templatetags.checks import check_props_cache
+
+PROPS_URL_RE = re.compile(r'fetch\("(/react/props/[0-9a-f]{64}\.json)"\)')
+
+
+@override_settings(REACT_PROPS_URL_MIN_SIZE=100)
+class PropsUrlTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.context = Context(
+            {
+                "small": {"artist": "Tom Waits"},
+                "large": {"albums": ["Rain Dogs"] * 20},
+            }
+        )
+
+    def render(self, tag_args):
+        return Template(
+            "{% load react %}"
+            '{% react_render component="Component" identifier="app" '
+            + tag_args
+            + " %}{% react_print %}"
+        ).render(self.context)
+
+    def test_small_props_are_inlined(self):
+        out = self.render("props=small")
+
+        self.assertIn('<script id="app_data" type="application/json">', out)
+        self.assertNotIn("fetch(", out)
+
+    def test_large_props_are_served_from_url(self):
+        out = self.render("props=large")
+
+        self.assertNotIn('<script id="app_data"', out)
+        self.assertIn("React.createElement(Component, props)", out)
+
+        url = PROPS_URL_RE.search(out).group(1)
+        resp = self.client.get(url)
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["Content-Type"], "application/json")
+        self.assertEqual(json.loads(resp.content), {"albums": ["Rain Dogs"] * 20})
+        self.assertIn("immutable", resp["Cache-Control"])
+        self.assertIn("public", resp["Cache-Control"])
+
+    def test_etag_returns_not_modified(self):
+        url = PROPS_URL_RE.search(self.render("props=large")).group(1)
+        etag = self.client.get(url)["ETag"]
+
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(resp.status_code, 304)
+
+    def test_identical_props_share_url(self):
+        first = PROPS_URL_RE.search(self.render("props=large")).group(1)
+        second = PROPS_URL_RE.search(self.render("props=large")).group(1)
+
+        self.assertEqual(first, second)
+
+    def test_tag_argument_overrides_size(self):
+        self.assertNotIn("fetch(", self.render("props=large props_url=0"))
+        self.assertIn("fetch(", self.render("props=small props_url=1"))
+
+    def test_literal_props_are_served_from_url(self):
+        self.context["title"] = "Sale"
+
+        literal = self.render('prop_title="Sale" props_url=1')
+        variable = self.render("prop_title=title props_url=1")
+
+        self.assertIn("fetch(", literal)
+        self.assertEqual(
+            PROPS_URL_RE.search(literal).group(1),
+            PROPS_URL_RE.search(variable).group(1),
+        )
+
+    def test_props_url_component_is_not_a_data_source(self):
+        out = Template(
+            "{% load react %}"
+            '{% react_render component="Header" identifier="a" props=small '
+            "props_url=1 %}"
+            '{% react_render component="Footer" identifier="b" props=small '
+            "props_url=0 %}"
+            "{% react_print %}"
+        ).render(self.context)
+
+        self.assertIn("fetch(", out)
+        self.assertIn('<script id="b_data" type="application/json">', out)
+        self.assertIn('document.getElementById("b_data")', out)
+        self.assertNotIn('document.getElementById("a_data")', out)
+
+    def test_failed_fetch_is_reported(self):
+        out = self.render("props=large")
+
+        self.assertIn("if (!response.ok) {", out)
+        self.assertIn("console.error(error);", out)
+
+    def test_unknown_props_returns_404(self):
+        url = reverse("react:props", kwargs={"digest": "0" * 64})
+
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_only_safe_methods_are_allowed(self):
+        url = PROPS_URL_RE.search(self.render("props=large")).group(1)
+
+        self.assertEqual(self.client.post(url).status_code, 405)
+
+
+class PropsCacheCheckTest(SimpleTestCase):
+    @override_settings(REACT_PROPS_URL_MIN_SIZE=100)
+    def test_per_process_cache_is_reported(self):
+        errors = check_props_cache(None)
+
+        self.assertEqual([x.id for x in errors], ["django_react_templatetags.W001"])
+
+    @override_settings(
+        REACT_PROPS_URL_MIN_SIZE=100,
+        REACT_PROPS_CACHE_ALIAS="shared",
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "shared": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": "/tmp/react_props",
+            },
+        },
+    )
+    def test_shared_cache_is_not_reported(self):
+        self.assertEqual(check_props_cache(None), [])
+
+    def test_disabled_props_url_is_not_reported(self):
+        self.assertEqual(check_props_cache(None), [])
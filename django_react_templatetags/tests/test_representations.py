@@ -0,0 +1,306 @@
+import json
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.template import Context, Template
+from django.test import SimpleTestCase, TestCase
+from django.test.client import RequestFactory
+
+from django_react_templatetags import encoders, representations
+from django_react_templatetags.mixins import (
+    RepresentationMixin,
+    bulk_representation_classes,
+)
+from django_react_templatetags.tests.demosite.models import (
+    Album,
+    Director,
+    Movie,
+    Musician,
+    Person,
+)
+
+
+class CurrentUser(RepresentationMixin):
+    react_representation_cacheable = True
+
+    def __init__(self):
+        self.calls = 0
+
+    def to_react_representation(self, context=None):
+        self.calls += 1
+        return {"name": "Tom Waits"}
+
+
+class RepresentationMemoTest(SimpleTestCase):
+    def setUp(self):
+        representations.stats.reset()
+        self.request = RequestFactory().get("/")
+
+    def render(self, context):
+        return Template(
+            "{% load react %}"
+            '{% react_render component="Header" prop_user=user %}'
+            '{% react_render component="Menu" prop_user=user %}'
+            "{% react_print %}"
+        ).render(context)
+
+    def test_cacheable_representation_is_computed_once_per_request(self):
+        user = CurrentUser()
+
+        out = self.render(Context({"request": self.request, "user": user}))
+
+        self.assertIn('{"user": {"name": "Tom Waits"}}', out)
+        self.assertEqual(user.calls, 1)
+        self.assertEqual(representations.get_stats(), {"hits": 1, "misses": 1})
+
+    def test_memo_is_shared_by_templates_rendered_for_the_request(self):
+        user = CurrentUser()
+
+        self.render(Context({"request": self.request, "user": user}))
+        self.render(Context({"request": self.request, "user": user}))
+
+        self.assertEqual(user.calls, 1)
+
+    def test_memo_is_not_shared_between_requests(self):
+        user = CurrentUser()
+
+        self.render(Context({"request": self.request, "user": user}))
+        self.render(Context({"request": RequestFactory().get("/"), "user": user}))
+
+        self.assertEqual(user.calls, 2)
+
+    def test_representations_are_not_cached_by_default(self):
+        user = CurrentUser()
+
+        with mock.patch.object(CurrentUser, "react_representation_cacheable", False):
+            self.render(Context({"request": self.request, "user": user}))
+
+        self.assertEqual(user.calls, 2)
+        self.assertEqual(representations.get_stats(), {"hits": 0, "misses": 0})
+
+    def test_model_instances_are_keyed_on_label_and_pk(self):
+        first = Person(pk=1, first_name="Tom", last_name="Waits")
+        second = Person(pk=1, first_name="Tom", last_name="Waits")
+        memo = representations.RepresentationMemo()
+
+        memo.get_or_set(first, first.to_react_representation)
+        resp = memo.get_or_set(second, mock.Mock())
+
+        self.assertEqual(resp, {"first_name": "Tom", "last_name": "Waits"})
+        self.assertEqual(representations.get_key(first), ("demosite.Person", 1))
+
+    def test_unsaved_instances_are_keyed_on_identity(self):
+        first = Person(first_name="Tom", last_name="Waits")
+        second = Person(first_name="Tom", last_name="Waits")
+
+        self.assertNotEqual(
+            representations.get_key(first), representations.get_key(second)
+        )
+
+
+@mock.patch.object(Person, "react_representation_cache_timeout", 60)
+@mock.patch.object(Movie, "react_representation_cache_timeout", 60)
+class RepresentationCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        representations.cache_stats.reset()
+        self.person = Person(pk=1, first_name="Tom", last_name="Waits")
+
+    def represent(self, obj, path="/"):
+        context = Context({"request": RequestFactory().get(path)})
+        return representations.get_representation(obj, context)
+
+    def test_representation_is_cached_between_requests(self):
+        with mock.patch.object(
+            Person, "to_react_representation", return_value={"name": "Tom"}
+        ) as mocked:
+            self.represent(self.person)
+            resp = self.represent(self.person)
+
+        self.assertEqual(resp, {"name": "Tom"})
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(representations.get_cache_stats(), {"hits": 1, "misses": 1})
+
+    def test_save_invalidates_representation(self):
+        self.represent(self.person)
+
+        self.person.first_name = "Thomas"
+        post_save.send(sender=Person, instance=self.person, created=False)
+
+        self.assertEqual(self.represent(self.person)["first_name"], "Thomas")
+
+    def test_delete_invalidates_representation(self):
+        self.represent(self.person)
+
+        self.person.first_name = "Thomas"
+        post_delete.send(sender=Person, instance=self.person)
+
+        self.assertEqual(self.represent(self.person)["first_name"], "Thomas")
+
+    def test_proxy_save_invalidates_concrete_representation(self):
+        self.represent(self.person)
+
+        self.person.first_name = "Thomas"
+        director = Director(pk=1, first_name="Thomas", last_name="Waits")
+        post_save.send(sender=Director, instance=director, created=False)
+
+        self.assertEqual(self.represent(self.person)["first_name"], "Thomas")
+
+    def test_child_save_invalidates_parent_representation(self):
+        self.represent(self.person)
+
+        self.person.first_name = "Thomas"
+        musician = Musician(
+            id=1, person_ptr_id=1, first_name="Thomas", last_name="Waits"
+        )
+        post_save.send(sender=Musician, instance=musician, created=False)
+
+        self.assertEqual(self.represent(self.person)["first_name"], "Thomas")
+
+    def test_child_delete_invalidates_parent_representation(self):
+        self.represent(self.person)
+
+        self.person.first_name = "Thomas"
+        musician = Musician(
+            id=1, person_ptr_id=1, first_name="Thomas", last_name="Waits"
+        )
+        post_delete.send(sender=Musician, instance=musician)
+
+        self.assertEqual(self.represent(self.person)["first_name"], "Thomas")
+
+    def test_other_instances_are_not_invalidated(self):
+        other = Person(pk=2, first_name="Jim", last_name="Jarmusch")
+        self.represent(self.person)
+        self.represent(other)
+
+        post_save.send(sender=Person, instance=other, created=False)
+        self.represent(self.person)
+
+        self.assertEqual(representations.get_cache_stats(), {"hits": 1, "misses": 2})
+
+    def test_key_varies_on_context(self):
+        movie = Movie(pk=1, title="Night On Earth", year=1991)
+
+        self.assertEqual(self.represent(movie, "/a")["current_path"], "/a")
+        self.assertEqual(self.represent(movie, "/b")["current_path"], "/b")
+        self.assertEqual(self.represent(movie, "/a")["current_path"], "/a")
+        self.assertEqual(representations.get_cache_stats(), {"hits": 1, "misses": 2})
+
+    def test_lists_are_read_from_cache_in_bulk(self):
+        people = [Person(pk=x, first_name="Tom", last_name=str(x)) for x in range(1, 4)]
+        context = Context({"request": RequestFactory().get("/")})
+        encoders.json_dumps({"people": people}, context)
+
+        with mock.patch.object(
+            representations, "get_cached_representation"
+        ) as per_object, mock.patch.object(
+            Person, "to_react_representation"
+        ) as represent, mock.patch.object(
+            cache, "get_many", wraps=cache.get_many
+        ) as get_many:
+            out = encoders.json_dumps({"people": people}, context)
+
+        self.assertEqual(len(json.loads(out)["people"]), 3)
+        self.assertFalse(per_object.called)
+        self.assertFalse(represent.called)
+        self.assertEqual(get_many.call_count, 2)
+        self.assertEqual(representations.get_cache_stats(), {"hits": 3, "misses": 3})
+
+    def test_unsaved_instances_are_not_cached(self):
+        self.represent(Person(first_name="Tom", last_name="Waits"))
+
+        self.assertEqual(representations.get_cache_stats(), {"hits": 0, "misses": 0})
+
+
+class BulkRepresentationTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        artists = [
+            Person.objects.create(first_name="Tom", last_name=str(x)) for x in range(3)
+        ]
+        for artist in artists:
+            Album.objects.create(title="Rain Dogs", artist=artist)
+
+    def setUp(self):
+        cache.clear()
+        self.context = Context({"request": RequestFactory().get("/")})
+
+    def test_bulk_classes_are_registered(self):
+        self.assertIn(Album, bulk_representation_classes)
+        self.assertNotIn(Person, bulk_representation_classes)
+
+    def test_list_uses_bulk_hook(self):
+        albums = list(Album.objects.all())
+
+        with self.assertNumQueries(1):
+            out = encoders.json_dumps({"albums": albums}, self.context)
+
+        self.assertEqual(len(json.loads(out)["albums"]), 3)
+        self.assertEqual(json.loads(out)["albums"][0]["artist"]["first_name"], "Tom")
+
+    def test_queryset_uses_bulk_hook(self):
+        with self.assertNumQueries(2):
+            out = encoders.orjson_dumps({"albums": Album.objects.all()}, self.context)
+
+        self.assertEqual(len(json.loads(out)["albums"]), 3)
+
+    def test_props_without_bulk_lists_are_not_copied(self):
+        props = {"items": [{"id": 1}, {"id": 2}], "title": "Rain Dogs"}
+
+        resolved = representations.resolve_bulk_representations(props, self.context)
+
+        self.assertIs(resolved, props)
+
+    def test_only_containers_with_bulk_lists_are_copied(self):
+        albums = list(Album.objects.all())
+        config = {"locale": "sv"}
+        props = {"albums": albums, "config": config}
+
+        resolved = representations.resolve_bulk_representations(props, self.context)
+
+        self.assertIsNot(resolved, props)
+        self.assertIs(resolved["config"], config)
+        self.assertEqual(len(resolved["albums"]), 3)
+        self.assertIs(props["albums"], albums)
+
+    def test_mixed_lists_fall_back_to_per_object(self):
+        albums = list(Album.objects.all())
+        person = Person(first_name="Jim", last_name="Jarmusch")
+
+        with self.assertNumQueries(3):
+            out = encoders.json_dumps({"items": albums + [person]}, self.context)
+
+        self.assertEqual(len(json.loads(out)["items"]), 4)
+
+    def test_bulk_hook_is_only_called_for_uncached_objects(self):
+        albums = list(Album.objects.all())
+
+        with mock.patch.object(Album, "react_representation_cache_timeout", 60):
+            representations.get_representations(albums[:1], self.context)
+
+            with mock.patch.object(
+                Album,
+                "to_react_representations",
+                return_value=[{"title": "B"}, {"title": "C"}],
+            ) as mocked:
+                resp = representations.get_representations(albums, self.context)
+
+        self.assertEqual(mocked.call_args[0][0], albums[1:])
+        self.assertEqual(resp[0]["title"], "Rain Dogs")
+        self.assertEqual([x["title"] for x in resp[1:]], ["B", "C"])
+
+    def test_memo_is_used_for_cacheable_classes(self):
+        albums = list(Album.objects.all())
+
+        with mock.patch.object(Album, "react_representation_cacheable", True):
+            first = representations.get_representations(albums, self.context)
+
+            with self.assertNumQueries(0):
+                second = representations.get_representations(albums, self.context)
+
+        self.assertEqual(first, second)
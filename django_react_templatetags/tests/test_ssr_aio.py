@@ -0,0 +1,166 @@
+import asyncio
+import json
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import httpx
+from django.test import SimpleTestCase, modify_settings, override_settings
+from django.urls import reverse
+
+from django_react_templatetags.ssr import aio
+from django_react_templatetags.ssr import cache as ssr_cache
+from django_react_templatetags.ssr.aio import AsyncSSRService
+
+
+def mock_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def concurrent_handler(expected):
+    "Responds once all expected requests are in flight at the same time"
+
+    in_flight = []
+    all_sent = asyncio.Event()
+
+    async def handler(request):
+        in_flight.append(request)
+        if len(in_flight) == expected:
+            all_sent.set()
+
+        await asyncio.wait_for(all_sent.wait(), timeout=5)
+        name = json.loads(request.content)["componentName"]
+        return httpx.Response(200, text="<h1>{}</h1>".format(name))
+
+    return handler, in_flight
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/",
+)
+class AsyncSSRServiceTest(SimpleTestCase):
+    async def test_aload_many_renders_concurrently_in_order(self):
+        handler, in_flight = concurrent_handler(3)
+
+        with mock.patch.object(aio, "get_client", return_value=mock_client(handler)):
+            resp = await AsyncSSRService().aload_many(
+                [
+                    {"json": "{}", "name": "Header"},
+                    {"json": "{}", "name": "App"},
+                    {"json": "{}", "name": "Footer"},
+                ]
+            )
+
+        self.assertEqual(len(in_flight), 3)
+        self.assertEqual(
+            [x["html"] for x in resp],
+            ["<h1>Header</h1>", "<h1>App</h1>", "<h1>Footer</h1>"],
+        )
+
+    async def test_request_body_and_headers(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="Foo Bar")
+
+        with mock.patch.object(aio, "get_client", return_value=mock_client(handler)):
+            resp = await AsyncSSRService().aload_or_empty(
+                {"json": '{"title": "Night On Earth"}', "name": "App"},
+                headers={"Authorization": "Basic 123"},
+                ssr_context={"location": "/"},
+            )
+
+        self.assertEqual(resp, {"html": "Foo Bar", "params": {}})
+        self.assertEqual(requests[0].headers["Authorization"], "Basic 123")
+        self.assertEqual(
+            json.loads(requests[0].content),
+            {
+                "componentName": "App",
+                "props": {"title": "Night On Earth"},
+                "context": {"location": "/"},
+            },
+        )
+
+    async def test_failed_request_returns_empty_html(self):
+        def handler(request):
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        with mock.patch.object(aio, "get_client", return_value=mock_client(handler)):
+            with self.assertLogs("django_react_templatetags.ssr.aio", "ERROR"):
+                resp = await AsyncSSRService().aload_or_empty(
+                    {"json": "{}", "name": "App"}
+                )
+
+        self.assertEqual(resp, {"html": "", "params": {}})
+
+    @override_settings(REACT_SSR_CACHE_TIMEOUT=60)
+    async def test_cache_is_used_without_blocking_the_loop(self):
+        def handler(request):
+            return httpx.Response(200, text="Foo Bar")
+
+        cache = mock.Mock()
+        cache.aget = mock.AsyncMock(return_value=None)
+        cache.aset = mock.AsyncMock()
+
+        with mock.patch.object(
+            aio, "get_client", return_value=mock_client(handler)
+        ), mock.patch.object(ssr_cache, "get_cache", return_value=cache):
+            resp = await AsyncSSRService().aload_or_empty({"json": "{}", "name": "App"})
+
+        self.assertEqual(resp["html"], "Foo Bar")
+        self.assertEqual(cache.aget.call_count, 1)
+        self.assertEqual(cache.aset.call_count, 1)
+        self.assertEqual(cache.get.call_count, 0)
+        self.assertEqual(cache.set.call_count, 0)
+
+    @override_settings(REACT_SSR_CACHE_TIMEOUT=60)
+    async def test_cached_response_is_reused(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="Foo Bar")
+
+        await ssr_cache.get_cache().aclear()
+        with mock.patch.object(aio, "get_client", return_value=mock_client(handler)):
+            for x in range(2):
+                resp = await AsyncSSRService().aload_or_empty(
+                    {"json": "{}", "name": "App"}
+                )
+
+        self.assertEqual(resp["html"], "Foo Bar")
+        self.assertEqual(len(requests), 1)
+
+    async def test_client_is_reused_within_loop(self):
+        client = aio.get_client()
+
+        self.assertIs(client, aio.get_client())
+        await aio.close_client()
+        self.assertIsNot(client, aio.get_client())
+        await aio.close_client()
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/",
+    REACT_SSR_SERVICE="django_react_templatetags.ssr.aio.AsyncSSRService",
+)
+@modify_settings(
+    MIDDLEWARE={"append": "django_react_templatetags.middleware.ReactSSRMiddleware"}
+)
+class AsyncDeferredSSRTest(SimpleTestCase):
+    async def test_page_components_are_gathered(self):
+        handler, in_flight = concurrent_handler(3)
+
+        with mock.patch.object(aio, "get_client", return_value=mock_client(handler)):
+            resp = await self.async_client.get(reverse("multiple_react_view"))
+
+        out = resp.content.decode("utf-8")
+
+        self.assertEqual(len(in_flight), 3)
+        self.assertNotIn("<!--react-", out)
+        self.assertIn("<h1>Header</h1>", out)
+        self.assertIn("<h1>Footer</h1>", out)
+        self.assertIn("ReactDOM.hydrate(", out)
@@ -0,0 +1,181 @@
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import requests
+from django.template import Context, Template
+from django.test import SimpleTestCase, modify_settings, override_settings
+from django.urls import reverse
+
+from django_react_templatetags.ssr import breaker
+from django_react_templatetags.ssr.default import SSRService
+from django_react_templatetags.ssr.hypernova import HypernovaService
+
+from .mock_response import MockResponse
+
+
+@mock.patch("django_react_templatetags.ssr.breaker.time.monotonic")
+class CircuitBreakerTest(SimpleTestCase):
+    def test_opens_after_threshold(self, mocked_time):
+        mocked_time.return_value = 100
+        circuit = breaker.CircuitBreaker(failure_threshold=2, cooldown=30)
+
+        circuit.record_failure()
+        self.assertEqual(circuit.state, breaker.CLOSED)
+        self.assertTrue(circuit.allow_request())
+
+        circuit.record_failure()
+        self.assertEqual(circuit.state, breaker.OPEN)
+        self.assertFalse(circuit.allow_request())
+
+    def test_success_resets_failures(self, mocked_time):
+        mocked_time.return_value = 100
+        circuit = breaker.CircuitBreaker(failure_threshold=2, cooldown=30)
+
+        circuit.record_failure()
+        circuit.record_success()
+        circuit.record_failure()
+
+        self.assertEqual(circuit.state, breaker.CLOSED)
+
+    def test_half_open_allows_one_trial(self, mocked_time):
+        mocked_time.return_value = 100
+        circuit = breaker.CircuitBreaker(failure_threshold=1, cooldown=30)
+        circuit.record_failure()
+
+        mocked_time.return_value = 130
+        self.assertEqual(circuit.state, breaker.HALF_OPEN)
+        self.assertTrue(circuit.allow_request())
+        self.assertFalse(circuit.allow_request())
+
+        circuit.record_success()
+        self.assertEqual(circuit.state, breaker.CLOSED)
+
+    def test_failed_trial_opens_again(self, mocked_time):
+        mocked_time.return_value = 100
+        circuit = breaker.CircuitBreaker(failure_threshold=3, cooldown=30)
+        for _ in range(3):
+            circuit.record_failure()
+
+        mocked_time.return_value = 130
+        self.assertTrue(circuit.allow_request())
+        circuit.record_failure()
+
+        self.assertEqual(circuit.state, breaker.OPEN)
+        mocked_time.return_value = 159
+        self.assertFalse(circuit.allow_request())
+
+    def test_disabled_by_default(self, mocked_time):
+        self.assertIsNone(breaker.get_breaker())
+        self.assertEqual(breaker.get_state(), breaker.CLOSED)
+        self.assertTrue(breaker.allow_request())
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/",
+    REACT_SSR_BREAKER_THRESHOLD=2,
+    REACT_SSR_BREAKER_COOLDOWN=30,
+)
+class BreakerServiceTest(SimpleTestCase):
+    def setUp(self):
+        self.mocked_context = Context({"REACT_COMPONENTS": []})
+        breaker.record_success()
+
+    @mock.patch("requests.Session.post")
+    def test_open_breaker_skips_requests(self, mocked):
+        mocked.side_effect = requests.exceptions.ConnectTimeout()
+
+        service = SSRService()
+        with self.assertLogs("django_react_templatetags.ssr.default", "ERROR"):
+            service.load_or_empty({"json": "{}", "name": "App"})
+            service.load_or_empty({"json": "{}", "name": "App"})
+
+        resp = service.load_or_empty({"json": "{}", "name": "App"})
+
+        self.assertEqual(mocked.call_count, 2)
+        self.assertEqual(resp, {"html": "", "params": {}, "skipped": True})
+        self.assertEqual(breaker.get_state(), breaker.OPEN)
+
+    @override_settings(REACT_RENDER_HOST="http://react-service.dev/batch")
+    @mock.patch("requests.Session.post")
+    def test_breaker_is_shared_with_hypernova(self, mocked):
+        mocked.side_effect = requests.exceptions.ConnectTimeout()
+
+        with self.assertLogs("django_react_templatetags.ssr", "ERROR"):
+            SSRService().load_or_empty({"json": "{}", "name": "App"})
+            HypernovaService().load_or_empty({"json_obj": {}, "name": "App"})
+
+        resp = HypernovaService().load_or_empty({"json_obj": {}, "name": "App"})
+
+        self.assertEqual(mocked.call_count, 2)
+        self.assertEqual(resp["html"], "")
+        self.assertTrue(resp["skipped"])
+
+    @mock.patch("requests.Session.post")
+    def test_components_are_client_rendered_when_open(self, mocked):
+        mocked.side_effect = [
+            MockResponse("<h1>Header</h1>", 200),
+            requests.exceptions.ConnectTimeout(),
+            requests.exceptions.ConnectTimeout(),
+        ]
+
+        with self.assertLogs("django_react_templatetags.ssr.default", "ERROR"):
+            out = Template(
+                "{% load react %}"
+                '{% react_render component="Header" %}'
+                '{% react_render component="Menu" %}'
+                '{% react_render component="Menu" prop_open=1 %}'
+                '{% react_render component="Footer" %}'
+                "{% react_print %}"
+            ).render(self.mocked_context)
+
+        self.assertEqual(mocked.call_count, 3)
+        self.assertEqual(out.count("ReactDOM.hydrate("), 3)
+        self.assertEqual(out.count("ReactDOM.render("), 1)
+        self.assertRegex(out, r"ReactDOM.render\(\s+React.createElement\(Footer")
+
+    @mock.patch("django_react_templatetags.ssr.breaker.time.monotonic")
+    @mock.patch("requests.Session.post")
+    def test_components_refused_while_half_open_are_client_rendered(
+        self, mocked, mocked_time
+    ):
+        mocked_time.return_value = 100
+        breaker.record_failure()
+        breaker.record_failure()
+
+        mocked_time.return_value = 131
+        self.assertTrue(breaker.allow_request())
+        self.assertEqual(breaker.get_state(), breaker.HALF_OPEN)
+
+        out = Template(
+            "{% load react %}"
+            '{% react_render component="Footer" identifier="f" %}'
+            "{% react_print %}"
+        ).render(self.mocked_context)
+
+        self.assertEqual(mocked.call_count, 0)
+        self.assertIn('<div id="f"></div>', out)
+        self.assertIn("ReactDOM.render(", out)
+        self.assertNotIn("ReactDOM.hydrate(", out)
+
+    @modify_settings(
+        MIDDLEWARE={"append": "django_react_templatetags.middleware.ReactSSRMiddleware"}
+    )
+    @mock.patch("django_react_templatetags.ssr.breaker.time.monotonic")
+    @mock.patch("requests.Session.post")
+    def test_deferred_components_refused_while_half_open_are_client_rendered(
+        self, mocked, mocked_time
+    ):
+        mocked_time.return_value = 100
+        breaker.record_failure()
+        breaker.record_failure()
+
+        mocked_time.return_value = 131
+        self.assertTrue(breaker.allow_request())
+
+        out = self.client.get(reverse("multiple_react_view")).content.decode("utf-8")
+
+        self.assertEqual(mocked.call_count, 0)
+        self.assertNotIn("<!--react-", out)
+        self.assertEqual(out.count("ReactDOM.render("), 3)
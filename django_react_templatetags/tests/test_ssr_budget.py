@@ -0,0 +1,85 @@
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+from django.test.client import RequestFactory
+
+from django_react_templatetags.ssr.budget import PageBudget, get_page_budget
+
+from .mock_response import MockResponse
+
+
+class PageBudgetTest(SimpleTestCase):
+    @override_settings(REACT_SSR_PAGE_BUDGET_MS=None)
+    def test_disabled_by_default(self):
+        self.assertIsNone(get_page_budget(Context()))
+
+    @override_settings(REACT_SSR_PAGE_BUDGET_MS=100)
+    def test_budget_is_shared_per_request(self):
+        request = RequestFactory().get("/")
+
+        budget = get_page_budget(Context({"request": request}))
+        self.assertIs(budget, get_page_budget(Context({"request": request})))
+        self.assertIsNot(budget, get_page_budget(Context()))
+
+    @mock.patch("django_react_templatetags.ssr.budget.time.monotonic")
+    def test_tracked_time_is_spent(self, mocked_time):
+        budget = PageBudget(100)
+
+        mocked_time.side_effect = [10.0, 10.06]
+        with budget.track():
+            pass
+        self.assertFalse(budget.exhausted)
+
+        mocked_time.side_effect = [11.0, 11.05]
+        with budget.track():
+            pass
+        self.assertTrue(budget.exhausted)
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/",
+    REACT_SSR_PAGE_BUDGET_MS=100,
+)
+class PageBudgetTemplateTest(SimpleTestCase):
+    def setUp(self):
+        self.clock = 0.0
+
+    def slow_post(self, *args, **kwargs):
+        self.clock += 0.06
+        return MockResponse("<h1>Title</h1>", 200)
+
+    @mock.patch("django_react_templatetags.ssr.budget.time.monotonic")
+    @mock.patch("requests.Session.post")
+    def test_components_skip_ssr_after_budget(self, mocked, mocked_time):
+        mocked.side_effect = self.slow_post
+        mocked_time.side_effect = lambda: self.clock
+
+        out = Template(
+            "{% load react %}"
+            '{% react_render component="Header" %}'
+            '{% react_render component="Menu" %}'
+            '{% react_render component="Footer" %}'
+            "{% react_print %}"
+        ).render(Context({"REACT_COMPONENTS": []}))
+
+        self.assertEqual(mocked.call_count, 2)
+        self.assertEqual(out.count("<h1>Title</h1>"), 2)
+        self.assertEqual(out.count("ReactDOM.hydrate("), 2)
+        self.assertRegex(out, r"ReactDOM.render\(\s+React.createElement\(Footer")
+
+    @mock.patch("django_react_templatetags.ssr.budget.time.monotonic")
+    @mock.patch("requests.Session.post")
+    def test_budget_is_shared_between_templates_in_request(self, mocked, mocked_time):
+        mocked.side_effect = self.slow_post
+        mocked_time.side_effect = lambda: self.clock
+        request = RequestFactory().get("/")
+
+        template = Template("{% load react %}" '{% react_render component="Menu" %}')
+        for _ in range(3):
+            template.render(Context({"REACT_COMPONENTS": [], "request": request}))
+
+        self.assertEqual(mocked.call_count, 2)
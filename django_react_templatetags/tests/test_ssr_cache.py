@@ -0,0 +1,367 @@
+import sys
+import threading
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from django_react_templatetags.ssr import cache as ssr_cache
+from django_react_templatetags.ssr.default import SSRService
+from django_react_templatetags.ssr.hypernova import HypernovaService
+
+from .mock_response import MockResponse
+from .test_ssr_hypernova_service import mock_hypernova_success_response
+
+
+class SSRCacheKeyTest(SimpleTestCase):
+    def test_key_is_stable(self):
+        component = {"name": "App", "json": '{"a": 1}'}
+
+        self.assertEqual(
+            ssr_cache.get_key(component, {"b": 1, "a": 2}),
+            ssr_cache.get_key(dict(component), {"a": 2, "b": 1}),
+        )
+
+    def test_key_depends_on_name_props_and_context(self):
+        component = {"name": "App", "json": '{"a": 1}'}
+        key = ssr_cache.get_key(component)
+
+        self.assertNotEqual(key, ssr_cache.get_key({**component, "name": "Menu"}))
+        self.assertNotEqual(key, ssr_cache.get_key({**component, "json": "{}"}))
+        self.assertNotEqual(key, ssr_cache.get_key(component, {"a": 1}))
+
+    @override_settings(REACT_SSR_CACHE_TIMEOUT=60)
+    def test_component_timeout_overrides_setting(self):
+        self.assertEqual(ssr_cache.get_timeout({}), 60)
+        self.assertEqual(ssr_cache.get_timeout({"ssr_cache": 300}), 300)
+        self.assertIsNone(ssr_cache.get_timeout({"ssr_cache": 0}))
+
+
+class LocalCacheTest(SimpleTestCase):
+    def response(self, html):
+        return {"html": html, "params": {}}
+
+    def test_least_recently_used_entry_is_evicted(self):
+        size = sys.getsizeof("a" * 100)
+        local_cache = ssr_cache.LocalCache(size * 2)
+
+        local_cache.set("a", self.response("a" * 100), 60)
+        local_cache.set("b", self.response("b" * 100), 60)
+        local_cache.get("a")
+        local_cache.set("c", self.response("c" * 100), 60)
+
+        self.assertIsNotNone(local_cache.get("a"))
+        self.assertIsNone(local_cache.get("b"))
+        self.assertIsNotNone(local_cache.get("c"))
+
+        stats = local_cache.get_stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["bytes"], size * 2)
+
+    def test_entries_larger_than_budget_are_skipped(self):
+        local_cache = ssr_cache.LocalCache(10)
+        local_cache.set("a", self.response("a" * 100), 60)
+
+        self.assertIsNone(local_cache.get("a"))
+        self.assertEqual(local_cache.get_stats()["bytes"], 0)
+
+    @mock.patch("django_react_templatetags.ssr.cache.time.monotonic")
+    def test_expired_entries_are_removed(self, mocked):
+        mocked.return_value = 100
+        local_cache = ssr_cache.LocalCache(1000, timeout=10)
+        local_cache.set("a", self.response("a"), 60)
+
+        mocked.return_value = 109
+        self.assertIsNotNone(local_cache.get("a"))
+
+        mocked.return_value = 110
+        self.assertIsNone(local_cache.get("a"))
+        self.assertEqual(local_cache.get_stats()["entries"], 0)
+
+    def test_concurrent_access_keeps_size_in_budget(self):
+        local_cache = ssr_cache.LocalCache(sys.getsizeof("x" * 10) * 5)
+
+        def work(offset):
+            for i in range(200):
+                key = str((i + offset) % 20)
+                local_cache.set(key, self.response("x" * 10), 60)
+                local_cache.get(key)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = local_cache.get_stats()
+        self.assertLessEqual(stats["bytes"], local_cache.max_bytes)
+        self.assertEqual(stats["entries"], 5)
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/",
+    REACT_SSR_CACHE_TIMEOUT=60,
+)
+class DefaultServiceCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        ssr_cache.stats.reset()
+
+    @mock.patch("requests.Session.post")
+    def test_identical_components_are_rendered_once(self, mocked):
+        mocked.side_effect = [MockResponse("<h1>Title</h1>", 200)]
+
+        service = SSRService()
+        first = service.load_or_empty({"json": "{}", "name": "App"})
+        second = service.load_or_empty({"json": "{}", "name": "App"})
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(ssr_cache.get_stats(), {"hits": 1, "misses": 1, "stale": 0})
+
+    @mock.patch("requests.Session.post")
+    def test_failed_renders_are_not_cached(self, mocked):
+        mocked.side_effect = [MockResponse("", 200), MockResponse("Foo Bar", 200)]
+
+        service = SSRService()
+        service.load_or_empty({"json": "{}", "name": "App"})
+        resp = service.load_or_empty({"json": "{}", "name": "App"})
+
+        self.assertEqual(mocked.call_count, 2)
+        self.assertEqual(resp["html"], "Foo Bar")
+
+    @mock.patch("requests.Session.post")
+    def test_tag_can_opt_out_of_cache(self, mocked):
+        mocked.side_effect = [
+            MockResponse("<h1>Title</h1>", 200),
+            MockResponse("<h1>Title</h1>", 200),
+        ]
+
+        tpl = Template(
+            "{% load react %}" '{% react_render component="Component" ssr_cache=0 %}'
+        )
+        tpl.render(Context({"REACT_COMPONENTS": []}))
+        tpl.render(Context({"REACT_COMPONENTS": []}))
+
+        self.assertEqual(mocked.call_count, 2)
+
+    @override_settings(REACT_SSR_CACHE_TIMEOUT=None)
+    @mock.patch("requests.Session.post")
+    def test_tag_can_opt_in_to_cache(self, mocked):
+        mocked.side_effect = [MockResponse("<h1>Title</h1>", 200)]
+
+        tpl = Template(
+            "{% load react %}" '{% react_render component="Component" ssr_cache=300 %}'
+        )
+        tpl.render(Context({"REACT_COMPONENTS": []}))
+        out = tpl.render(Context({"REACT_COMPONENTS": []}))
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertIn("<h1>Title</h1>", out)
+
+    @override_settings(
+        REACT_SSR_CACHE_ALIAS=None,
+        REACT_SSR_LOCAL_CACHE_MAX_BYTES=1024,
+    )
+    @mock.patch("requests.Session.post")
+    def test_local_cache_is_checked_before_shared_cache(self, mocked):
+        mocked.side_effect = [MockResponse("<h1>Title</h1>", 200)]
+
+        service = SSRService()
+        service.load_or_empty({"json": "{}", "name": "App"})
+        resp = service.load_or_empty({"json": "{}", "name": "App"})
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(resp["html"], "<h1>Title</h1>")
+        self.assertEqual(ssr_cache.get_local_stats()["hits"], 1)
+        self.assertEqual(ssr_cache.get_stats(), {"hits": 0, "misses": 0, "stale": 0})
+
+    @override_settings(REACT_SSR_LOCAL_CACHE_MAX_BYTES=1024)
+    @mock.patch("requests.Session.post")
+    def test_shared_cache_hits_populate_local_cache(self, mocked):
+        ssr_cache.store(
+            {"json": "{}", "name": "App"},
+            None,
+            {"html": "<h1>Title</h1>", "params": {}},
+        )
+        ssr_cache.get_local_cache().clear()
+
+        service = SSRService()
+        service.load_or_empty({"json": "{}", "name": "App"})
+        service.load_or_empty({"json": "{}", "name": "App"})
+
+        self.assertEqual(mocked.call_count, 0)
+        self.assertEqual(ssr_cache.get_stats()["hits"], 1)
+        self.assertEqual(ssr_cache.get_local_stats()["hits"], 1)
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/batch",
+    REACT_SSR_CACHE_TIMEOUT=60,
+)
+class HypernovaServiceCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    @mock.patch("requests.Session.post")
+    def test_cached_html_gets_a_new_hypernova_id(self, mocked):
+        mocked.side_effect = [
+            MockResponse(mock_hypernova_success_response("Foo Bar", id="my-id"), 200)
+        ]
+
+        service = HypernovaService()
+        first = service.load_or_empty({"json_obj": {}, "name": "App"})
+        second = service.load_or_empty({"json_obj": {}, "name": "App"})
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(first["params"]["hypernova_id"], "my-id")
+        self.assertNotEqual(second["params"]["hypernova_id"], "my-id")
+        self.assertIn(second["params"]["hypernova_id"], second["html"])
+        self.assertNotIn("my-id", second["html"])
+
+    @mock.patch("requests.Session.post")
+    def test_only_missing_components_are_batched(self, mocked):
+        mocked.side_effect = [
+            MockResponse(mock_hypernova_success_response("Foo Bar"), 200),
+            MockResponse(
+                mock_hypernova_success_response("Menu", component_name="Menu"), 200
+            ),
+        ]
+
+        service = HypernovaService()
+        service.load_or_empty({"json_obj": {}, "name": "App"})
+        resp = service.load_many(
+            [{"json_obj": {}, "name": "App"}, {"json_obj": {}, "name": "Menu"}]
+        )
+
+        self.assertEqual(mocked.call_count, 2)
+        self.assertEqual(list(mocked.call_args[1]["json"].keys()), ["Menu"])
+        self.assertIn("Foo Bar", resp[0]["html"])
+        self.assertIn("Menu", resp[1]["html"])
+
+
+class ImmediateExecutor:
+    def submit(self, fn):
+        fn()
+
+
+class CollectingExecutor:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn):
+        self.submitted.append(fn)
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/",
+    REACT_SSR_CACHE_TIMEOUT=60,
+    REACT_SSR_CACHE_STALE_TIMEOUT=30,
+)
+@mock.patch("django_react_templatetags.ssr.cache.time.time")
+class StaleWhileRevalidateTest(SimpleTestCase):
+    component = {"json": "{}", "name": "App"}
+
+    def setUp(self):
+        cache.clear()
+        ssr_cache.stats.reset()
+        ssr_cache._refreshing.clear()
+
+    def store(self, html):
+        ssr_cache.store(self.component, None, {"html": html, "params": {}})
+
+    def test_fresh_entry_is_not_refreshed(self, mocked_time):
+        mocked_time.return_value = 1000
+        self.store("old")
+
+        refresh = mock.Mock()
+        mocked_time.return_value = 1059
+        resp = ssr_cache.lookup(self.component, refresh=refresh)
+
+        self.assertEqual(resp["html"], "old")
+        refresh.assert_not_called()
+
+    def test_stale_entry_is_served_and_refreshed(self, mocked_time):
+        mocked_time.return_value = 1000
+        self.store("old")
+
+        refresh = mock.Mock(return_value={"html": "new", "params": {}})
+        mocked_time.return_value = 1070
+        with mock.patch.object(
+            ssr_cache, "get_refresh_executor", return_value=ImmediateExecutor()
+        ):
+            resp = ssr_cache.lookup(self.component, refresh=refresh)
+
+        self.assertEqual(resp["html"], "old")
+        self.assertEqual(refresh.call_count, 1)
+        self.assertEqual(ssr_cache.lookup(self.component)["html"], "new")
+        self.assertEqual(ssr_cache.get_stats()["stale"], 1)
+
+    def test_entry_is_gone_after_grace_window(self, mocked_time):
+        mocked_time.return_value = 1000
+        self.store("old")
+
+        mocked_time.return_value = 1091
+        self.assertIsNone(ssr_cache.lookup(self.component, refresh=mock.Mock()))
+
+    def test_only_one_refresh_runs_per_key(self, mocked_time):
+        mocked_time.return_value = 1000
+        self.store("old")
+
+        failed_refresh = mock.Mock(return_value={"html": "", "params": {}})
+        executor = CollectingExecutor()
+        mocked_time.return_value = 1070
+        with mock.patch.object(
+            ssr_cache, "get_refresh_executor", return_value=executor
+        ):
+            ssr_cache.lookup(self.component, refresh=failed_refresh)
+            ssr_cache.lookup(self.component, refresh=failed_refresh)
+
+        self.assertEqual(len(executor.submitted), 1)
+
+        executor.submitted[0]()
+        with mock.patch.object(
+            ssr_cache, "get_refresh_executor", return_value=executor
+        ):
+            ssr_cache.lookup(self.component, refresh=mock.Mock())
+
+        self.assertEqual(len(executor.submitted), 2)
+
+    def test_refresh_is_skipped_when_another_worker_holds_lock(self, mocked_time):
+        mocked_time.return_value = 1000
+        self.store("old")
+        cache.add("{}:refresh".format(ssr_cache.get_key(self.component)), 1)
+
+        executor = CollectingExecutor()
+        mocked_time.return_value = 1070
+        with mock.patch.object(
+            ssr_cache, "get_refresh_executor", return_value=executor
+        ):
+            resp = ssr_cache.lookup(self.component, refresh=mock.Mock())
+
+        self.assertEqual(resp["html"], "old")
+        self.assertEqual(executor.submitted, [])
+
+    @mock.patch("requests.Session.post")
+    def test_service_refreshes_stale_entry(self, mocked, mocked_time):
+        mocked.side_effect = [MockResponse("old", 200), MockResponse("new", 200)]
+        mocked_time.return_value = 1000
+
+        service = SSRService()
+        service.load_or_empty(dict(self.component))
+
+        mocked_time.return_value = 1070
+        with mock.patch.object(
+            ssr_cache, "get_refresh_executor", return_value=ImmediateExecutor()
+        ):
+            resp = service.load_or_empty(dict(self.component))
+
+        self.assertEqual(resp["html"], "old")
+        self.assertEqual(mocked.call_count, 2)
+        self.assertEqual(service.load_or_empty(dict(self.component))["html"], "new")
@@ -1,4 +1,5 @@
 import json
+import threading
 
 try:
     from unittest import mock
@@ -9,6 +10,7 @@ from django.template import Context, Template
 from django.test import SimpleTestCase, override_settings
 from django.urls import reverse
 
+from django_react_templatetags.ssr import default
 from django_react_templatetags.ssr.default import SSRService
 from django_react_templatetags.tests.demosite.models import MovieWithContext, Person
 
@@ -22,7 +24,7 @@ class SSRTemplateTest(SimpleTestCase):
     def setUp(self):
         self.mocked_context = Context({"REACT_COMPONENTS": []})
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_verify_404(self, mocked):
         "The SSR rendering falls back to client side rendering if 404"
 
@@ -34,7 +36,7 @@ class SSRTemplateTest(SimpleTestCase):
 
         self.assertTrue('<div id="Component_' in out)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_that_only_html_resp_are_shown_in_template(self, mocked):
         mocked.side_effect = [MockResponse("<h1>Title</h1>", 200)]
 
@@ -44,7 +46,7 @@ class SSRTemplateTest(SimpleTestCase):
 
         self.assertFalse("{'html': " in out)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_verify_rendition(self, mocked):
         "The SSR returns inner html"
 
@@ -56,7 +58,7 @@ class SSRTemplateTest(SimpleTestCase):
 
         self.assertTrue("<h1>Title</h1>" in out)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_request_body(self, mocked):
         "The SSR request sends the props in a expected way"
 
@@ -83,7 +85,7 @@ class SSRTemplateTest(SimpleTestCase):
 
         self.assertEqual(json.loads(mocked.call_args[1]["data"]), request_body)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_request_body_context(self, mocked):
         "The SSR request sends the props in a expected way with context"
 
@@ -113,7 +115,7 @@ class SSRTemplateTest(SimpleTestCase):
 
         self.assertEqual(json.loads(mocked.call_args[1]["data"]), request_body)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_request_body_with_ssr_context(self, mocked):
         "The SSR request appends the 'ssr_context' in an expected way"
 
@@ -134,7 +136,7 @@ class SSRTemplateTest(SimpleTestCase):
 
         self.assertEqual(json.loads(mocked.call_args[1]["data"]), request_body)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_default_headers(self, mocked):
         "The SSR uses default headers with json as conten type"
         mocked.side_effect = [MockResponse("Foo Bar", 200)]
@@ -152,7 +154,7 @@ class SSRTemplateTest(SimpleTestCase):
         self.assertEqual(mocked.call_args[1]["headers"], headers)
 
     @override_settings(REACT_RENDER_HEADERS={"Authorization": "Basic 123"})
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_custom_headers(self, mocked):
         "The SSR uses custom headers if present"
         mocked.side_effect = [MockResponse("Foo Bar", 200)]
@@ -164,7 +166,7 @@ class SSRTemplateTest(SimpleTestCase):
         self.assertTrue(mocked.call_count == 1)
         self.assertEqual(mocked.call_args[1]["headers"]["Authorization"], "Basic 123")
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_hydrate_if_ssr_present(self, mocked):
         "Makes sure ReactDOM.hydrate is used when SSR is active"
         mocked.side_effect = [MockResponse("Foo Bar", 200)]
@@ -177,7 +179,7 @@ class SSRTemplateTest(SimpleTestCase):
 
         self.assertTrue("ReactDOM.hydrate(" in out)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_ssr_params_are_stored_in_component_queue(self, mocked):
         mocked.side_effect = [MockResponse("Foo Bar", 200)]
 
@@ -207,7 +209,7 @@ class SSRViewTest(SimpleTestCase):
     REACT_RENDER_HOST="http://react-service.dev/batch",
 )
 class DefaultServiceTest(SimpleTestCase):
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_load_or_empty_returns_ok_data(self, mocked):
         mocked.side_effect = [MockResponse("Foo Bar", 200)]
 
@@ -223,3 +225,61 @@ class DefaultServiceTest(SimpleTestCase):
         self.assertTrue("params" in resp)
         params = resp["params"]
         self.assertEqual(params, {})
+
+    @override_settings(REACT_SSR_MAX_WORKERS=3)
+    @mock.patch("requests.Session.post")
+    def test_load_many_renders_concurrently_in_order(self, mocked):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def post(url, data, **kwargs):
+            barrier.wait()
+            return MockResponse(json.loads(data)["componentName"], 200)
+
+        mocked.side_effect = post
+
+        service = SSRService()
+        resp = service.load_many(
+            [
+                {"json": "{}", "name": "Header"},
+                {"json": "{}", "name": "App"},
+                {"json": "{}", "name": "Footer"},
+            ]
+        )
+
+        self.assertEqual(mocked.call_count, 3)
+        self.assertEqual([x["html"] for x in resp], ["Header", "App", "Footer"])
+
+    @override_settings(REACT_SSR_MAX_WORKERS=2)
+    @mock.patch("requests.Session.post")
+    def test_load_many_shares_executor_between_pages(self, mocked):
+        mocked.side_effect = lambda url, data, **kwargs: MockResponse("Header", 200)
+        components = [{"json": "{}", "name": "Header"}] * 4
+
+        SSRService().load_many(components)
+        executor = default.get_executor()
+        SSRService().load_many(components)
+
+        self.assertIs(default.get_executor(), executor)
+        self.assertEqual(executor._max_workers, 2)
+
+    @mock.patch("requests.Session.post")
+    def test_load_many_is_sequential_by_default(self, mocked):
+        mocked.side_effect = [
+            MockResponse("Header", 200),
+            MockResponse("Footer", 200),
+        ]
+
+        service = SSRService()
+        resp = service.load_many(
+            [
+                {"json": "{}", "name": "Header"},
+                {"json": "{}", "name": "Footer"},
+            ],
+            ssr_contexts=[{"location": "/"}, None],
+        )
+
+        self.assertEqual([x["html"] for x in resp], ["Header", "Footer"])
+        self.assertEqual(
+            json.loads(mocked.call_args_list[0][1]["data"])["context"],
+            {"location": "/"},
+        )
@@ -0,0 +1,230 @@
+import gzip
+import hashlib
+import json
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import requests
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import SimpleTestCase, modify_settings, override_settings
+from django.urls import reverse
+
+from .mock_response import MockResponse
+from .test_ssr_hypernova_service import mock_hypernova_success_response
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/",
+)
+@modify_settings(
+    MIDDLEWARE={"append": "django_react_templatetags.middleware.ReactSSRMiddleware"}
+)
+class DeferredSSRTest(SimpleTestCase):
+    @mock.patch("requests.Session.post")
+    def test_markers_are_replaced_with_ssr_html(self, mocked):
+        mocked.side_effect = [
+            MockResponse("<h1>Header</h1>", 200),
+            MockResponse("<h1>Component</h1>", 200),
+            MockResponse("<h1>Footer</h1>", 200),
+        ]
+
+        resp = self.client.get(reverse("multiple_react_view"))
+        out = resp.content.decode("utf-8")
+
+        self.assertNotIn("<!--react-", out)
+        self.assertIn("<h1>Header</h1>", out)
+        self.assertIn("<h1>Component</h1>", out)
+        self.assertIn("<h1>Footer</h1>", out)
+        self.assertIn("ReactDOM.hydrate(", out)
+
+    @mock.patch("requests.Session.post")
+    def test_components_are_rendered_in_document_order(self, mocked):
+        mocked.side_effect = [
+            MockResponse("<h1>Header</h1>", 200),
+            MockResponse("<h1>Component</h1>", 200),
+            MockResponse("<h1>Footer</h1>", 200),
+        ]
+
+        resp = self.client.get(reverse("multiple_react_view"))
+        out = resp.content.decode("utf-8")
+
+        names = [
+            json.loads(call[1]["data"])["componentName"]
+            for call in mocked.call_args_list
+        ]
+        self.assertEqual(names, ["Header", "Component", "Footer"])
+        self.assertLess(out.index("Header</h1>"), out.index("Footer</h1>"))
+
+    @mock.patch("requests.Session.post")
+    def test_cached_page_contains_ssr_html(self, mocked):
+        mocked.side_effect = [
+            MockResponse("<h1>Header</h1>", 200),
+            MockResponse("<h1>Component</h1>", 200),
+            MockResponse("<h1>Footer</h1>", 200),
+        ]
+        self.addCleanup(cache.clear)
+
+        self.client.get(reverse("cached_react_view"))
+        resp = self.client.get(reverse("cached_react_view"))
+        out = resp.content.decode("utf-8")
+
+        self.assertEqual(mocked.call_count, 3)
+        self.assertNotIn("<!--react-", out)
+        self.assertIn("<h1>Header</h1>", out)
+        self.assertIn("<h1>Footer</h1>", out)
+        self.assertEqual(out.count("ReactDOM.hydrate("), 3)
+
+    @mock.patch("requests.Session.post")
+    def test_markers_are_replaced_before_inner_middleware(self, mocked):
+        mocked.return_value = MockResponse("<h1>Title</h1>", 200)
+
+        with modify_settings(
+            MIDDLEWARE={
+                "append": [
+                    "django.middleware.gzip.GZipMiddleware",
+                    "django.middleware.http.ConditionalGetMiddleware",
+                ]
+            }
+        ):
+            resp = self.client.get(
+                reverse("multiple_react_view"), HTTP_ACCEPT_ENCODING="gzip"
+            )
+
+        content = gzip.decompress(resp.content)
+        out = content.decode("utf-8")
+
+        self.assertEqual(resp["Content-Encoding"], "gzip")
+        self.assertNotIn("<!--react-", out)
+        self.assertIn("<h1>Title</h1>", out)
+        self.assertEqual(
+            resp["ETag"], 'W/"{}"'.format(hashlib.md5(content).hexdigest())
+        )
+
+    @mock.patch("requests.Session.post")
+    def test_disable_ssr_header_skips_queue(self, mocked):
+        resp = self.client.get(
+            reverse("multiple_react_view"),
+            HTTP_X_DISABLE_SSR="1",
+        )
+
+        self.assertEqual(mocked.call_count, 0)
+        self.assertIn("ReactDOM.render(", resp.content.decode("utf-8"))
+
+    @mock.patch("requests.Session.post")
+    def test_json_response_is_not_deferred(self, mocked):
+        mocked.return_value = MockResponse("<h1>Title</h1>", 200)
+
+        resp = self.client.get(reverse("json_react_view"))
+        html = json.loads(resp.content)["html"]
+
+        self.assertEqual(mocked.call_count, 3)
+        self.assertNotIn("<!--react-", html)
+        self.assertIn("<h1>Title</h1>", html)
+        self.assertIn("ReactDOM.hydrate(", html)
+
+    @mock.patch("requests.Session.post")
+    def test_streaming_response_is_not_deferred(self, mocked):
+        mocked.return_value = MockResponse("<h1>Title</h1>", 200)
+
+        resp = self.client.get(reverse("streaming_template_react_view"))
+        out = b"".join(resp.streaming_content).decode("utf-8")
+
+        self.assertNotIn("<!--react-", out)
+        self.assertIn("<h1>Title</h1>", out)
+        self.assertIn("ReactDOM.hydrate(", out)
+
+    @mock.patch("requests.Session.post")
+    def test_deferred_print_keeps_page_context(self, mocked):
+        mocked.return_value = MockResponse("<h1>Title</h1>", 200)
+        loaders = [
+            (
+                "django.template.loaders.locmem.Loader",
+                {
+                    "react_print.html": "print:{{ props.artist }}:{{ components|length }}"
+                },
+            ),
+            "django.template.loaders.app_directories.Loader",
+        ]
+
+        with override_settings(
+            TEMPLATES=[
+                {
+                    "BACKEND": "django.template.backends.django.DjangoTemplates",
+                    "OPTIONS": {
+                        "loaders": loaders,
+                        "context_processors": [
+                            "django.template.context_processors.request"
+                        ],
+                    },
+                }
+            ]
+        ):
+            resp = self.client.get(reverse("multiple_react_view"))
+
+        self.assertIn("print:Tom Waits:3", resp.content.decode("utf-8"))
+
+    @mock.patch("requests.Session.post")
+    def test_render_without_middleware_request_is_not_deferred(self, mocked):
+        mocked.side_effect = [MockResponse("<h1>Title</h1>", 200)]
+
+        out = Template(
+            "{% load react %}" '{% react_render component="Component" %}'
+        ).render(Context({"REACT_COMPONENTS": []}))
+
+        self.assertIn("<h1>Title</h1>", out)
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/batch",
+    REACT_SSR_SERVICE="django_react_templatetags.ssr.hypernova.HypernovaService",
+)
+@modify_settings(
+    MIDDLEWARE={"append": "django_react_templatetags.middleware.ReactSSRMiddleware"}
+)
+class DeferredHypernovaTest(SimpleTestCase):
+    @mock.patch("requests.Session.post")
+    def test_page_is_rendered_in_one_batch_request(self, mocked):
+        results = {}
+        for name in ["Header", "Component", "Footer"]:
+            key = name
+            results.update(
+                mock_hypernova_success_response(
+                    "<h1>{}</h1>".format(name),
+                    component_name=key,
+                    id="id-{}".format(name),
+                    key=name,
+                )["results"]
+            )
+
+        mocked.side_effect = [
+            MockResponse({"success": True, "error": None, "results": results}, 200)
+        ]
+
+        resp = self.client.get(reverse("multiple_react_view"))
+        out = resp.content.decode("utf-8")
+
+        self.assertEqual(mocked.call_count, 1)
+        jobs = mocked.call_args[1]["json"]
+        self.assertEqual(
+            [job["name"] for job in jobs.values()], ["Header", "Component", "Footer"]
+        )
+        self.assertEqual(jobs["Header"]["data"]["artist"], "Tom Waits")
+
+        self.assertNotIn("<!--react-", out)
+        self.assertIn("<h1>Footer</h1>", out)
+        self.assertIn('div[data-hypernova-id="id-Header"]', out)
+
+    @mock.patch("requests.Session.post")
+    def test_failed_batch_falls_back_to_empty_html(self, mocked):
+        mocked.side_effect = requests.exceptions.ConnectionError()
+
+        with self.assertLogs("django_react_templatetags.ssr.hypernova", "ERROR"):
+            resp = self.client.get(reverse("multiple_react_view"))
+
+        out = resp.content.decode("utf-8")
+        self.assertNotIn("<!--react-", out)
+        self.assertIn('<div id="Component_', out)
@@ -22,7 +22,7 @@ class HypernovaTemplateTest(SimpleTestCase):
     def setUp(self):
         self.mocked_context = Context({"REACT_COMPONENTS": []})
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_verify_404(self, mocked):
         "The SSR rendering falls back to client side rendering if 404"
 
@@ -34,11 +34,13 @@ class HypernovaTemplateTest(SimpleTestCase):
 
         self.assertTrue('<div id="Component_' in out)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_that_only_html_resp_are_shown_in_template(self, mocked):
         mocked.side_effect = [
             MockResponse(
-                mock_hypernova_success_response("<h1>Title</h1>"),
+                mock_hypernova_success_response(
+                    "<h1>Title</h1>", component_name="Component"
+                ),
                 200,
             )
         ]
@@ -49,13 +51,15 @@ class HypernovaTemplateTest(SimpleTestCase):
 
         self.assertFalse("{'html': " in out)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_verify_rendition(self, mocked):
         "The SSR returns inner html"
 
         mocked.side_effect = [
             MockResponse(
-                mock_hypernova_success_response("<h1>Title</h1>"),
+                mock_hypernova_success_response(
+                    "<h1>Title</h1>", component_name="Component"
+                ),
                 200,
             )
         ]
@@ -66,13 +70,15 @@ class HypernovaTemplateTest(SimpleTestCase):
 
         self.assertTrue("<h1>Title</h1>" in out)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_request_body(self, mocked):
         "The SSR request sends the props in a expected way"
 
         mocked.side_effect = [
             MockResponse(
-                mock_hypernova_success_response("<h1>Title</h1>"),
+                mock_hypernova_success_response(
+                    "<h1>Title</h1>", component_name="Component"
+                ),
                 200,
             )
         ]
@@ -94,13 +100,15 @@ class HypernovaTemplateTest(SimpleTestCase):
         self.assertTrue("Component" in mocked.call_args[1]["json"])
         self.assertEqual(mocked.call_args[1]["json"]["Component"]["data"], request_body)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_request_body_context(self, mocked):
         "The SSR request sends the props in a expected way with context"
 
         mocked.side_effect = [
             MockResponse(
-                mock_hypernova_success_response("<h1>Title</h1>"),
+                mock_hypernova_success_response(
+                    "<h1>Title</h1>", component_name="Component"
+                ),
                 200,
             )
         ]
@@ -126,12 +134,12 @@ class HypernovaTemplateTest(SimpleTestCase):
         self.assertTrue("Component" in mocked.call_args[1]["json"])
         self.assertEqual(mocked.call_args[1]["json"]["Component"]["data"], request_body)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_default_headers(self, mocked):
         "The SSR uses default headers with json as conten type"
         mocked.side_effect = [
             MockResponse(
-                mock_hypernova_success_response("Foo Bar"),
+                mock_hypernova_success_response("Foo Bar", component_name="Component"),
                 200,
             )
         ]
@@ -149,12 +157,12 @@ class HypernovaTemplateTest(SimpleTestCase):
         self.assertEqual(mocked.call_args[1]["headers"], headers)
 
     @override_settings(REACT_RENDER_HEADERS={"Authorization": "Basic 123"})
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_custom_headers(self, mocked):
         "The SSR uses custom headers if present"
         mocked.side_effect = [
             MockResponse(
-                mock_hypernova_success_response("Foo Bar"),
+                mock_hypernova_success_response("Foo Bar", component_name="Component"),
                 200,
             )
         ]
@@ -166,11 +174,11 @@ class HypernovaTemplateTest(SimpleTestCase):
         self.assertTrue(mocked.call_count == 1)
         self.assertEqual(mocked.call_args[1]["headers"]["Authorization"], "Basic 123")
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_ssr_params_are_stored_in_component_queue(self, mocked):
         mocked.side_effect = [
             MockResponse(
-                mock_hypernova_success_response("Foo Bar"),
+                mock_hypernova_success_response("Foo Bar", component_name="Component"),
                 200,
             )
         ]
@@ -186,11 +194,11 @@ class HypernovaTemplateTest(SimpleTestCase):
         self.assertIn("hypernova_id", ssr_params)
         self.assertIn("hypernova_key", ssr_params)
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_only_ssr_html_are_returned_on_no_placeholder(self, mocked):
         mocked.side_effect = [
             MockResponse(
-                mock_hypernova_success_response("Foo Bar"),
+                mock_hypernova_success_response("Foo Bar", component_name="Component"),
                 200,
             )
         ]
@@ -210,7 +218,7 @@ class HypernovaTemplateTest(SimpleTestCase):
     REACT_SSR_SERVICE="django_react_templatetags.ssr.hypernova.HypernovaService",
 )
 class HypernovaServiceTest(SimpleTestCase):
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_load_or_empty_returns_ok_data(self, mocked):
         mocked.side_effect = [
             MockResponse(
@@ -235,7 +243,7 @@ class HypernovaServiceTest(SimpleTestCase):
         self.assertTrue("hypernova_key" in params)
         self.assertEqual(params["hypernova_key"], "App")
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_ssr_context_are_passed_to_hypernova_as_prop(self, mocked):
         mocked.side_effect = [
             MockResponse(
@@ -259,7 +267,7 @@ class HypernovaServiceTest(SimpleTestCase):
         self.assertIn("language", post_data["App"]["data"]["context"])
         self.assertEqual(post_data["App"]["data"]["context"]["language"], "en")
 
-    @mock.patch("requests.post")
+    @mock.patch("requests.Session.post")
     def test_empty_html_are_returned_on_request_error(self, mocked):
         logging.disable(logging.CRITICAL)
 
@@ -0,0 +1,35 @@
+from django.test import SimpleTestCase, override_settings
+
+from django_react_templatetags.ssr import session
+
+
+class SessionTest(SimpleTestCase):
+    def tearDown(self):
+        session.close_session()
+
+    def test_session_is_reused(self):
+        self.assertIs(session.get_session(), session.get_session())
+
+    def test_closed_session_is_recreated(self):
+        first = session.get_session()
+        session.close_session()
+
+        self.assertIsNot(first, session.get_session())
+
+    @override_settings(
+        REACT_SSR_POOL_CONNECTIONS=2,
+        REACT_SSR_POOL_MAXSIZE=25,
+        REACT_SSR_MAX_RETRIES=3,
+    )
+    def test_pool_settings_are_applied(self):
+        adapter = session.get_session().get_adapter("http://react-service.dev/")
+
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 25)
+        self.assertEqual(adapter.max_retries.total, 3)
+
+    def test_changed_pool_settings_resets_session(self):
+        first = session.get_session()
+
+        with override_settings(REACT_SSR_POOL_MAXSIZE=25):
+            self.assertIsNot(first, session.get_session())
@@ -0,0 +1,136 @@
+import threading
+import time
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import requests
+from django.test import SimpleTestCase, override_settings
+
+from django_react_templatetags.ssr.default import SSRService
+from django_react_templatetags.ssr.singleflight import SingleFlight
+
+from .mock_response import MockResponse
+
+
+def wait_for_followers():
+    "Gives the other threads time to join the call in flight"
+    time.sleep(0.1)
+
+
+def run_concurrently(fn, count):
+    results = [None] * count
+
+    def run(index):
+        results[index] = fn()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+
+    return threads, results
+
+
+class SingleFlightTest(SimpleTestCase):
+    def test_concurrent_calls_share_result(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        fn = mock.Mock(side_effect=lambda: release.wait(5) and "html")
+
+        threads, results = run_concurrently(lambda: flight.do("key", fn), 5)
+        wait_for_followers()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(fn.call_count, 1)
+        self.assertEqual([result for result, _ in results], ["html"] * 5)
+        self.assertEqual(sorted(shared for _, shared in results), [False] + [True] * 4)
+        self.assertEqual(flight.calls, {})
+
+    def test_errors_are_raised_for_all_callers(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def fail():
+            started.set()
+            release.wait(5)
+            raise ValueError("render failed")
+
+        def call():
+            try:
+                flight.do("key", fail)
+            except ValueError as e:
+                errors.append(e)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait(5)
+
+        follower = threading.Thread(target=call)
+        follower.start()
+        wait_for_followers()
+        release.set()
+        leader.join()
+        follower.join()
+
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(flight.calls, {})
+
+    def test_sequential_calls_are_not_shared(self):
+        flight = SingleFlight()
+        fn = mock.Mock(return_value="html")
+
+        flight.do("key", fn)
+        self.assertEqual(flight.do("key", fn), ("html", False))
+        self.assertEqual(fn.call_count, 2)
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev/",
+)
+class SSRServiceCoalescingTest(SimpleTestCase):
+    def concurrent_load(self, mocked, side_effect, count=5):
+        release = threading.Event()
+
+        def post(*args, **kwargs):
+            release.wait(5)
+            return side_effect()
+
+        mocked.side_effect = post
+
+        service = SSRService()
+        threads, results = run_concurrently(
+            lambda: service.load_or_empty({"json": "{}", "name": "App"}), count
+        )
+        wait_for_followers()
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        return results
+
+    @mock.patch("requests.Session.post")
+    def test_identical_renders_are_sent_once(self, mocked):
+        results = self.concurrent_load(
+            mocked, lambda: MockResponse("<h1>Title</h1>", 200)
+        )
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual([x["html"] for x in results], ["<h1>Title</h1>"] * 5)
+        self.assertEqual(len({id(x) for x in results}), 5)
+
+    @mock.patch("requests.Session.post")
+    def test_failed_render_falls_back_to_empty_for_all(self, mocked):
+        def fail():
+            raise requests.exceptions.ConnectionError()
+
+        with self.assertLogs("django_react_templatetags.ssr.default", "ERROR"):
+            results = self.concurrent_load(mocked, fail)
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual([x["html"] for x in results], [""] * 5)
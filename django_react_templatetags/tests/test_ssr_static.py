@@ -0,0 +1,144 @@
+import json
+import os
+import subprocess
+import sys
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+from django.test.client import RequestFactory
+
+from django_react_templatetags.ssr import static as ssr_static
+from django_react_templatetags.tests.mock_response import MockResponse
+
+
+def rendered_names(mocked):
+    return [
+        json.loads(call[1]["data"])["componentName"] for call in mocked.call_args_list
+    ]
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev",
+    REACT_SSR_STATIC=True,
+    REACT_SSR_VERSION="1",
+)
+class StaticSSRTest(SimpleTestCase):
+    def setUp(self):
+        ssr_static.clear()
+
+    def render(self, tag):
+        return Template("{% load react %}" + tag).render(
+            Context({"request": RequestFactory().get("/"), "title": "Sale"})
+        )
+
+    @mock.patch("requests.Session.post")
+    def test_static_tag_is_rendered_once(self, mocked):
+        mocked.return_value = MockResponse("<h1>Sale</h1>", 200)
+
+        first = self.render('{% react_render component="Banner" prop_title="Sale" %}')
+        second = self.render('{% react_render component="Banner" prop_title="Sale" %}')
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertIn("<h1>Sale</h1>", first)
+        self.assertIn("<h1>Sale</h1>", second)
+
+    @mock.patch("requests.Session.post")
+    def test_tags_with_variables_are_not_static(self, mocked):
+        mocked.return_value = MockResponse("<h1>Sale</h1>", 200)
+
+        self.render('{% react_render component="Banner" prop_title=title %}')
+        self.render('{% react_render component="Banner" prop_title=title %}')
+
+        self.assertEqual(mocked.call_count, 2)
+
+    @mock.patch("requests.Session.post")
+    def test_version_change_renders_again(self, mocked):
+        mocked.return_value = MockResponse("<h1>Sale</h1>", 200)
+
+        self.render('{% react_render component="Banner" prop_title="Sale" %}')
+        with self.settings(REACT_SSR_VERSION="2"):
+            self.render('{% react_render component="Banner" prop_title="Sale" %}')
+
+        self.assertEqual(mocked.call_count, 2)
+
+    @mock.patch("requests.Session.post")
+    def test_failed_render_is_not_stored(self, mocked):
+        mocked.side_effect = [
+            MockResponse("", 200),
+            MockResponse("<h1>Sale</h1>", 200),
+        ]
+
+        self.render('{% react_render component="Banner" prop_title="Sale" %}')
+        out = self.render('{% react_render component="Banner" prop_title="Sale" %}')
+
+        self.assertIn("<h1>Sale</h1>", out)
+
+    @mock.patch("requests.Session.post")
+    def test_ssr_cache_zero_opts_out(self, mocked):
+        mocked.return_value = MockResponse("<h1>Sale</h1>", 200)
+
+        tag = '{% react_render component="Banner" prop_title="Sale" ssr_cache=0 %}'
+        self.render(tag)
+        self.render(tag)
+
+        self.assertEqual(mocked.call_count, 2)
+
+    @override_settings(REACT_SSR_STATIC=False)
+    @mock.patch("requests.Session.post")
+    def test_disabled_by_default(self, mocked):
+        mocked.return_value = MockResponse("<h1>Sale</h1>", 200)
+
+        self.render('{% react_render component="Banner" prop_title="Sale" %}')
+        self.render('{% react_render component="Banner" prop_title="Sale" %}')
+
+        self.assertEqual(mocked.call_count, 2)
+
+    @mock.patch("requests.Session.post")
+    def test_warm_up_renders_static_tags(self, mocked):
+        mocked.return_value = MockResponse("<h1>Sale</h1>", 200)
+
+        rendered = ssr_static.warm_up(["static-ssr.html"])
+
+        self.assertEqual(rendered, 1)
+        self.assertEqual(rendered_names(mocked), ["Banner"])
+
+        mocked.reset_mock()
+        self.render('{% react_render component="Banner" prop_title="Sale" %}')
+        self.assertEqual(mocked.call_count, 0)
+
+
+IMPORT_WITHOUT_TRANSPORTS = """
+import sys
+
+sys.modules.update(requests=None, urllib3=None, httpx=None)
+
+import django
+
+django.setup()
+
+from django.template import Context, Template
+
+Template("{% load react %}{% react_render component='Banner' %}").render(
+    Context({"REACT_COMPONENTS": []})
+)
+"""
+
+
+class TagLibraryImportTest(SimpleTestCase):
+    def test_tag_library_does_not_need_ssr_transports(self):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        env = dict(os.environ, PYTHONPATH=root)
+
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_WITHOUT_TRANSPORTS],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
@@ -0,0 +1,99 @@
+import json
+import time
+
+import requests
+from django.test import SimpleTestCase, override_settings
+
+from django_react_templatetags.components import ReactComponent
+from django_react_templatetags.ssr import breaker
+from django_react_templatetags.ssr.default import SSRService
+from django_react_templatetags.ssr.hypernova import HypernovaService
+from django_react_templatetags.ssr.stub import StubRenderServer, uniform
+
+
+def get_component(name="App", **props):
+    return ReactComponent(
+        identifier=name,
+        data_identifier="{}_data".format(name),
+        name=name,
+        json=json.dumps(props),
+    )
+
+
+class StubRenderServerTest(SimpleTestCase):
+    def setUp(self):
+        self.server = StubRenderServer(seed=1).start()
+        self.addCleanup(self.server.stop)
+
+        settings = override_settings(REACT_RENDER_HOST=self.server.url)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def test_hastur_request(self):
+        resp = SSRService().load_or_empty(get_component("App", title="Rain Dogs"))
+
+        self.assertEqual(resp["html"], '<div data-component="App"></div>')
+        self.assertEqual(self.server.stats.as_dict()["requests"], 1)
+
+    def test_streamed_hastur_request(self):
+        component = get_component("App")
+        component.stream_props({"items": list(range(50000))}, None)
+
+        resp = SSRService().load_or_empty(component)
+
+        self.assertEqual(resp["html"], '<div data-component="App"></div>')
+
+    def test_hypernova_batch(self):
+        resp = HypernovaService().load_many(
+            [get_component("Header"), get_component("Footer")]
+        )
+
+        self.assertIn('data-hypernova-key="Header"', resp[0]["html"])
+        self.assertEqual(resp[1]["params"]["hypernova_key"], "Footer")
+        self.assertIsNotNone(resp[1]["params"]["hypernova_id"])
+        self.assertEqual(
+            self.server.stats.as_dict(),
+            {"requests": 1, "components": 2, "errors": 0, "timeouts": 0},
+        )
+
+    def test_response_size(self):
+        self.server.configure(response_size=10000)
+
+        resp = SSRService().load_or_empty(get_component())
+
+        self.assertEqual(len(resp["html"]), 10000)
+
+    def test_latency(self):
+        self.server.configure(latency=uniform(0.05, 0.06))
+
+        start = time.monotonic()
+        SSRService().load_or_empty(get_component())
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_errors(self):
+        self.server.configure(error_rate=1)
+
+        resp = HypernovaService().load_many([get_component()])
+        self.assertEqual(resp[0]["html"], "")
+
+        response = requests.post(self.server.url, json={"componentName": "App"})
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.server.stats.as_dict()["errors"], 2)
+
+    @override_settings(REACT_RENDER_TIMEOUT=0.05, REACT_SSR_BREAKER_THRESHOLD=1)
+    def test_timeouts_open_the_breaker(self):
+        self.server.configure(timeout_rate=1, timeout=5)
+
+        with self.assertLogs("django_react_templatetags.ssr.default", "ERROR"):
+            resp = SSRService().load_or_empty(get_component())
+
+        self.assertEqual(resp["html"], "")
+        self.assertTrue(breaker.is_open())
+
+        SSRService().load_or_empty(get_component())
+        self.assertEqual(self.server.stats.as_dict()["timeouts"], 1)
+
+    def test_unknown_option(self):
+        with self.assertRaises(TypeError):
+            self.server.configure(delay=1)
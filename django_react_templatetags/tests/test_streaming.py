@@ -0,0 +1,161 @@
+import json
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.template import Context, Template
+from django.test import SimpleTestCase, modify_settings, override_settings
+from django.test.client import RequestFactory
+from django.urls import reverse
+
+from django_react_templatetags import components, streaming
+from django_react_templatetags.components import ReactComponent
+from django_react_templatetags.ssr import cache as ssr_cache
+from django_react_templatetags.tests.mock_response import MockResponse
+
+
+def get_catalog(size=1000):
+    return {"items": [{"id": x, "name": "<Item {}>".format(x)} for x in range(size)]}
+
+
+class StreamPropsTest(SimpleTestCase):
+    def setUp(self):
+        self.context = Context({"catalog": get_catalog()})
+
+    def render(self, stream_props):
+        return Template(
+            "{% load react %}"
+            '{% react_render component="Catalog" identifier="catalog" '
+            "props=catalog stream_props=" + stream_props + " %}"
+            "{% react_print %}"
+        ).render(self.context)
+
+    def test_output_matches_regular_props(self):
+        self.assertEqual(self.render("1"), self.render("0"))
+
+    def test_props_are_not_serialized_until_read(self):
+        Template(
+            "{% load react %}"
+            '{% react_render component="Catalog" props=catalog stream_props=1 %}'
+        ).render(self.context)
+
+        component = self.context["REACT_COMPONENTS"][0]
+        self.assertTrue(component.streaming)
+        self.assertNotIn("json", component)
+        self.assertEqual(component["json_obj"], get_catalog())
+
+    def test_props_are_yielded_in_chunks(self):
+        component = ReactComponent(name="Catalog")
+        component.stream_props(get_catalog(), self.context)
+
+        with mock.patch.object(components, "CHUNK_SIZE", 1024):
+            chunks = list(component.iter_json())
+
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) < 2048 for chunk in chunks))
+        self.assertEqual(json.loads("".join(chunks)), get_catalog())
+
+    def test_cache_key_matches_regular_props(self):
+        streamed = ReactComponent(name="Catalog")
+        streamed.stream_props(get_catalog(), self.context)
+        regular = ReactComponent(name="Catalog", json=json.dumps(get_catalog()))
+
+        self.assertEqual(ssr_cache.get_key(streamed), ssr_cache.get_key(regular))
+
+
+@override_settings(REACT_RENDER_HOST="http://react-service.dev")
+class StreamPropsSSRTest(SimpleTestCase):
+    @mock.patch("requests.Session.post")
+    def test_request_body_is_streamed(self, mocked):
+        bodies = []
+
+        def post(url, data=None, **kwargs):
+            bodies.append(b"".join(data))
+            return MockResponse("<ul></ul>", 200)
+
+        mocked.side_effect = post
+
+        out = Template(
+            "{% load react %}"
+            '{% react_render component="Catalog" props=catalog stream_props=1 %}'
+        ).render(
+            Context({"catalog": get_catalog(), "request": RequestFactory().get("/")})
+        )
+
+        self.assertIn("<ul></ul>", out)
+        self.assertEqual(
+            json.loads(bodies[0]),
+            {"componentName": "Catalog", "props": get_catalog(), "context": {}},
+        )
+
+    def count_serializations(self):
+        template = Template(
+            "{% load react %}"
+            '{% react_render component="Catalog" props=catalog stream_props=1 %}'
+            "{% react_print %}"
+        )
+        context = Context(
+            {"catalog": get_catalog(), "request": RequestFactory().get("/")}
+        )
+
+        with mock.patch.object(
+            components, "iter_json", wraps=components.iter_json
+        ) as mocked:
+            template.render(context)
+
+        return mocked.call_count
+
+    @staticmethod
+    def post(url, data=None, **kwargs):
+        b"".join(data)
+        return MockResponse("<ul></ul>", 200)
+
+    @mock.patch("requests.Session.post")
+    def test_uncached_props_are_not_hashed(self, mocked):
+        mocked.side_effect = self.post
+
+        self.assertEqual(self.count_serializations(), 2)
+
+    @override_settings(REACT_SSR_CACHE_TIMEOUT=60)
+    @mock.patch("requests.Session.post")
+    def test_cached_props_are_hashed_once(self, mocked):
+        mocked.side_effect = self.post
+        ssr_cache.get_cache().clear()
+
+        self.assertEqual(self.count_serializations(), 3)
+
+
+class StreamTemplateTest(SimpleTestCase):
+    def test_unknown_markers_are_left_unchanged(self):
+        marker = "<!--react-props:{}-->".format("0" * 32)
+
+        out = "".join(streaming.iter_content("<p>{}</p>".format(marker), {}))
+
+        self.assertEqual(out, "<p>{}</p>".format(marker))
+
+    def test_streaming_response(self):
+        resp = self.client.get(reverse("streaming_react_view"))
+
+        out = b"".join(resp.streaming_content).decode("utf-8")
+
+        self.assertTrue(resp.streaming)
+        self.assertNotIn("<!--react-", out)
+        self.assertIn('"name": "\\u003CItem 999\\u003E"', out)
+        self.assertIn('{"artist": "Tom Waits"}', out)
+
+    @override_settings(REACT_RENDER_HOST="http://react-service.dev")
+    @modify_settings(
+        MIDDLEWARE={"append": "django_react_templatetags.middleware.ReactSSRMiddleware"}
+    )
+    @mock.patch("requests.Session.post")
+    def test_deferred_ssr_is_resolved(self, mocked):
+        mocked.return_value = MockResponse("<footer></footer>", 200)
+
+        resp = self.client.get(reverse("streaming_react_view"))
+
+        out = b"".join(resp.streaming_content).decode("utf-8")
+        self.assertIn("<footer></footer>", out)
+        self.assertNotIn("<!--react-", out)
+        self.assertIn("ReactDOM.hydrate(", out)
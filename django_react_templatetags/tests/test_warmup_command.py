@@ -0,0 +1,103 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from django_react_templatetags.tests.mock_response import MockResponse
+
+
+def rendered_names(mocked):
+    return sorted(
+        json.loads(call[1]["data"])["componentName"] for call in mocked.call_args_list
+    )
+
+
+@override_settings(
+    REACT_RENDER_HOST="http://react-service.dev",
+    REACT_SSR_CACHE_TIMEOUT=60,
+)
+class WarmupCommandTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def write_manifest(self, manifest):
+        fd, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f)
+
+        self.addCleanup(os.remove, path)
+        return path
+
+    def call(self, *args, **kwargs):
+        out = StringIO()
+        call_command("react_ssr_warmup", *args, stdout=out, stderr=StringIO(), **kwargs)
+        return out.getvalue()
+
+    @mock.patch("requests.Session.post")
+    def test_manifest_components_fill_the_cache(self, mocked):
+        mocked.return_value = MockResponse("<h1>Sale</h1>", 200)
+        path = self.write_manifest(
+            {
+                "components": [
+                    {"component": "Banner", "props": {"title": "Sale"}},
+                    {"component": "Menu", "props": {}, "ssr_context": {"a": 1}},
+                ]
+            }
+        )
+
+        out = self.call("--manifest", path, "--concurrency", "2")
+
+        self.assertEqual(rendered_names(mocked), ["Banner", "Menu"])
+        self.assertIn("OK component Banner", out)
+        self.assertIn("Warmed up 2 of 2", out)
+
+        mocked.reset_mock()
+        html = Template(
+            '{% load react %}{% react_render component="Banner" prop_title="Sale" %}'
+        ).render(Context())
+
+        self.assertFalse(mocked.called)
+        self.assertIn("<h1>Sale</h1>", html)
+
+    @mock.patch("requests.Session.post")
+    def test_failed_renders_are_reported(self, mocked):
+        mocked.return_value = MockResponse("", 200)
+        path = self.write_manifest({"components": [{"component": "Banner"}]})
+
+        out = self.call("--manifest", path)
+
+        self.assertIn("FAILED component Banner", out)
+        self.assertIn("Warmed up 0 of 1", out)
+
+    @mock.patch("requests.Session.post")
+    def test_urls_are_crawled(self, mocked):
+        mocked.return_value = MockResponse("<h1>Title</h1>", 200)
+
+        out = self.call("--url", "/multiple-react-view", "--url", "/missing")
+
+        self.assertEqual(mocked.call_count, 3)
+        self.assertIn("OK /multiple-react-view", out)
+        self.assertIn("FAILED /missing", out)
+        self.assertIn("Warmed up 1 of 2", out)
+
+    def test_nothing_to_warm_up(self):
+        with self.assertRaises(CommandError):
+            self.call()
+
+    def test_invalid_manifest(self):
+        path = self.write_manifest({})
+        with open(path, "w") as f:
+            f.write("{")
+
+        with self.assertRaises(CommandError):
+            self.call("--manifest", path)
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from django_react_templatetags import views
+
+app_name = "react"
+
+urlpatterns = [
+    path("props/<str:digest>.json", views.props_view, name="props"),
+]
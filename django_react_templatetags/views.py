@@ -0,0 +1,25 @@
+from django.http import Http404, HttpResponse
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import etag, require_safe
+
+from django_react_templatetags import props
+
+# Props urls contain a hash of the content, so they never change
+MAX_AGE = 60 * 60 * 24 * 365
+
+
+@require_safe
+@etag(lambda request, digest: digest)
+def props_view(request, digest):
+    """
+    Serves props stored by react_render for components rendered with
+    props_url.
+    """
+
+    json_str = props.load(digest)
+    if json_str is None:
+        raise Http404("Props not found")
+
+    response = HttpResponse(json_str, content_type="application/json")
+    patch_cache_control(response, public=True, max_age=MAX_AGE, immutable=True)
+    return response
@@ -1,4 +1,5 @@
 import argparse
+import json
 import os
 import sys
 
@@ -10,11 +11,52 @@ os.environ[
 
 
 def runtests():
-    args, rest = argparse.ArgumentParser().parse_known_args()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--bench", action="store_true", help="Run the benchmarks instead of tests"
+    )
+    parser.add_argument("--bench-filter", help="Only run benchmarks matching this")
+    parser.add_argument("--bench-output", help="Write the results to this json file")
+    parser.add_argument(
+        "--bench-compare", help="Compare the results with this json file"
+    )
+    parser.add_argument(
+        "--bench-latency",
+        type=float,
+        default=5,
+        help="Latency of the stub SSR server in milliseconds",
+    )
+    args, rest = parser.parse_known_args()
+
+    if args.bench:
+        sys.exit(runbenchmarks(args))
 
     argv = [sys.argv[0], "test"] + rest
     execute_from_command_line(argv)
 
 
+def runbenchmarks(args):
+    import django
+
+    django.setup()
+
+    from django_react_templatetags.tests import benchmarks
+
+    results = benchmarks.run(args.bench_filter, latency=args.bench_latency / 1000)
+
+    if args.bench_output:
+        with open(args.bench_output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.bench_compare:
+        with open(args.bench_compare) as f:
+            regressions = benchmarks.compare(results, json.load(f))
+
+        if regressions:
+            return 1
+
+    return 0
+
+
 if __name__ == "__main__":
     runtests()
@@ -33,11 +33,15 @@ setup(
     ],
     extras_require={
         "ssr": ["requests"],
-        "hypernova": ["hypernova"],
+        "hypernova": ["requests"],
+        "async": ["httpx"],
+        "orjson": ["orjson"],
     },
     tests_require=[
         "Django>=3.2",
         "requests",
+        "httpx",
+        "orjson",
     ],
     license="MIT",
     zip_safe=False,